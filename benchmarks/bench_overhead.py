@@ -0,0 +1,93 @@
+"""
+Benchmark of the success path overhead of the `retry` decorator.
+
+Measures the cost in nanoseconds per call of a bare function against the same function
+decorated with `retry` in a few common configurations, when the first attempt succeeds.
+
+Usage:
+    python benchmarks/bench_overhead.py [--number N] [--repeat R] [--max-overhead NS]
+
+With `--max-overhead` the script exits with a non zero status if the overhead of any
+configuration over the bare function exceeds the given number of nanoseconds per call,
+so it can be used to catch regressions in the decorator's hot path.
+"""
+import argparse
+import os
+import sys
+import timeit
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retry_reloaded import retry  # noqa: E402
+
+
+def _noop_callback():
+    pass
+
+
+def _bare():
+    return None
+
+
+def _build_cases() -> Dict[str, Callable]:
+    """
+    Build the functions to benchmark, keyed by a description of their configuration.
+
+    Returns:
+        Dict[str, Callable]: Functions to benchmark.
+    """
+    return {
+        "bare function": _bare,
+        "retry()": retry()(_bare),
+        "retry(max_retries=3)": retry(max_retries=3)(_bare),
+        "retry(timeout=10)": retry(timeout=10)(_bare),
+        "retry(deadline=10)": retry(deadline=10)(_bare),
+        "retry(callbacks)": retry(
+            retry_callback=_noop_callback,
+            successful_retry_callback=_noop_callback,
+            failure_callback=_noop_callback,
+        )(_bare),
+    }
+
+
+def _measure(func: Callable, number: int, repeat: int) -> float:
+    """
+    Measure the best time per call of a function.
+
+    Args:
+        func (Callable): Function to measure.
+        number (int): Number of calls per measurement.
+        repeat (int): Number of measurements, the best one is kept.
+
+    Returns:
+        float: Nanoseconds per call.
+    """
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200_000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case, the best one is kept")
+    parser.add_argument("--max-overhead", type=float, default=None,
+                        help="fail if the overhead over the bare function exceeds this many ns per call")
+    args = parser.parse_args()
+
+    results = {name: _measure(func, args.number, args.repeat) for name, func in _build_cases().items()}
+    baseline = results["bare function"]
+
+    print(f"{'case':<28}{'ns/call':>12}{'overhead':>12}")
+    failed = False
+    for name, ns_per_call in results.items():
+        overhead = ns_per_call - baseline
+        print(f"{name:<28}{ns_per_call:>12.1f}{overhead:>12.1f}")
+        if args.max_overhead is not None and overhead > args.max_overhead:
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,55 @@
 from .retry import retry
-from .callback import CallbackFactory, callback_factory
+from .hedge import hedge
+from .batch import retry_batch
+from .map import retry_map
+from .budget import RetryBudget
+from .circuit import CircuitBreaker
+from ._state import RetryState
+from .callback import CallbackFactory, CallbackDispatcher, callback_factory
 from .backoff import (
     FixedBackOff,
     LinearBackOff,
     ExponentialBackOff,
     RandomUniformBackOff,
+    FullJitterBackOff,
+    EqualJitterBackOff,
+    DecorrelatedJitterBackOff,
 )
 from ._exceptions import (
     MaxRetriesException,
     RetriesTimeoutException,
-    RetriesDeadlineException
+    RetriesDeadlineException,
+    AttemptTimeoutException,
+    RetryBudgetExhaustedException,
+    CircuitOpenException,
+    RetriesStoppedException,
+    PartialFailureException,
 )
 
 __all__ = [
     "retry",
+    "hedge",
+    "retry_batch",
+    "retry_map",
     "MaxRetriesException",
     "RetriesTimeoutException",
     "RetriesDeadlineException",
+    "AttemptTimeoutException",
+    "RetryBudgetExhaustedException",
+    "RetryBudget",
+    "CircuitOpenException",
+    "CircuitBreaker",
+    "RetriesStoppedException",
+    "PartialFailureException",
     "CallbackFactory",
     "callback_factory",
+    "RetryState",
+    "CallbackDispatcher",
     "FixedBackOff",
     "LinearBackOff",
     "ExponentialBackOff",
     "RandomUniformBackOff",
+    "FullJitterBackOff",
+    "EqualJitterBackOff",
+    "DecorrelatedJitterBackOff",
 ]
@@ -0,0 +1,112 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, wait
+from threading import Thread
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class _AttemptExpired(Exception):
+    """
+    Raised when an attempt does not complete within its time limit.
+    """
+
+
+def _submit_daemon(f: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Future:
+    """
+    Run a function call in a new daemon thread, within a copy of the current context.
+
+    A dedicated thread is used so that an attempt which never completes cannot exhaust a shared
+    pool, and a daemon one so that it does not keep the interpreter alive.
+
+    Args:
+        f (Callable): Function to call.
+        args (Tuple): Positional arguments of the call.
+        kwargs (Dict[str, Any]): Keyword arguments of the call.
+
+    Returns:
+        Future: Future holding the outcome of the call.
+    """
+    future = Future()
+    context = contextvars.copy_context()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = context.run(f, *args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    Thread(target=run, name=f"retry-{getattr(f, '__name__', 'attempt')}", daemon=True).start()
+    return future
+
+
+def _call_with_timeout(f: Callable, args: Tuple, kwargs: Dict[str, Any], timeout: float) -> Any:
+    """
+    Call a function, giving up on it if it does not complete within a time limit.
+
+    Python threads cannot be interrupted, so an expired call is abandoned: it keeps running in its
+    daemon thread and its outcome is discarded, while control returns to the caller.
+
+    Args:
+        f (Callable): Function to call.
+        args (Tuple): Positional arguments of the call.
+        kwargs (Dict[str, Any]): Keyword arguments of the call.
+        timeout (float): Time limit in seconds.
+
+    Returns:
+        Any: The result of the call.
+
+    Raises:
+        _AttemptExpired: If the call did not complete in time.
+        Exception: Any exception raised by the call.
+    """
+    future = _submit_daemon(f, args, kwargs)
+    done, _ = wait((future,), timeout=timeout)
+    if not done:
+        raise _AttemptExpired()
+    return future.result()
+
+
+def _consume_outcome(task: "asyncio.Future") -> None:
+    """
+    Retrieve the outcome of an abandoned task so that its exception is not reported as unhandled.
+
+    Args:
+        task (asyncio.Future): The abandoned task.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+async def _await_with_timeout(awaitable: Awaitable, timeout: float) -> Any:
+    """
+    Await an awaitable, cancelling it if it does not complete within a time limit.
+
+    Control returns to the caller as soon as the limit is reached, without waiting for the
+    cancelled task to finish its cleanup.
+
+    Args:
+        awaitable (Awaitable): Awaitable to await.
+        timeout (float): Time limit in seconds.
+
+    Returns:
+        Any: The result of the awaitable.
+
+    Raises:
+        _AttemptExpired: If the awaitable did not complete in time.
+        Exception: Any exception raised by the awaitable.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait((task,), timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if not done:
+        task.cancel()
+        task.add_done_callback(_consume_outcome)
+        raise _AttemptExpired()
+    return task.result()
@@ -0,0 +1,28 @@
+from time import perf_counter
+from typing import Callable
+
+Clock = Callable[[], float]
+"""
+A clock is a zero-argument callable returning the current time in fractional seconds.
+Only differences between two readings of the same clock are meaningful.
+"""
+
+monotonic_clock: Clock = perf_counter
+"""
+Default clock for elapsed time accounting: monotonic and of the highest available resolution,
+so timeouts and deadlines are unaffected by system clock updates.
+"""
+
+
+def _elapsed_since(clock: Clock, start_time: float) -> float:
+    """
+    Compute the time elapsed since a reading of a clock.
+
+    Args:
+        clock (Clock): The clock `start_time` was read from.
+        start_time (float): An earlier reading of `clock`.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    return clock() - start_time
@@ -1,5 +1,4 @@
-import logging
-from typing import Callable, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 MAX_RETRIES_MESSAGE_TEMPLATE = (
     "Have reached max number of retries ({max_retries}) for function {fname}, aborting."
@@ -10,29 +9,68 @@ TIMEOUT_MESSAGE_TEMPLATE = (
 DEADLINE_MESSAGE_TEMPLATE = (
     "Have been retrying function {fname} for {elapsed_time} secs. Exceeded deadline of {deadline} secs, aborting."
 )
+BUDGET_EXHAUSTED_MESSAGE_TEMPLATE = (
+    "Retry budget exhausted while retrying function {fname}, aborting."
+)
+CIRCUIT_OPEN_MESSAGE_TEMPLATE = (
+    "Circuit breaker is open for function {fname}, aborting."
+)
+STOPPED_MESSAGE_TEMPLATE = (
+    "Stop condition met for function {fname} after {attempts} attempts, aborting."
+)
+ATTEMPT_TIMEOUT_MESSAGE_TEMPLATE = (
+    "Attempt of function {fname} did not complete within {attempt_timeout} secs, abandoning it."
+)
+PARTIAL_FAILURE_MESSAGE_TEMPLATE = (
+    "{failed} of {total} items of function {fname} failed."
+)
+TIMEOUT_AHEAD_MESSAGE_TEMPLATE = (
+    "Have been retrying function {fname} for {elapsed_time} secs. Next retry in {delay} secs "
+    "would exceed timeout of {timeout} secs, aborting."
+)
+DEADLINE_AHEAD_MESSAGE_TEMPLATE = (
+    "Have been retrying function {fname} for {elapsed_time} secs. Next retry in {delay} secs "
+    "would exceed deadline of {deadline} secs, aborting."
+)
 
 
 class BaseRetryException(Exception):
     """
     Base class for retry-related exceptions.
 
+    Retry exceptions are plain carriers of the failure context: constructing one has no side effects,
+    logging and the failure callback are handled by the retry wrapper raising it. They are pickled
+    by their structured fields, so they cross process boundaries, e.g. from process pool workers,
+    with their context intact. The last exception must be picklable itself for that.
+
+    The elapsed time includes the first attempt when the retry operation reads the clock before it, i.e.
+    with a timeout, a deadline, `pass_retry_state` or `stop`. Otherwise it is counted from the first
+    failure, sparing the clock read on calls succeeding at once.
+
     Args:
-        logger (logging.Logger): Logger object to use for logging the exception message.
         message (str): Message describing the exception.
-        failure_callback (Optional[Callable]): Callback function to execute upon raising the exception.
+        fname (Optional[str]): Name of the function that failed.
+        attempts (Optional[int]): Number of attempts made.
+        elapsed (Optional[float]): Time elapsed during the retry operation in seconds.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
     """
 
     def __init__(
         self,
-        logger: logging.Logger,
         message: str,
-        failure_callback: Optional[Callable] = None
+        fname: Optional[str] = None,
+        attempts: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        last_exception: Optional[BaseException] = None
     ) -> None:
         super().__init__(message)
-        if logger:
-            logger.error(message)
-        if failure_callback:
-            failure_callback()
+        self.fname = fname
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.last_exception = last_exception
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.args[0], self.fname, self.attempts, self.elapsed, self.last_exception)
 
 
 class MaxRetriesException(BaseRetryException):
@@ -40,23 +78,29 @@ class MaxRetriesException(BaseRetryException):
     Exception raised when the maximum number of retries is reached.
 
     Args:
-        logger (logging.Logger): Logger object to use for logging the exception message.
         fname (str): Name of the function for which maximum retries were reached.
-        failure_callback (Optional[Callable]): Callback function to execute upon raising the exception.
         max_retries (int): Maximum number of retries that have been attempted.
+        attempts (Optional[int]): Number of attempts made.
+        elapsed (Optional[float]): Time elapsed during the retry operation in seconds.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
     """
 
     def __init__(
         self,
-        logger: logging.Logger,
         fname: str,
         max_retries: int,
-        failure_callback: Optional[Callable] = None
+        attempts: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        last_exception: Optional[BaseException] = None
     ) -> None:
         message = MAX_RETRIES_MESSAGE_TEMPLATE.format(
             fname=fname, max_retries=max_retries
         )
-        super().__init__(logger, message, failure_callback)
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+        self.max_retries = max_retries
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.max_retries, self.attempts, self.elapsed, self.last_exception)
 
 
 class RetriesTimeoutException(BaseRetryException):
@@ -64,25 +108,36 @@ class RetriesTimeoutException(BaseRetryException):
     Exception raised when retry operation exceeds the timeout.
 
     Args:
-        logger (logging.Logger): Logger object to use for logging the exception message.
         fname (str): Name of the function for which retry operation exceeded timeout.
-        failure_callback (Optional[Callable]): Callback function to execute upon raising the exception.
-        elapsed_time (float): Time elapsed during the retry operation in seconds.
+        elapsed (float): Time elapsed during the retry operation in seconds, as measured by its clock.
         timeout (float): Timeout value in seconds.
+        delay (Optional[float]): Delay of the next retry, if the operation was aborted ahead of a retry
+            that would start after the timeout.
+        attempts (Optional[int]): Number of attempts made.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
     """
 
     def __init__(
         self,
-        logger: logging.Logger,
         fname: str,
-        elapsed_time: float,
+        elapsed: float,
         timeout: float,
-        failure_callback: Optional[Callable] = None
+        delay: Optional[float] = None,
+        attempts: Optional[int] = None,
+        last_exception: Optional[BaseException] = None
     ) -> None:
-        message = TIMEOUT_MESSAGE_TEMPLATE.format(
-            fname=fname, elapsed_time=elapsed_time, timeout=timeout
+        template = TIMEOUT_MESSAGE_TEMPLATE if delay is None else TIMEOUT_AHEAD_MESSAGE_TEMPLATE
+        message = template.format(
+            fname=fname, elapsed_time=elapsed, timeout=timeout, delay=delay
+        )
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+        self.timeout = timeout
+        self.delay = delay
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (
+            self.fname, self.elapsed, self.timeout, self.delay, self.attempts, self.last_exception
         )
-        super().__init__(logger, message, failure_callback)
 
 
 class RetriesDeadlineException(BaseRetryException):
@@ -90,22 +145,167 @@ class RetriesDeadlineException(BaseRetryException):
     Exception raised when retry operation exceeds the deadline.
 
     Args:
-        logger (logging.Logger): Logger object to use for logging the exception message.
         fname (str): Name of the function for which retry operation exceeded deadline.
-        failure_callback (Optional[Callable]): Callback function to execute upon raising the exception.
-        elapsed_time (float): Time elapsed during the retry operation in seconds.
+        elapsed (float): Time elapsed during the retry operation in seconds, as measured by its clock.
         deadline (float): Deadline value in seconds.
+        delay (Optional[float]): Delay of the next retry, if the operation was aborted ahead of a retry
+            that would start after the deadline.
+        attempts (Optional[int]): Number of attempts made.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
     """
 
     def __init__(
         self,
-        logger: logging.Logger,
         fname: str,
-        elapsed_time: float,
+        elapsed: float,
         deadline: float,
-        failure_callback: Optional[Callable] = None,
+        delay: Optional[float] = None,
+        attempts: Optional[int] = None,
+        last_exception: Optional[BaseException] = None
+    ) -> None:
+        template = DEADLINE_MESSAGE_TEMPLATE if delay is None else DEADLINE_AHEAD_MESSAGE_TEMPLATE
+        message = template.format(
+            fname=fname, elapsed_time=elapsed, deadline=deadline, delay=delay
+        )
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+        self.deadline = deadline
+        self.delay = delay
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (
+            self.fname, self.elapsed, self.deadline, self.delay, self.attempts, self.last_exception
+        )
+
+
+class RetryBudgetExhaustedException(BaseRetryException):
+    """
+    Exception raised when a retry is refused by an exhausted retry budget.
+
+    Args:
+        fname (str): Name of the function whose retry was refused.
+        attempts (Optional[int]): Number of attempts made.
+        elapsed (Optional[float]): Time elapsed during the retry operation in seconds.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
+    """
+
+    def __init__(
+        self,
+        fname: str,
+        attempts: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        last_exception: Optional[BaseException] = None
+    ) -> None:
+        message = BUDGET_EXHAUSTED_MESSAGE_TEMPLATE.format(fname=fname)
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.attempts, self.elapsed, self.last_exception)
+
+
+class CircuitOpenException(BaseRetryException):
+    """
+    Exception raised when a call is short-circuited by an open circuit breaker.
+
+    Args:
+        fname (str): Name of the function whose call was short-circuited.
+        attempts (Optional[int]): Number of attempts made.
+        elapsed (Optional[float]): Time elapsed during the retry operation in seconds.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
+    """
+
+    def __init__(
+        self,
+        fname: str,
+        attempts: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        last_exception: Optional[BaseException] = None
     ) -> None:
-        message = DEADLINE_MESSAGE_TEMPLATE.format(
-            fname=fname, elapsed_time=elapsed_time, deadline=deadline
+        message = CIRCUIT_OPEN_MESSAGE_TEMPLATE.format(fname=fname)
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.attempts, self.elapsed, self.last_exception)
+
+
+class RetriesStoppedException(BaseRetryException):
+    """
+    Exception raised when the stop predicate gives up the retry operation.
+
+    Args:
+        fname (str): Name of the function whose retry operation was stopped.
+        attempts (Optional[int]): Number of attempts made.
+        elapsed (Optional[float]): Time elapsed during the retry operation in seconds.
+        last_exception (Optional[BaseException]): The exception raised by the last failed attempt, if any.
+    """
+
+    def __init__(
+        self,
+        fname: str,
+        attempts: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        last_exception: Optional[BaseException] = None
+    ) -> None:
+        message = STOPPED_MESSAGE_TEMPLATE.format(fname=fname, attempts=attempts)
+        super().__init__(message, fname, attempts, elapsed, last_exception)
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.attempts, self.elapsed, self.last_exception)
+
+
+class AttemptTimeoutException(Exception):
+    """
+    Exception raised when a single attempt does not complete within the attempt timeout.
+
+    It is a retryable failure: the abandoned attempt counts as a failed one and is retried
+    according to the retry configuration.
+
+    Args:
+        fname (str): Name of the function whose attempt timed out.
+        attempt_timeout (float): Attempt timeout value in seconds.
+    """
+
+    def __init__(self, fname: str, attempt_timeout: float) -> None:
+        message = ATTEMPT_TIMEOUT_MESSAGE_TEMPLATE.format(
+            fname=fname, attempt_timeout=attempt_timeout
         )
-        super().__init__(logger, message, failure_callback)
+        super().__init__(message)
+        self.fname = fname
+        self.attempt_timeout = attempt_timeout
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.attempt_timeout)
+
+
+class PartialFailureException(Exception):
+    """
+    Exception raised when some items of a batch failed.
+
+    It is a retryable failure for `retry_batch`, retrying only the failed items. It is the last exception
+    of the retry exception raised once retries are exhausted, and is raised itself if items failed with
+    exceptions that are not retried.
+
+    Args:
+        fname (str): Name of the function called with the batch.
+        results (List[Any]): The outcome of every item of the batch, in order, with the exception of
+            each failed item in place of its result.
+    """
+
+    def __init__(self, fname: str, results: List[Any]) -> None:
+        failed = sum(isinstance(result, BaseException) for result in results)
+        message = PARTIAL_FAILURE_MESSAGE_TEMPLATE.format(fname=fname, failed=failed, total=len(results))
+        super().__init__(message)
+        self.fname = fname
+        self.results = results
+
+    @property
+    def failures(self) -> Dict[int, BaseException]:
+        """
+        Get the exceptions of the failed items.
+
+        Returns:
+            Dict[int, BaseException]: The exception of each failed item by its index in the batch.
+        """
+        return {index: result for index, result in enumerate(self.results) if isinstance(result, BaseException)}
+
+    def __reduce__(self) -> Tuple:
+        return self.__class__, (self.fname, self.results)
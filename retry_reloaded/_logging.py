@@ -1,6 +1,7 @@
 from typing import Optional
-from time import time
 import logging
+from ._clock import Clock, monotonic_clock, _elapsed_since
+from ._exceptions import BaseRetryException
 
 
 def _init_logger(name: str) -> logging.Logger:
@@ -26,6 +27,14 @@ def _init_logger(name: str) -> logging.Logger:
     return _retry_logger
 
 
+_RETRY_MESSAGE_TEMPLATES = {
+    (False, False): "Will retry function %s. Next retry in %s secs.",
+    (True, False): "Will retry function %s. Remaining retries: %s. Next retry in %s secs.",
+    (False, True): "Will retry function %s. Remaining time: %s secs. Next retry in %s secs.",
+    (True, True): "Will retry function %s. Remaining retries: %s. Remaining time: %s secs. Next retry in %s secs.",
+}
+
+
 def _log_retry(
     logger: Optional[logging.Logger],
     fname: str,
@@ -35,11 +44,16 @@ def _log_retry(
     deadline: Optional[float],
     start_time: float,
     delay: float,
-    exc_info: Optional[Exception] = None
+    exc_info: Optional[Exception] = None,
+    clock: Clock = monotonic_clock,
+    structured: bool = False
 ) -> None:
     """
     Log retry information.
 
+    Nothing is computed unless the logger is enabled for warnings, and formatting of the
+    message is left to the logging framework, happening only if a handler emits the record.
+
     Args:
         logger (Optional[logging.Logger]): Logger object to use for logging. If None, logging is skipped.
         fname (str): Name of the function being retried.
@@ -47,35 +61,75 @@ def _log_retry(
         retries (int): Number of retries attempted so far.
         timeout (Optional[float]): Timeout value for the retry operation in seconds.
         deadline (Optional[float]): Deadline for the retry operation in seconds.
-        start_time (float): Start time of the retry operation.
+        start_time (float): Start time of the retry operation, as read from `clock`.
         delay (float): Delay until the next retry in seconds.
         exc_info (Optional[Exception]): Information about the exception that triggered the retry.
+        clock (Clock): Clock used to measure the elapsed time. Defaults to a monotonic clock.
+        structured (bool): Whether to attach the retry information to the log record as the `retry_fname`,
+            `retry_attempt`, `retry_remaining_retries`, `retry_remaining_time` and `retry_delay` attributes,
+            for handlers to consume without parsing the message. Defaults to False.
 
     Returns:
         None
     """
-    if not logger:
+    if not logger or not logger.isEnabledFor(logging.WARNING):
         return
 
-    base_message = "Will retry function {fname}."
-    remaining_retries_message = "Remaining retries: {remaining_retries}."
-    remaining_time_message = "Remaining time: {remaining_time} secs."
-    next_delay_message = "Next retry in {delay} secs."
-
-    messages = [base_message.format(fname=fname)]
+    args = [fname]
 
+    remaining_retries = None
     if max_retries is not None:
-        messages.append(
-            remaining_retries_message.format(remaining_retries=max_retries - retries)
-        )
+        remaining_retries = max_retries - retries
+        args.append(remaining_retries)
 
+    remaining_time = None
     if timeout or deadline:
-        min_timeout = min([t for t in (timeout, deadline) if t is not None])
-        elapsed_time = time() - start_time
-        messages.append(
-            remaining_time_message.format(remaining_time=min_timeout - elapsed_time)
-        )
+        min_timeout = min(t for t in (timeout, deadline) if t)
+        remaining_time = min_timeout - _elapsed_since(clock, start_time)
+        args.append(remaining_time)
+
+    args.append(delay)
+
+    extra = None
+    if structured:
+        extra = {
+            "retry_fname": fname,
+            "retry_attempt": retries + 1,
+            "retry_remaining_retries": remaining_retries,
+            "retry_remaining_time": remaining_time,
+            "retry_delay": delay,
+        }
+
+    template = _RETRY_MESSAGE_TEMPLATES[remaining_retries is not None, remaining_time is not None]
+    logger.warning(template, *args, exc_info=exc_info, extra=extra)
+
+
+def _log_failure(
+    logger: Optional[logging.Logger],
+    error: BaseRetryException,
+    structured: bool = False
+) -> None:
+    """
+    Log the eventual failure of a retry operation.
+
+    Args:
+        logger (Optional[logging.Logger]): Logger object to use for logging. If None, logging is skipped.
+        error (BaseRetryException): The exception the retry operation fails with.
+        structured (bool): Whether to attach the failure context to the log record as the `retry_fname`,
+            `retry_attempts` and `retry_elapsed` attributes. Defaults to False.
+
+    Returns:
+        None
+    """
+    if not logger or not logger.isEnabledFor(logging.ERROR):
+        return
 
-    messages.append(next_delay_message.format(delay=delay))
+    extra = None
+    if structured:
+        extra = {
+            "retry_fname": error.fname,
+            "retry_attempts": error.attempts,
+            "retry_elapsed": error.elapsed,
+        }
 
-    logger.warning(" ".join(messages), exc_info=exc_info)
+    logger.error("%s", error, extra=extra)
@@ -0,0 +1,820 @@
+import asyncio
+import inspect
+import logging
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterator, NoReturn, Optional, Set, Tuple, Type, Union
+from ._attempt import _AttemptExpired, _call_with_timeout, _await_with_timeout
+from ._clock import Clock
+from ._logging import _log_failure, _log_retry
+from ._state import RetryState
+from .callback import _is_coroutine_callback
+from .backoff import BackOff
+from .budget import RetryBudget
+from .circuit import CircuitBreaker
+from ._exceptions import (
+    BaseRetryException,
+    AttemptTimeoutException,
+    RetryBudgetExhaustedException,
+    CircuitOpenException,
+    MaxRetriesException,
+    RetriesTimeoutException,
+    RetriesDeadlineException,
+    RetriesStoppedException,
+)
+
+_MAX_CACHED_SCHEDULE = 1024
+
+
+class _ResultRetriesExhausted(BaseException):
+    """
+    Signal that a retry operation gave up on an attempt retried on its result, with `reraise_exception` set.
+
+    The wrappers catch it to return the last result instead, as there is no exception to re-raise. It
+    derives from BaseException so that it is never mistaken for a failure of an attempt.
+
+    Args:
+        result (Any): The result of the last attempt.
+    """
+
+    def __init__(self, result: Any) -> None:
+        super().__init__()
+        self.result = result
+
+
+class _Retrier:
+    """
+    Retry bookkeeping for a single decorated function, shared by its sync and async wrappers.
+
+    The wrappers own the attempt loop (calling the function and sleeping), while the retrier
+    decides what happens around each attempt: timeout and deadline checks, classification of
+    the raised exceptions, logging and callbacks. The progress of an invocation is kept in a
+    `RetryState`, allocated on its first failure; methods that may also run on the success
+    path accept None instead and allocate it only if they fail.
+
+    Args:
+        fname (str): Name of the decorated function.
+        target_exceptions (Tuple[Type[Exception], ...]): Exception types that trigger a retry.
+        excluded_exceptions (Tuple[Type[Exception], ...]): Exception types that never trigger a retry.
+        max_retries (Optional[int]): Maximum number of retries allowed, or None for unlimited retries.
+        timeout (Optional[float]): Timeout value for the retry operation in seconds, or None if no timeout.
+        deadline (Optional[float]): Deadline for the retry operation in seconds, or None if no deadline.
+        logger (Optional[logging.Logger]): Logger instance for logging retry information, or None.
+        log_retry_traceback (bool): Flag to indicate if the traceback should be logged on each retry.
+        failure_callback (Optional[Callable]): Callback function to execute upon eventual failure, or None.
+        retry_callback (Optional[Callable]): Callback function to execute before each retry attempt, or None.
+        successful_retry_callback (Optional[Callable]): Callback function to execute upon a successful retry,
+            or None.
+        reraise_exception (bool): Whether to re-raise the last exception caught in case of failure after retries.
+        clock (Clock): Clock used to measure elapsed time, `start_time` values are readings of it.
+        interrupt_on_deadline (bool): Whether to stop waiting for an attempt once the deadline is reached.
+        attempt_timeout (Optional[float]): Time limit of each attempt in seconds, or None if attempts are unbounded.
+        budget (Optional[RetryBudget]): Retry budget permitting each retry, or None if retries are not budgeted.
+        circuit_breaker (Optional[CircuitBreaker]): Circuit breaker permitting each attempt, or None.
+        structured_logging (bool): Whether to attach the retry information to retry log records.
+        callback_executor (Optional[Executor]): Executor to dispatch the callbacks and the failure logging to,
+            or None to run them inline. Coroutine callbacks are scheduled as tasks on the running event loop
+            in either case.
+        pass_retry_state (bool): Whether to pass the `RetryState` of the invocation to the callbacks.
+        stop (Optional[Callable[[RetryState], bool]]): Predicate on the state after a failed attempt, giving up
+            the retry operation when true, or None.
+        delay_from_exception (Optional[Callable[[Exception], Optional[float]]]): Callable returning the delay
+            requested by an exception, overriding the backoff delay unless None, or None.
+        max_delay (Optional[float]): Maximum delay of the backoff strategy, bounding requested delays, or None.
+        iter_delays (Callable[[], Iterator[float]]): Callable returning the delays of the retries of an invocation.
+        retry_on_result (Optional[Callable[[Any], bool]]): Predicate on results triggering a retry, or None.
+    """
+
+    def __init__(
+        self,
+        fname: str,
+        target_exceptions: Tuple[Type[Exception], ...],
+        excluded_exceptions: Tuple[Type[Exception], ...],
+        max_retries: Optional[int],
+        timeout: Optional[float],
+        deadline: Optional[float],
+        logger: Optional[logging.Logger],
+        log_retry_traceback: bool,
+        failure_callback: Optional[Callable],
+        retry_callback: Optional[Callable],
+        successful_retry_callback: Optional[Callable],
+        reraise_exception: bool,
+        clock: Clock,
+        interrupt_on_deadline: bool,
+        attempt_timeout: Optional[float],
+        budget: Optional[RetryBudget],
+        circuit_breaker: Optional[CircuitBreaker],
+        structured_logging: bool,
+        callback_executor: Optional[Executor],
+        pass_retry_state: bool,
+        stop: Optional[Callable[[RetryState], bool]],
+        delay_from_exception: Optional[Callable[[Exception], Optional[float]]],
+        max_delay: Optional[float],
+        iter_delays: Callable[[], Iterator[float]],
+        retry_on_result: Optional[Callable[[Any], bool]]
+    ) -> None:
+        self.fname = fname
+        self.target_exceptions = target_exceptions
+        self.excluded_exceptions = excluded_exceptions
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.deadline = deadline
+        self.logger = logger
+        self.log_retry_traceback = log_retry_traceback
+        self.callback_executor = callback_executor
+        self.pass_retry_state = pass_retry_state
+        self.stop = stop
+        self.delay_from_exception = delay_from_exception
+        self.max_delay = max_delay
+        self.iter_delays = iter_delays
+        self.retry_on_result = retry_on_result
+        self._pending_callbacks: Set[Union[Future, asyncio.Future]] = set()
+        self.failure_callback = self._dispatcher(failure_callback)
+        self.retry_callback = self._dispatcher(retry_callback)
+        self.successful_retry_callback = self._dispatcher(successful_retry_callback)
+        self.reraise_exception = reraise_exception
+        self.clock = clock
+        self.interrupt_on_deadline = interrupt_on_deadline
+        self.attempt_timeout = attempt_timeout
+        self.budget = budget
+        self.circuit_breaker = circuit_breaker
+        self.structured_logging = structured_logging
+        timeouts = [t for t in (timeout, deadline) if t]
+        self.limit = min(timeouts) if timeouts else None
+        self.bounded = bool((deadline and interrupt_on_deadline) or attempt_timeout)
+        # the clock is read before the first attempt only if its start time is needed: to enforce a timeout
+        # or a deadline, or to expose the retry state. Otherwise the retry operation starts on the first failure.
+        self.timed = bool(self.limit is not None or pass_retry_state or stop is not None)
+        self.tracked = budget is not None or circuit_breaker is not None
+
+    def new_state(self, start_time: Optional[float], attempts: int) -> RetryState:
+        """
+        Allocate the state of an invocation.
+
+        Args:
+            start_time (Optional[float]): Start time of the retry operation, or None to start it now, on the
+                first failure of an invocation whose start time was not read.
+            attempts (int): Number of attempts made so far.
+
+        Returns:
+            RetryState: The state of the invocation.
+        """
+        if start_time is None:
+            start_time = self.clock()
+        return RetryState(self.fname, start_time, self.clock, self.limit, attempts)
+
+    def _attempt_time_limit(self, start_time: Optional[float], state: Optional[RetryState]) -> Tuple[float, bool]:
+        """
+        Compute the time an attempt starting now is allowed to run for.
+
+        Args:
+            start_time (Optional[float]): Start time of the retry operation, or None if it is not timed.
+            state (Optional[RetryState]): The state of the invocation, or None on its first attempt.
+
+        Returns:
+            Tuple[float, bool]: Time limit of the attempt in seconds, and whether it is set by the deadline
+                rather than by the attempt timeout.
+
+        Raises:
+            RetriesDeadlineException: If the deadline has already been exceeded.
+        """
+        if not (self.deadline and self.interrupt_on_deadline):
+            return self.attempt_timeout, False
+
+        elapsed_time = self.clock() - start_time
+        if elapsed_time >= self.deadline:
+            self._raise_attempt_deadline(state or self.new_state(start_time, 1), elapsed_time)
+        remaining_time = self.deadline - elapsed_time
+        if self.attempt_timeout and self.attempt_timeout < remaining_time:
+            return self.attempt_timeout, False
+        return remaining_time, True
+
+    def _raise_expired(self, start_time: Optional[float], state: Optional[RetryState], by_deadline: bool) -> NoReturn:
+        """
+        Raise the failure of an attempt that did not complete within its time limit.
+
+        Args:
+            start_time (Optional[float]): Start time of the retry operation, or None if it is not timed.
+            state (Optional[RetryState]): The state of the invocation, or None on its first attempt.
+            by_deadline (bool): Whether the time limit of the attempt was set by the deadline.
+
+        Raises:
+            RetriesDeadlineException: If the attempt was stopped by the deadline.
+            AttemptTimeoutException: If the attempt was stopped by the attempt timeout.
+        """
+        if by_deadline:
+            state = state or self.new_state(start_time, 1)
+            self._raise_attempt_deadline(state, state.elapsed)
+        raise AttemptTimeoutException(fname=self.fname, attempt_timeout=self.attempt_timeout)
+
+    def call(
+        self,
+        f: Callable,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        start_time: Optional[float],
+        state: Optional[RetryState]
+    ) -> Any:
+        """
+        Make a bounded attempt, running the function in a worker thread and giving up on it at its time limit.
+
+        Args:
+            f (Callable): The decorated function.
+            args (Tuple): Positional arguments of the call.
+            kwargs (Dict[str, Any]): Keyword arguments of the call.
+            start_time (Optional[float]): Start time of the retry operation, or None if it is not timed.
+            state (Optional[RetryState]): The state of the invocation, or None on its first attempt.
+
+        Returns:
+            Any: The result of the attempt.
+
+        Raises:
+            RetriesDeadlineException: If the deadline is reached before the attempt completes.
+            AttemptTimeoutException: If the attempt timeout is reached before the attempt completes.
+        """
+        time_limit, by_deadline = self._attempt_time_limit(start_time, state)
+        try:
+            return _call_with_timeout(f, args, kwargs, time_limit)
+        except _AttemptExpired:
+            self._raise_expired(start_time, state, by_deadline)
+
+    async def call_async(
+        self,
+        f: Callable,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        start_time: Optional[float],
+        state: Optional[RetryState]
+    ) -> Any:
+        """
+        Make a bounded attempt of a coroutine function, cancelling it at its time limit.
+
+        Args:
+            f (Callable): The decorated coroutine function.
+            args (Tuple): Positional arguments of the call.
+            kwargs (Dict[str, Any]): Keyword arguments of the call.
+            start_time (Optional[float]): Start time of the retry operation, or None if it is not timed.
+            state (Optional[RetryState]): The state of the invocation, or None on its first attempt.
+
+        Returns:
+            Any: The result of the attempt.
+
+        Raises:
+            RetriesDeadlineException: If the deadline is reached before the attempt completes.
+            AttemptTimeoutException: If the attempt timeout is reached before the attempt completes.
+        """
+        time_limit, by_deadline = self._attempt_time_limit(start_time, state)
+        try:
+            return await _await_with_timeout(f(*args, **kwargs), time_limit)
+        except _AttemptExpired:
+            self._raise_expired(start_time, state, by_deadline)
+
+    def check_circuit(self, state: Optional[RetryState]) -> None:
+        """
+        Abort the retry operation if the circuit breaker refuses the next attempt.
+
+        Args:
+            state (Optional[RetryState]): The state of the invocation, or None before its first attempt.
+
+        Raises:
+            CircuitOpenException: If the circuit breaker refuses the attempt.
+            Exception: The last exception caught, if the circuit breaker refuses the attempt and
+                `reraise_exception` is set.
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            self._raise_circuit_open(state or self.new_state(None, 0))
+
+    def check_timeout(self, state: RetryState) -> None:
+        """
+        Abort the retry operation if the timeout has been exceeded before the next attempt.
+
+        Args:
+            state (RetryState): The state of the invocation.
+
+        Raises:
+            RetriesTimeoutException: If the timeout has been exceeded.
+            Exception: The last exception caught, if the timeout has been exceeded and
+                `reraise_exception` is set.
+        """
+        if not self.timeout:
+            return
+
+        elapsed_time = state.elapsed
+        if elapsed_time > self.timeout:
+            self._raise_timeout(state, elapsed_time)
+
+    def check_deadline(self, start_time: Optional[float], state: Optional[RetryState]) -> None:
+        """
+        Abort the retry operation if the deadline has been exceeded after an attempt.
+
+        Args:
+            start_time (Optional[float]): Start time of the retry operation, or None if it is not timed.
+            state (Optional[RetryState]): The state of the invocation, or None on its first attempt.
+
+        Raises:
+            RetriesDeadlineException: If the deadline has been exceeded.
+            Exception: The last exception caught, if the deadline has been exceeded and
+                `reraise_exception` is set.
+        """
+        if not self.deadline:
+            return
+
+        elapsed_time = self.clock() - start_time
+        if elapsed_time > self.deadline:
+            self._raise_deadline(state or self.new_state(start_time, 1), elapsed_time)
+
+    def check_time_left(self, state: RetryState, delay: float) -> None:
+        """
+        Abort the retry operation before sleeping if the next attempt could not start in time.
+
+        An attempt starting after the timeout is never executed and one starting after the deadline
+        can only end after it, so sleeping a delay that crosses either of them is wasted time.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            delay (float): Delay in seconds before the next attempt.
+
+        Raises:
+            RetriesTimeoutException: If the next attempt would start after the timeout.
+            RetriesDeadlineException: If the next attempt would start after the deadline.
+            Exception: The last exception caught, if either applies and `reraise_exception` is set.
+        """
+        if self.limit is None:
+            return
+
+        elapsed_time = state.elapsed
+        if self.timeout and elapsed_time + delay > self.timeout:
+            self._raise_timeout(state, elapsed_time, delay)
+        if self.deadline and elapsed_time + delay > self.deadline:
+            self._raise_deadline(state, elapsed_time, delay)
+
+    def _dispatcher(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Wrap a callback so that calling it dispatches it according to the callback configuration.
+
+        Coroutine callbacks are scheduled as tasks on the running event loop, other callbacks are
+        submitted to the callback executor if any, or left to run inline. Failures of dispatched
+        callbacks are logged, as there is no caller to raise them to.
+
+        Args:
+            callback (Optional[Callable]): The callback, or None.
+
+        Returns:
+            Optional[Callable]: The callable dispatching the callback, or None if there is no callback.
+        """
+        if callback is None or (not _is_coroutine_callback(callback) and self.callback_executor is None):
+            return callback
+
+        if _is_coroutine_callback(callback):
+            def dispatch(*args: Any) -> None:
+                self._track_callback(asyncio.ensure_future(callback(*args)))
+        else:
+            def dispatch(*args: Any) -> None:
+                self._track_callback(self.callback_executor.submit(callback, *args))
+
+        return dispatch
+
+    def _callback_args(self, state: RetryState) -> Tuple:
+        """
+        Get the positional arguments the callbacks are called with.
+
+        Args:
+            state (RetryState): The state of the invocation.
+
+        Returns:
+            Tuple: The state alone if it is passed to the callbacks, no arguments otherwise.
+        """
+        return (state,) if self.pass_retry_state else ()
+
+    def _track_callback(self, future: Union[Future, asyncio.Future]) -> None:
+        """
+        Keep a dispatched callback referenced until it completes, and log its failure if any.
+
+        Args:
+            future (Union[Future, asyncio.Future]): The future or task of the dispatched callback.
+        """
+        self._pending_callbacks.add(future)
+        future.add_done_callback(self._callback_done)
+
+    def _callback_done(self, future: Union[Future, asyncio.Future]) -> None:
+        """
+        Release a completed callback, logging its failure if any.
+
+        Args:
+            future (Union[Future, asyncio.Future]): The future or task of the dispatched callback.
+        """
+        self._pending_callbacks.discard(future)
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None and self.logger:
+            self.logger.error("Callback of function %s failed.", self.fname, exc_info=exc)
+
+    def _fail(self, error: BaseRetryException, state: RetryState) -> NoReturn:
+        """
+        Report the eventual failure of the retry operation and raise it.
+
+        The failure is logged on the callback executor if any, and the failure callback is dispatched.
+
+        Args:
+            error (BaseRetryException): The exception the retry operation fails with.
+            state (RetryState): The state of the invocation.
+
+        Raises:
+            BaseRetryException: `error`, chained to the last exception caught.
+        """
+        if self.callback_executor is not None:
+            self.callback_executor.submit(_log_failure, self.logger, error, self.structured_logging)
+        else:
+            _log_failure(self.logger, error, self.structured_logging)
+        if self.failure_callback:
+            self.failure_callback(*self._callback_args(state))
+        raise error from state.last_exception
+
+    def _raise_timeout(self, state: RetryState, elapsed_time: float, delay: Optional[float] = None) -> NoReturn:
+        """
+        Raise the timeout failure of the retry operation.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            elapsed_time (float): Time elapsed during the retry operation in seconds.
+            delay (Optional[float]): Delay of the next retry that would exceed the timeout, if the
+                operation is aborted ahead of it.
+        """
+        self._reraise_last(state)
+        self._fail(
+            RetriesTimeoutException(
+                fname=self.fname,
+                elapsed=elapsed_time,
+                timeout=self.timeout,
+                delay=delay,
+                attempts=state.attempts,
+                last_exception=state.last_exception,
+            ),
+            state
+        )
+
+    def _raise_deadline(self, state: RetryState, elapsed_time: float, delay: Optional[float] = None) -> NoReturn:
+        """
+        Raise the deadline failure of the retry operation.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            elapsed_time (float): Time elapsed during the retry operation in seconds.
+            delay (Optional[float]): Delay of the next retry that would exceed the deadline, if the
+                operation is aborted ahead of it.
+        """
+        self._reraise_last(state)
+        self._fail(
+            RetriesDeadlineException(
+                fname=self.fname,
+                elapsed=elapsed_time,
+                deadline=self.deadline,
+                delay=delay,
+                attempts=state.attempts,
+                last_exception=state.last_exception,
+            ),
+            state
+        )
+
+    def _raise_attempt_deadline(self, state: RetryState, elapsed_time: float) -> NoReturn:
+        """
+        Raise the deadline failure of the retry operation from within a bounded attempt.
+
+        The wrappers hand it to `on_failure`, which re-raises the outcome of the last failed attempt with
+        `reraise_exception`, so that it is not raised from within the attempt and mistaken for a failure of
+        it. The failure is only reported when it is not re-raised that way.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            elapsed_time (float): Time elapsed during the retry operation in seconds.
+
+        Raises:
+            RetriesDeadlineException: Always.
+        """
+        error = RetriesDeadlineException(
+            fname=self.fname,
+            elapsed=elapsed_time,
+            deadline=self.deadline,
+            attempts=state.attempts,
+            last_exception=state.last_exception,
+        )
+        if self.reraise_exception and (state.last_exception is not None or state.retried_on_result):
+            raise error from state.last_exception
+        self._fail(error, state)
+
+    def _raise_circuit_open(self, state: RetryState) -> NoReturn:
+        """
+        Raise the short-circuit failure of the retry operation.
+
+        Args:
+            state (RetryState): The state of the invocation.
+        """
+        self._reraise_last(state)
+        self._fail(
+            CircuitOpenException(
+                fname=self.fname,
+                attempts=state.attempts,
+                elapsed=state.elapsed,
+                last_exception=state.last_exception,
+            ),
+            state
+        )
+
+    def on_success(self, state: Optional[RetryState]) -> None:
+        """
+        Handle a successful attempt.
+
+        Args:
+            state (Optional[RetryState]): The state of the invocation, or None if its first attempt succeeded.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+        if state is not None and self.successful_retry_callback:
+            self.successful_retry_callback(*self._callback_args(state))
+
+    def _requested_delay(self, exc: Exception, delay: float) -> float:
+        """
+        Get the delay requested by an exception, e.g. from a `Retry-After` header, bounded by the maximum delay.
+
+        Args:
+            exc (Exception): The exception raised by the attempt.
+            delay (float): The delay computed by the backoff strategy.
+
+        Returns:
+            float: The requested delay in seconds, or `delay` if the exception does not request one.
+        """
+        requested = self.delay_from_exception(exc)
+        if requested is None:
+            return delay
+        requested = max(float(requested), 0.0)
+        if self.max_delay is not None:
+            requested = min(requested, self.max_delay)
+        return requested
+
+    def _reraise_last(self, state: RetryState) -> None:
+        """
+        Give up the retry operation with the outcome of its last failed attempt, if `reraise_exception` is set.
+
+        Args:
+            state (RetryState): The state of the invocation.
+
+        Raises:
+            Exception: The last exception caught, if the last attempt raised one.
+            _ResultRetriesExhausted: Carrying the last result, if the last attempt was retried on its result.
+        """
+        if not self.reraise_exception:
+            return
+        if state.last_exception is not None:
+            raise state.last_exception
+        if state.retried_on_result:
+            raise _ResultRetriesExhausted(state.last_result)
+
+    def on_failure(self, state: RetryState, exc: Exception, delays: Iterator[float]) -> float:
+        """
+        Handle an exception raised by an attempt and decide whether to retry.
+
+        Args:
+            state (RetryState): The state of the invocation, its last exception being the one that
+                triggered the previous retry, if any.
+            exc (Exception): The exception raised by the attempt.
+            delays (Iterator[float]): The per-invocation iterator of backoff delays.
+
+        Returns:
+            float: Delay in seconds to wait before the next attempt.
+
+        Raises:
+            Exception: `exc` itself if it must not be retried, or any of the failures of `_schedule_retry`.
+        """
+        if isinstance(exc, (RetriesTimeoutException, RetriesDeadlineException)):
+            self._reraise_last(state)
+            raise exc
+
+        if isinstance(exc, self.excluded_exceptions):
+            raise exc
+
+        state.last_exception = exc
+        state.last_result = None
+        state.retried_on_result = False
+        return self._schedule_retry(state, delays)
+
+    def on_result(self, state: RetryState, result: Any, delays: Iterator[float]) -> float:
+        """
+        Handle a result of an attempt matched by the `retry_on_result` predicate and decide whether to retry.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            result (Any): The result returned by the attempt.
+            delays (Iterator[float]): The per-invocation iterator of backoff delays.
+
+        Returns:
+            float: Delay in seconds to wait before the next attempt.
+
+        Raises:
+            Exception: Any of the failures of `_schedule_retry`.
+        """
+        state.last_exception = None
+        state.last_result = result
+        state.retried_on_result = True
+        return self._schedule_retry(state, delays)
+
+    def _schedule_retry(self, state: RetryState, delays: Iterator[float]) -> float:
+        """
+        Decide whether to retry after a failed attempt, recorded in the state, and compute the delay before it.
+
+        Args:
+            state (RetryState): The state of the invocation.
+            delays (Iterator[float]): The per-invocation iterator of backoff delays.
+
+        Returns:
+            float: Delay in seconds to wait before the next attempt.
+
+        Raises:
+            Exception: The last exception caught if the retry operation gives up and `reraise_exception` is set,
+                `MaxRetriesException` if retries are exhausted, `RetriesStoppedException` if the stop predicate
+                is met, `CircuitOpenException` if the circuit breaker has opened, the timeout/deadline
+                exception if the next attempt could not start in time, or `RetryBudgetExhaustedException`
+                if the retry budget refuses the retry.
+            _ResultRetriesExhausted: Carrying the last result, instead of any of the above, if the last attempt
+                was retried on its result and `reraise_exception` is set.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+
+        if self.max_retries is not None and state.attempts > self.max_retries:
+            self._reraise_last(state)
+            self._fail(
+                MaxRetriesException(
+                    fname=self.fname,
+                    max_retries=self.max_retries,
+                    attempts=state.attempts,
+                    elapsed=state.elapsed,
+                    last_exception=state.last_exception,
+                ),
+                state
+            )
+
+        delay = next(delays)
+        if self.delay_from_exception is not None and state.last_exception is not None:
+            delay = self._requested_delay(state.last_exception, delay)
+        state.next_delay = delay
+
+        if self.stop is not None and self.stop(state):
+            self._reraise_last(state)
+            self._fail(
+                RetriesStoppedException(
+                    fname=self.fname,
+                    attempts=state.attempts,
+                    elapsed=state.elapsed,
+                    last_exception=state.last_exception,
+                ),
+                state
+            )
+
+        if self.circuit_breaker is not None and self.circuit_breaker.is_open:
+            self._raise_circuit_open(state)
+
+        # a retry that could not start in time is refused before it spends a token of the shared budget
+        self.check_time_left(state, delay)
+
+        if self.budget is not None and not self.budget.withdraw():
+            self._reraise_last(state)
+            self._fail(
+                RetryBudgetExhaustedException(
+                    fname=self.fname,
+                    attempts=state.attempts,
+                    elapsed=state.elapsed,
+                    last_exception=state.last_exception,
+                ),
+                state
+            )
+
+        _log_retry(
+            logger=self.logger,
+            fname=self.fname,
+            max_retries=self.max_retries,
+            retries=state.attempts - 1,
+            timeout=self.timeout,
+            deadline=self.deadline,
+            start_time=state.start_time,
+            delay=delay,
+            clock=self.clock,
+            exc_info=state.last_exception if self.log_retry_traceback else None,
+            structured=self.structured_logging,
+        )
+
+        if self.retry_callback:
+            self.retry_callback(*self._callback_args(state))
+
+        return delay
+
+
+def _make_retrier(
+    f: Callable,
+    exceptions: Tuple[Type[Exception], ...],
+    excluded_exceptions: Tuple[Type[Exception], ...],
+    max_retries: Optional[int],
+    backoff: BackOff,
+    timeout: Optional[float],
+    deadline: Optional[float],
+    logger: Optional[logging.Logger],
+    log_retry_traceback: bool,
+    failure_callback: Optional[Callable],
+    retry_callback: Optional[Callable],
+    successful_retry_callback: Optional[Callable],
+    reraise_exception: bool,
+    clock: Clock,
+    interrupt_on_deadline: bool,
+    attempt_timeout: Optional[float],
+    budget: Optional[RetryBudget],
+    circuit_breaker: Optional[CircuitBreaker],
+    structured_logging: bool,
+    callback_executor: Optional[Executor],
+    pass_retry_state: bool,
+    retry_on_result: Optional[Callable[[Any], bool]],
+    stop: Optional[Callable[[RetryState], bool]],
+    delay_from_exception: Optional[Callable[[Exception], Optional[float]]],
+    resume_kwarg: Optional[str],
+    resume_token: Optional[Callable[[Any], Any]]
+) -> _Retrier:
+    """
+    Build the retrier of a function from the arguments of `retry`, already validated.
+
+    It is shared by `retry` and `retry_map`, which run the attempts of the function differently
+    but configure its retries the same way. The arguments following `f` are those of `retry`.
+
+    Args:
+        f (Callable): The function whose attempts are retried.
+
+    Returns:
+        _Retrier: The retrier of the function.
+
+    Raises:
+        TypeError: If a coroutine callback is given for a function, if `resume_kwarg` is given for a function
+            that is not a generator function, or if `attempt_timeout`, `interrupt_on_deadline` or
+            `retry_on_result` is given for a generator function.
+    """
+    asynchronous = inspect.iscoroutinefunction(f) or inspect.isasyncgenfunction(f)
+    streaming = inspect.isgeneratorfunction(f) or inspect.isasyncgenfunction(f)
+
+    if not asynchronous and any(
+        callback is not None and _is_coroutine_callback(callback)
+        for callback in (failure_callback, retry_callback, successful_retry_callback)
+    ):
+        raise TypeError("Coroutine callbacks are only supported for coroutine functions")
+
+    if resume_kwarg is not None and not streaming:
+        raise TypeError("resume_kwarg is only supported for generator functions")
+
+    if streaming and (attempt_timeout is not None or interrupt_on_deadline or retry_on_result is not None):
+        raise TypeError(
+            "attempt_timeout, interrupt_on_deadline and retry_on_result are not supported for generator functions"
+        )
+
+    target_exceptions = tuple(set(exceptions) - set(excluded_exceptions))
+
+    if not target_exceptions:
+        target_exceptions = (Exception,)
+
+    if attempt_timeout:
+        target_exceptions += (AttemptTimeoutException,)
+
+    # a bounded attempt reaching the deadline is always handed to on_failure, which gives up the retries
+    if deadline and interrupt_on_deadline:
+        target_exceptions += (RetriesDeadlineException,)
+
+    # a deterministic backoff with a known maximum of retries has a single, finite schedule,
+    # computed once and replayed by every invocation instead of recomputing its delays
+    if max_retries is not None and max_retries <= _MAX_CACHED_SCHEDULE and backoff.deterministic and not backoff._legacy():
+        iter_delays = backoff.schedule(max_retries).__iter__
+    else:
+        iter_delays = backoff.iter_delays
+
+    return _Retrier(
+        fname=f.__name__,
+        target_exceptions=target_exceptions,
+        excluded_exceptions=excluded_exceptions,
+        max_retries=max_retries,
+        timeout=timeout,
+        deadline=deadline,
+        logger=logger,
+        log_retry_traceback=log_retry_traceback,
+        failure_callback=failure_callback,
+        retry_callback=retry_callback,
+        successful_retry_callback=successful_retry_callback,
+        reraise_exception=reraise_exception,
+        clock=clock,
+        interrupt_on_deadline=interrupt_on_deadline,
+        attempt_timeout=attempt_timeout,
+        budget=budget,
+        circuit_breaker=circuit_breaker,
+        structured_logging=structured_logging,
+        callback_executor=callback_executor,
+        pass_retry_state=pass_retry_state,
+        stop=stop,
+        delay_from_exception=delay_from_exception,
+        max_delay=backoff._max,
+        iter_delays=iter_delays,
+        retry_on_result=retry_on_result,
+    )
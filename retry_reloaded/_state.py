@@ -0,0 +1,70 @@
+from typing import Optional
+from ._clock import Clock
+
+
+class RetryState:
+    """
+    State of a single invocation of a decorated function that has failed at least once.
+
+    It is allocated once, on the first failure, and mutated in place by the retry loop. It is passed
+    to the callbacks when the `pass_retry_state` argument of `retry` is set, and to its `stop` predicate.
+    The clock is then read before the first attempt, so that `elapsed` includes it.
+
+    Attributes:
+        fname (str): Name of the decorated function.
+        start_time (float): Start time of the retry operation, as read from the clock before the first attempt,
+            or on the first failure when nothing needs the start time before.
+        attempts (int): Number of attempts made so far.
+        last_exception (Optional[Exception]): The exception raised by the last failed attempt, if any.
+        last_result (Any): The result returned by the last failed attempt, if it was retried on its result.
+        retried_on_result (bool): Whether the last failed attempt was retried on its result rather than
+            on an exception.
+        next_delay (Optional[float]): Delay in seconds before the next attempt, once it is known.
+    """
+    __slots__ = (
+        "fname", "start_time", "attempts", "last_exception", "last_result", "retried_on_result", "next_delay",
+        "_clock", "_limit"
+    )
+
+    def __init__(self, fname: str, start_time: float, clock: Clock, limit: Optional[float], attempts: int) -> None:
+        """
+        Initialize RetryState object.
+
+        Args:
+            fname (str): Name of the decorated function.
+            start_time (float): Start time of the retry operation, as read from `clock`.
+            clock (Clock): Clock used to measure elapsed time.
+            limit (Optional[float]): The earliest of the timeout and the deadline in seconds, or None.
+            attempts (int): Number of attempts made so far.
+        """
+        self.fname = fname
+        self.start_time = start_time
+        self.attempts = attempts
+        self.last_exception = None
+        self.last_result = None
+        self.retried_on_result = False
+        self.next_delay = None
+        self._clock = clock
+        self._limit = limit
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Get the time elapsed since the start of the retry operation.
+
+        Returns:
+            float: Elapsed time in seconds.
+        """
+        return self._clock() - self.start_time
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        Get the time remaining until the earliest of the timeout and the deadline.
+
+        Returns:
+            Optional[float]: Remaining time in seconds, or None if there is neither a timeout nor a deadline.
+        """
+        if self._limit is None:
+            return None
+        return self._limit - self.elapsed
@@ -1,6 +1,9 @@
-from typing import Tuple, Type, Callable, Optional
+from typing import Any, Tuple, Type, Callable, Optional
 import logging
+from concurrent.futures import Executor
 from .backoff import BackOff
+from .budget import RetryBudget
+from .circuit import CircuitBreaker
 
 
 def _validate_args(
@@ -15,7 +18,20 @@ def _validate_args(
     failure_callback: Optional[Callable[[], None]],
     retry_callback: Optional[Callable[[], None]],
     successful_retry_callback: Optional[Callable[[], None]],
-    reraise_exception: bool
+    reraise_exception: bool,
+    clock: Callable[[], float],
+    interrupt_on_deadline: bool,
+    attempt_timeout: Optional[float],
+    budget: Optional[RetryBudget],
+    circuit_breaker: Optional[CircuitBreaker],
+    structured_logging: bool,
+    callback_executor: Optional[Executor],
+    pass_retry_state: bool,
+    retry_on_result: Optional[Callable[[Any], bool]],
+    stop: Optional[Callable[[Any], bool]],
+    delay_from_exception: Optional[Callable[[Exception], Optional[float]]],
+    resume_kwarg: Optional[str],
+    resume_token: Optional[Callable[[Any], Any]]
 ) -> None:
     """
     Validate arguments for retry logic.
@@ -34,9 +50,24 @@ def _validate_args(
         successful_retry_callback (Optional[Callable[[], None]]): Callback function to execute upon a successful retry,
           or None.
         reraise_exception (bool): Whether to re-raise the last exception caught in case of failure after retries.
+        clock (Callable[[], float]): Clock used to measure elapsed time.
+        interrupt_on_deadline (bool): Whether to stop waiting for a running attempt once the deadline is reached.
+        attempt_timeout (Optional[float]): Time limit of each attempt in seconds, or None if attempts are unbounded.
+        budget (Optional[RetryBudget]): Retry budget permitting each retry, or None if retries are not budgeted.
+        circuit_breaker (Optional[CircuitBreaker]): Circuit breaker permitting each attempt, or None.
+        structured_logging (bool): Whether to attach the retry information to retry log records.
+        callback_executor (Optional[Executor]): Executor running the callbacks and the failure logging, or None.
+        pass_retry_state (bool): Whether to pass the retry state to the callbacks.
+        retry_on_result (Optional[Callable[[Any], bool]]): Predicate on results triggering a retry, or None.
+        stop (Optional[Callable[[Any], bool]]): Predicate on the retry state giving up retries, or None.
+        delay_from_exception (Optional[Callable[[Exception], Optional[float]]]): Callable returning the delay
+          requested by an exception, or None.
+        resume_kwarg (Optional[str]): Keyword argument resuming a generator function from a token, or None.
+        resume_token (Optional[Callable[[Any], Any]]): Callable returning the resume token of a yielded item, or None.
 
     Raises:
         TypeError: If any of the arguments do not meet the expected types.
+        ValueError: If `attempt_timeout` is not positive.
     """
     if not isinstance(exceptions, tuple):
         raise TypeError("exceptions must be a tuple")
@@ -77,4 +108,112 @@ def _validate_args(
         raise TypeError("successful_retry_callback must be a callable or None")
 
     if not isinstance(reraise_exception, bool):
-        raise TypeError("reraise_exception must be a boolean")
\ No newline at end of file
+        raise TypeError("reraise_exception must be a boolean")
+
+    if not callable(clock):
+        raise TypeError("clock must be a callable")
+
+    if not isinstance(interrupt_on_deadline, bool):
+        raise TypeError("interrupt_on_deadline must be a boolean")
+
+    if attempt_timeout is not None:
+        if not isinstance(attempt_timeout, (int, float)):
+            raise TypeError("attempt_timeout must be a float or None")
+        if attempt_timeout <= 0:
+            raise ValueError("attempt_timeout must be a positive number")
+
+    if budget is not None and not isinstance(budget, RetryBudget):
+        raise TypeError("budget must be an instance of RetryBudget or None")
+
+    if circuit_breaker is not None and not isinstance(circuit_breaker, CircuitBreaker):
+        raise TypeError("circuit_breaker must be an instance of CircuitBreaker or None")
+
+    if not isinstance(structured_logging, bool):
+        raise TypeError("structured_logging must be a boolean")
+
+    if callback_executor is not None and not isinstance(callback_executor, Executor):
+        raise TypeError("callback_executor must be an instance of concurrent.futures.Executor or None")
+
+    if not isinstance(pass_retry_state, bool):
+        raise TypeError("pass_retry_state must be a boolean")
+
+    if retry_on_result is not None and not callable(retry_on_result):
+        raise TypeError("retry_on_result must be a callable or None")
+
+    if stop is not None and not callable(stop):
+        raise TypeError("stop must be a callable or None")
+
+    if delay_from_exception is not None and not callable(delay_from_exception):
+        raise TypeError("delay_from_exception must be a callable or None")
+
+    if resume_kwarg is not None and not isinstance(resume_kwarg, str):
+        raise TypeError("resume_kwarg must be a string or None")
+
+    if resume_token is not None and not callable(resume_token):
+        raise TypeError("resume_token must be a callable or None")
+
+    if resume_token is not None and resume_kwarg is None:
+        raise TypeError("resume_token requires resume_kwarg")
+
+
+def _validate_hedge_args(
+    exceptions: Tuple[Type[Exception], ...],
+    excluded_exceptions: Tuple[Type[Exception], ...],
+    max_retries: int,
+    backoff: BackOff,
+    percentile: Optional[float],
+    logger: Optional[logging.Logger],
+    reraise_exception: bool,
+    clock: Callable[[], float]
+) -> None:
+    """
+    Validate arguments for hedging logic.
+
+    Args:
+        exceptions (Tuple[Type[Exception], ...]): Tuple of exception types counting as a failed attempt.
+        excluded_exceptions (Tuple[Type[Exception]], ...): Tuple of exception types raised immediately.
+        max_retries (int): Maximum number of hedged attempts on top of the first one.
+        backoff (BackOff): BackOff instance spacing out consecutive attempts.
+        percentile (Optional[float]): Percentile of observed latencies to use as hedge delay, or None.
+        logger (Optional[logging.Logger]): Logger instance for logging hedged attempts, or None if logging is disabled.
+        reraise_exception (bool): Whether to re-raise the last exception caught if all attempts fail.
+        clock (Callable[[], float]): Clock used to measure attempt latencies.
+
+    Raises:
+        TypeError: If any of the arguments do not meet the expected types.
+        ValueError: If `max_retries` is negative or `percentile` is out of range.
+    """
+    if not isinstance(exceptions, tuple):
+        raise TypeError("exceptions must be a tuple")
+
+    for exc in exceptions:
+        if not issubclass(exc, Exception):
+            raise TypeError("All items in the exceptions tuple must be subclasses of Exception")
+
+    for exc in excluded_exceptions:
+        if not issubclass(exc, Exception):
+            raise TypeError("All items in the excluded_exceptions tuple must be subclasses of Exception")
+
+    if not isinstance(max_retries, int):
+        raise TypeError("max_retries must be an integer")
+
+    if max_retries < 0:
+        raise ValueError("max_retries must be a positive integer")
+
+    if not isinstance(backoff, BackOff):
+        raise TypeError("backoff must be an instance of BackOff")
+
+    if percentile is not None:
+        if not isinstance(percentile, (int, float)):
+            raise TypeError("percentile must be a float or None")
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be within (0, 100]")
+
+    if logger is not None and not isinstance(logger, logging.Logger):
+        raise TypeError("logger must be an instance of logging.Logger or None")
+
+    if not isinstance(reraise_exception, bool):
+        raise TypeError("reraise_exception must be a boolean")
+
+    if not callable(clock):
+        raise TypeError("clock must be a callable")
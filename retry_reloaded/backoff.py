@@ -1,13 +1,225 @@
-from abc import ABC, abstractmethod
+from abc import ABC
+from array import array
+from copy import copy
+from itertools import islice
+import math
 import random
-from typing import Optional, Tuple
+import threading
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+class _ThreadLocalRandom(threading.local):
+    """
+    Random generator of each thread, used by the backoff strategies without their own generator.
+
+    Unlike the global generator of the `random` module it is neither shared across threads
+    nor affected by calls to `random.seed`.
+    """
+    def __init__(self) -> None:
+        self.random = random.Random()
+
+
+_thread_random = _ThreadLocalRandom()
+
+# Longest delay bounding the delays of growing strategies without a maximum. `threading.TIMEOUT_MAX`
+# itself is rejected by `time.sleep` on some platforms, as the wake-up time it computes overflows.
+_SLEEP_MAX = threading.TIMEOUT_MAX / 2
+
+
+def _exponential_delay(base_delay: float, base: float, _round: int) -> float:
+    """
+    Compute the exponential delay `base_delay * base ** _round` below the cap.
+
+    Args:
+        base_delay (float): Delay of round 0.
+        base (float): Value used as base for exponentiation, as a float.
+        _round (int): The round.
+
+    Returns:
+        float: The delay.
+    """
+    if base_delay == 0:
+        return 0.0
+    try:
+        return base_delay * base**_round
+    except OverflowError:
+        # only a tiny base delay lets the power overflow while the delay stays below the cap
+        return math.exp(math.log(base_delay) + _round * math.log(base))
+
+
+def _exponential_cap_round(base_delay: float, base: float, cap: float) -> float:
+    """
+    Find the first round whose exponential delay `base_delay * base ** round` reaches a cap, with logarithms.
+
+    Args:
+        base_delay (float): Delay of round 0.
+        base (float): Value used as base for exponentiation, as a float.
+        cap (float): Maximum delay of a round.
+
+    Returns:
+        float: The round, or infinity if the delays never reach the cap.
+    """
+    if base_delay >= cap:
+        return 0
+    if base_delay == 0 or base <= 1:
+        return math.inf
+
+    # the ratio of the cap to a tiny base delay may overflow, unlike the difference of their logarithms
+    _round = math.ceil((math.log(cap) - math.log(base_delay)) / math.log(base))
+    # the logarithms are rounded, so settle the boundary on the delays themselves.
+    while _round > 0 and _exponential_delay(base_delay, base, _round - 1) >= cap:
+        _round -= 1
+    while _exponential_delay(base_delay, base, _round) < cap:
+        _round += 1
+    return _round
+
+
+def _exponential_delays(base_delay: float, base: float, cap: float, cap_round: float, n: int) -> array:
+    """
+    Compute the exponential delays `min(base_delay * base ** i, cap)` of the rounds `0 <= i < n`.
+
+    The rounds from `cap_round` on are filled with the cap without raising the base to their power.
+
+    Args:
+        base_delay (float): Delay of round 0.
+        base (float): Value used as base for exponentiation, as a float.
+        cap (float): Maximum delay of a round.
+        cap_round (float): First round whose delay reaches the cap, as found by `_exponential_cap_round`.
+        n (int): Number of rounds.
+
+    Returns:
+        array: The delays.
+    """
+    split = min(n, cap_round)
+    if base_delay == 0:
+        return array("d", [0.0]) * split + array("d", [cap]) * (n - split)
+    delays = array("d", [_exponential_delay(base_delay, base, _round) for _round in range(split)])
+    return delays + array("d", [cap]) * (n - split)
+
+
+def _arithmetic_total(first: float, step: float, extra: float, start: int, stop: int, cap: Optional[float]) -> float:
+    """
+    Compute the sum of `min(first + step * i + extra, cap)` over the rounds `start <= i < stop` in closed form.
+
+    Args:
+        first (float): Delay of round 0, before `extra`.
+        step (float): Non negative increment of the delay per round.
+        extra (float): Constant added to the delay of every round, e.g. a jitter bound.
+        start (int): First round of the sum.
+        stop (int): Round after the last one of the sum.
+        cap (Optional[float]): Maximum delay of a round, or None.
+
+    Returns:
+        float: The sum of the delays.
+    """
+    if stop <= start:
+        return 0.0
+
+    def uncapped(low: int, high: int) -> float:
+        count = high - low
+        return count * (first + extra) + step * (low + high - 1) * count / 2
+
+    if cap is None:
+        return uncapped(start, stop)
+    if step == 0:
+        return (stop - start) * min(first + extra, cap)
+    if cap < first + extra:
+        return (stop - start) * cap
+
+    split = min(max(math.floor((cap - first - extra) / step) + 1, start), stop)
+    return uncapped(start, split) + (stop - split) * cap
+
+
+def _geometric_sum(first: float, ratio: float, start: int, stop: int) -> float:
+    """
+    Compute the sum of `first * ratio ** i` over the rounds `start <= i < stop` in closed form.
+
+    Args:
+        first (float): Delay of round 0.
+        ratio (float): Positive ratio of the delays of consecutive rounds.
+        start (int): First round of the sum.
+        stop (int): Round after the last one of the sum.
+
+    Returns:
+        float: The sum of the delays, or infinity if it overflows.
+    """
+    count = stop - start
+    if count <= 0 or first == 0:
+        return 0.0
+    if ratio == 1:
+        return first * count
+    try:
+        return first * ratio**start * (ratio**count - 1) / (ratio - 1)
+    except OverflowError:
+        pass
+    try:
+        # a tiny first delay may keep the sum finite while the powers overflow
+        high = math.exp(math.log(first) + stop * math.log(ratio))
+        low = math.exp(math.log(first) + start * math.log(ratio))
+        return (high - low) / (ratio - 1)
+    except OverflowError:
+        return math.inf
+
+
+def _geometric_total(first: float, ratio: float, extra: float, start: int, stop: int, cap: Optional[float]) -> float:
+    """
+    Compute the sum of `min(first * ratio ** i + extra, cap)` over the rounds `start <= i < stop` in closed form.
+
+    The rounds whose delay exceeds the cap are found with logarithms: they are the last ones if the
+    delays grow, or the first ones if they shrink.
+
+    Args:
+        first (float): Delay of round 0, before `extra`.
+        ratio (float): Positive ratio of the delays of consecutive rounds.
+        extra (float): Constant added to the delay of every round, e.g. a jitter bound.
+        start (int): First round of the sum.
+        stop (int): Round after the last one of the sum.
+        cap (Optional[float]): Maximum delay of a round, or None.
+
+    Returns:
+        float: The sum of the delays, or infinity if it overflows.
+    """
+    if stop <= start:
+        return 0.0
+    if cap is None:
+        return _geometric_sum(first, ratio, start, stop) + extra * (stop - start)
+    if first == 0 or ratio == 1:
+        return (stop - start) * min(first + extra, cap)
+    if cap <= extra:
+        return (stop - start) * cap
+
+    threshold = (math.log(cap - extra) - math.log(first)) / math.log(ratio)
+    if ratio > 1:
+        split = min(max(math.floor(threshold) + 1, start), stop)
+        return _geometric_sum(first, ratio, start, split) + extra * (split - start) + (stop - split) * cap
+    split = min(max(math.ceil(threshold), start), stop)
+    return (split - start) * cap + _geometric_sum(first, ratio, split, stop) + extra * (stop - split)
 
 
 class BackOff(ABC):
     """
     Base class for implementing backoff strategies.
+
+    A backoff instance is a policy: the delay of every round is computed by `_compute_delay` from
+    the round number and the previous delay, without mutating the instance. `iter_delays` yields
+    an independent sequence of delays on every call, so a single instance can be shared safely by
+    many decorated functions and concurrent invocations. The `delay` property and `reset` keep a
+    stateful cursor on the instance itself for standalone use.
+    Strategies implementing the former `_calculate_next_delay` hook instead still work, each
+    iterator advancing a copy of the instance.
+
+    `schedule` computes the delays of many rounds at once, while `total_delay` and `max_attempts_within`
+    bound them in closed form, to plan timeouts against maximum retries.
+
+    Random delays are drawn from the generator of the instance, given as a `random.Random` instance or
+    a seed, or else from a generator local to the calling thread. A seeded generator makes the delays
+    reproducible, and `reset` re-seeds it to replay them. A generator shared by concurrent invocations
+    still interleaves their draws.
     """
-    def __init__(self, base_delay: float = 0, jitter: Optional[Tuple[float, float]] = None):
+    _max: Optional[float] = None
+
+    def __init__(self, base_delay: float = 0, jitter: Optional[Tuple[float, float]] = None,
+                 rng: Optional[Union[random.Random, int]] = None):
         """
         Initialize BackOff object.
 
@@ -17,14 +229,21 @@ class BackOff(ABC):
             jitter (Optional[Tuple[float, float]]): Tuple specifying the range for jitter (random delay on
                 top of the calculated delay), applying after the first round. If provided, it should be a
                 tuple of two numbers in sorted order. Defaults to None.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw random
+                delays from. Defaults to None, using a generator local to each thread.
 
         Raises:
-            TypeError: If `jitter` is provided and not a tuple of two numbers.
+            TypeError: If `jitter` is provided and not a tuple of two numbers, `rng` is not a generator or seed,
+                or the strategy implements neither `_compute_delay` nor `_calculate_next_delay`.
             ValueError: If the `jitter` values are not in sorted order.
         """
+        if type(self)._compute_delay is BackOff._compute_delay and not self._legacy():
+            raise TypeError(f"Can't instantiate {type(self).__name__} without an implementation of _compute_delay")
+
         self._base_delay = self._validate_base_delay(base_delay)
         self._delay = base_delay
         self._jitter = self._validate_jitter(jitter)
+        self._seed, self._rng = self._validate_rng(rng)
         self._round = 0
 
     def _validate_base_delay(self, base_delay: float) -> float:
@@ -82,6 +301,42 @@ class BackOff(ABC):
 
         return float(min_val), float(max_val)
 
+    def _validate_rng(self, rng: Optional[Union[random.Random, int]]) -> Tuple[Optional[int], Optional[random.Random]]:
+        """
+        Validate the random generator of backoff strategy.
+
+        Args:
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one.
+
+        Returns:
+            Tuple[Optional[int], Optional[random.Random]]: The seed, if one is given, and the generator of the
+                instance, or None if the thread local generator applies.
+
+        Raises:
+            TypeError: If `rng` is neither a `random.Random` instance nor an integer.
+        """
+        if rng is None or isinstance(rng, random.Random):
+            return None, rng
+
+        if not isinstance(rng, int) or isinstance(rng, bool):
+            raise TypeError("Rng must be an instance of random.Random or an integer seed.")
+
+        return rng, random.Random(rng)
+
+    def _uniform(self, low: float, high: float) -> float:
+        """
+        Draw a random delay uniformly from a range.
+
+        Args:
+            low (float): Lower bound of the range.
+            high (float): Upper bound of the range.
+
+        Returns:
+            float: The random delay.
+        """
+        rng = self._rng if self._rng is not None else _thread_random.random
+        return rng.uniform(low, high)
+
     def _validate_step(self, step: Optional[float]) -> Optional[float]:
         """
         Validate the step delay value. If step is not specified then base delay of backoff
@@ -133,12 +388,48 @@ class BackOff(ABC):
 
         return float(max)
 
-    @abstractmethod
+    def _compute_delay(self, _round: int, previous: float) -> float:
+        """
+        Compute the delay of a round of backoff, implemented by every strategy.
+
+        Strategies written against the former interface implement `_calculate_next_delay` instead,
+        advancing `_round` and `_delay` on the instance. They are still supported by running it on a
+        copy of the instance, set to the round.
+
+        Args:
+            _round (int): Zero based number of the round.
+            previous (float): Delay of the previous round, or the base delay on the first round.
+
+        Returns:
+            float: Delay of the round in seconds.
+        """
+        cursor = copy(self)
+        cursor._round = _round
+        cursor._delay = previous
+        cursor._calculate_next_delay()
+        return cursor._delay
+
+    def _legacy(self) -> bool:
+        """
+        Check whether the strategy implements `_calculate_next_delay` rather than `_compute_delay`.
+
+        Returns:
+            bool: Whether the strategy is written against the former interface, implementing
+                `_calculate_next_delay` in a subclass more derived than any `_compute_delay`.
+        """
+        for cls in type(self).__mro__:
+            if "_calculate_next_delay" in vars(cls):
+                return cls is not BackOff
+            if "_compute_delay" in vars(cls):
+                return False
+        return False
+
     def _calculate_next_delay(self):
         """
-        Abstract method to calculate the delay for the next round of backoff.
+        Calculate the next round's delay and advance the instance's cursor.
         """
-        pass
+        self._delay = self._compute_delay(self._round, self._delay)
+        self._round += 1
 
     @property
     def delay(self) -> float:
@@ -151,25 +442,266 @@ class BackOff(ABC):
         self._calculate_next_delay()
         return self._delay
 
+    def iter_delays(self) -> Iterator[float]:
+        """
+        Iterate over the delays of consecutive rounds, starting from the first round.
+
+        Each call returns a new, independent iterator and leaves the instance untouched.
+
+        Yields:
+            float: Delay of each round in seconds.
+        """
+        if self._legacy():
+            # the former interface advances a cursor of its own, kept by a copy of the instance per iterator
+            cursor = copy(self)
+            cursor._round = 0
+            cursor._delay = self._base_delay
+            while True:
+                cursor._calculate_next_delay()
+                yield cursor._delay
+
+        _round = 0
+        delay = self._base_delay
+        while True:
+            delay = self._compute_delay(_round, delay)
+            yield delay
+            _round += 1
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Check whether the delays of the strategy involve no randomness.
+
+        Returns:
+            bool: Whether every sequence of delays is the same.
+        """
+        return False
+
+    def _jitter_bound(self, upper: bool) -> float:
+        """
+        Get a bound of the jitter added to the delays.
+
+        Args:
+            upper (bool): Whether to get the upper bound rather than the lower one.
+
+        Returns:
+            float: The bound of the jitter, or 0 if there is no jitter.
+        """
+        if self._jitter is None:
+            return 0.0
+        return self._jitter[1] if upper else self._jitter[0]
+
+    def _draws(self, n: int) -> List[float]:
+        """
+        Draw random numbers uniformly from [0, 1) in bulk.
+
+        A delay drawn uniformly from [low, high) is `low + (high - low) * draw`, as with `random.uniform`,
+        so that a seeded strategy draws the same delays one at a time and in bulk.
+
+        Args:
+            n (int): Number of random numbers.
+
+        Returns:
+            List[float]: The random numbers.
+        """
+        draw = (self._rng if self._rng is not None else _thread_random.random).random
+        return [draw() for _ in range(n)]
+
+    def _jittered_schedule(self, delays: array, cap: Optional[float]) -> array:
+        """
+        Add jitter, drawn in bulk, to the delays of all rounds but the first and apply the maximum delay.
+
+        Args:
+            delays (array): Delays of consecutive rounds from the first one, modified in place.
+            cap (Optional[float]): Maximum delay of a round, or None.
+
+        Returns:
+            array: The delays.
+        """
+        if self._jitter is not None and len(delays) > 1:
+            low, high = self._jitter
+            span = high - low
+            for i, draw in enumerate(self._draws(len(delays) - 1), 1):
+                delays[i] += low + span * draw
+        if cap is not None:
+            delays = array("d", [delay if delay < cap else cap for delay in delays])
+        return delays
+
+    def _validate_rounds(self, n: int) -> int:
+        """
+        Validate a number of rounds.
+
+        Args:
+            n (int): Number of rounds.
+
+        Returns:
+            int: The validated number of rounds.
+
+        Raises:
+            TypeError: If `n` is not an integer.
+            ValueError: If `n` is negative.
+        """
+        if not isinstance(n, int):
+            raise TypeError("Number of rounds must be an integer.")
+
+        if n < 0:
+            raise ValueError("Number of rounds must be a positive integer.")
+
+        return n
+
+    def schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds at once.
+
+        Random delays are drawn in bulk. The instance is left untouched, like with `iter_delays`.
+
+        Args:
+            n (int): Number of rounds.
+
+        Returns:
+            array: Delays of the rounds in seconds, as an array of doubles.
+
+        Raises:
+            TypeError: If `n` is not an integer.
+            ValueError: If `n` is negative.
+        """
+        n = self._validate_rounds(n)
+        if self._legacy():
+            return BackOff._compute_schedule(self, n)
+        return self._compute_schedule(n)
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds, one round at a time unless overridden.
+        """
+        return array("d", islice(self.iter_delays(), n))
+
+    def total_delay(self, n: int) -> float:
+        """
+        Compute an upper bound of the total delay of the first `n` rounds, i.e. of `n` retries, in closed form.
+
+        The bound is exact for deterministic strategies, and assumes the largest random delays otherwise.
+
+        Args:
+            n (int): Number of rounds.
+
+        Returns:
+            float: Upper bound of the total delay in seconds.
+
+        Raises:
+            TypeError: If `n` is not an integer.
+            ValueError: If `n` is negative.
+            NotImplementedError: If the strategy does not bound its delays.
+        """
+        n = self._validate_rounds(n)
+        if self._legacy():
+            raise NotImplementedError(f"{type(self).__name__} does not bound its delays.")
+        return self._bound_total(n, upper=True)
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds in closed form.
+
+        Args:
+            n (int): Number of rounds.
+            upper (bool): Whether to compute the upper bound rather than the lower one.
+
+        Returns:
+            float: The bound of the total delay in seconds.
+
+        Raises:
+            NotImplementedError: If the strategy does not bound its delays.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not bound its delays.")
+
+    def max_attempts_within(self, seconds: float) -> Optional[int]:
+        """
+        Compute the maximum number of attempts, the first one included, whose delays fit within a duration.
+
+        It assumes the smallest random delays and attempts taking no time, so a `timeout` of `seconds`
+        never allows more attempts than that. The number is found by a binary search over the closed form
+        lower bound of the total delay.
+
+        Args:
+            seconds (float): Duration in seconds.
+
+        Returns:
+            Optional[int]: The maximum number of attempts, or None if it is unbounded because the smallest
+                delays tend to zero.
+
+        Raises:
+            TypeError: If `seconds` is not a number.
+            ValueError: If `seconds` is negative.
+            NotImplementedError: If the strategy does not bound its delays.
+        """
+        if not isinstance(seconds, (int, float)):
+            raise TypeError("Seconds must be a number.")
+
+        if seconds < 0:
+            raise ValueError("Seconds must be a positive number.")
+
+        if self._legacy():
+            raise NotImplementedError(f"{type(self).__name__} does not bound its delays.")
+
+        low, high = 0, 1
+        while self._bound_total(high, upper=False) <= seconds:
+            if high > 1 << 62 or (
+                high > 1 and self._bound_total(high, upper=False) == self._bound_total(high // 2, upper=False)
+            ):
+                return None
+            low, high = high, high * 2
+
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._bound_total(middle, upper=False) <= seconds:
+                low = middle
+            else:
+                high = middle
+        return low + 1
+
     def reset(self) -> None:
         """
-        Reset the current delay.
+        Reset the current delay, and re-seed the random generator if the instance was given a seed.
         """
         self._round = 0
+        self._delay = self._base_delay
+        if self._seed is not None:
+            self._rng.seed(self._seed)
 
 
 class FixedBackOff(BackOff):
     """
     Fixed backoff strategy.
     """
-    def _calculate_next_delay(self):
+    def _compute_delay(self, _round: int, previous: float) -> float:
         """
-        Calculate the next round's delay for fixed backoff strategy.
+        Compute a round's delay for fixed backoff strategy.
         """
-        self._delay = self._base_delay
-        if self._round > 0 and self._jitter:
-            self._delay += random.uniform(self._jitter[0], self._jitter[1])
-        self._round += 1
+        delay = self._base_delay
+        if _round > 0 and self._jitter:
+            delay += self._uniform(self._jitter[0], self._jitter[1])
+        return delay
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Check whether the delays of fixed backoff strategy involve no randomness, i.e. it has no jitter.
+        """
+        return self._jitter is None
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for fixed backoff strategy, drawing random delays in bulk.
+        """
+        return self._jittered_schedule(array("d", [self._base_delay]) * n, None)
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for fixed backoff strategy in closed form.
+        """
+        if n == 0:
+            return 0.0
+        return self._base_delay + _arithmetic_total(self._base_delay, 0, self._jitter_bound(upper), 1, n, None)
 
 
 class LinearBackOff(BackOff):
@@ -177,7 +709,7 @@ class LinearBackOff(BackOff):
     Linear backoff strategy.
     """
     def __init__(self, base_delay: float, step: float, jitter: Optional[Tuple[float, float]] = None,
-                 max: Optional[float] = None):
+                 max: Optional[float] = None, rng: Optional[Union[random.Random, int]] = None):
         """
         Initialize LinearBackOff object.
 
@@ -187,28 +719,55 @@ class LinearBackOff(BackOff):
             jitter (Optional[Tuple[float, float]]): Tuple specifying the range for jitter (random delay on
                 top of the calculated delay), applying after the first round. Defaults to None.
             max (Optional[float]): Maximum delay value. Defaults to None.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw jitter
+                from. Defaults to None, using a generator local to each thread.
         """
-        super().__init__(base_delay=base_delay, jitter=jitter)
+        super().__init__(base_delay=base_delay, jitter=jitter, rng=rng)
         self._step = self._validate_step(step)
         self._max = self._validate_max(max)
 
-    def _calculate_next_delay(self):
+    def _compute_delay(self, _round: int, previous: float) -> float:
         """
-        Calculate the next round's delay for linear backoff strategy.
+        Compute a round's delay for linear backoff strategy.
         """
-        self._delay = self._base_delay + self._step * self._round
-        if self._round > 0 and self._jitter:
-            self._delay += random.uniform(self._jitter[0], self._jitter[1])
+        delay = self._base_delay + self._step * _round
+        if _round > 0 and self._jitter:
+            delay += self._uniform(self._jitter[0], self._jitter[1])
         if self._max is not None:
-            self._delay = min(self._delay, self._max)
-        self._round += 1
+            delay = min(delay, self._max)
+        return delay
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Check whether the delays of linear backoff strategy involve no randomness, i.e. it has no jitter.
+        """
+        return self._jitter is None
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for linear backoff strategy, drawing random delays in bulk.
+        """
+        base_delay, step = self._base_delay, self._step
+        return self._jittered_schedule(array("d", [base_delay + step * _round for _round in range(n)]), self._max)
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for linear backoff strategy in closed form.
+        """
+        if n == 0:
+            return 0.0
+        return self._base_delay + _arithmetic_total(
+            self._base_delay, self._step, self._jitter_bound(upper), 1, n, self._max
+        )
 
 
 class RandomUniformBackOff(BackOff):
     """
     Random uniform backoff strategy.
     """
-    def __init__(self, base_delay: float, min_delay: float, max_delay: float):
+    def __init__(self, base_delay: float, min_delay: float, max_delay: float,
+                 rng: Optional[Union[random.Random, int]] = None):
         """
         Initialize RandomUniformBackOff object.
 
@@ -216,28 +775,51 @@ class RandomUniformBackOff(BackOff):
             base_delay (float): Initial delay value, applies on the first round of delay.
             min_delay (float): Minimum delay value.
             max_delay (float): Maximum delay value.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw delays
+                from. Defaults to None, using a generator local to each thread.
         """
-        super().__init__(base_delay=base_delay)
+        super().__init__(base_delay=base_delay, rng=rng)
         self._min_delay = min_delay
         self._max_delay = max_delay
 
-    def _calculate_next_delay(self):
+    def _compute_delay(self, _round: int, previous: float) -> float:
         """
-        Calculate the next round's delay for random uniform backoff strategy.
+        Compute a round's delay for random uniform backoff strategy.
         """
-        if self._round > 0:
-            self._delay = random.uniform(self._min_delay, self._max_delay)
-        self._round += 1
+        if _round > 0:
+            return self._uniform(self._min_delay, self._max_delay)
+        return self._base_delay
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for random uniform backoff strategy, drawing random delays in bulk.
+        """
+        if n == 0:
+            return array("d")
+        low, span = self._min_delay, self._max_delay - self._min_delay
+        return array("d", [self._base_delay]) + array("d", [low + span * draw for draw in self._draws(n - 1)])
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for random uniform backoff strategy in closed form.
+        """
+        if n == 0:
+            return 0.0
+        return self._base_delay + (n - 1) * (self._max_delay if upper else self._min_delay)
 
 
 class ExponentialBackOff(BackOff):
     """
     Exponential backoff strategy.
+
+    The delays stop growing at `max`, or at the longest delay a thread can sleep for without it. The
+    first round reaching it is found once with logarithms, so every later round costs the same and
+    never overflows, however long the retries go on.
     """
     DEFAULT_BASE = 2
 
     def __init__(self, base_delay: float, base: Optional[float] = None, jitter: Optional[Tuple[float, float]] = None,
-                 max: Optional[float] = None):
+                 max: Optional[float] = None, rng: Optional[Union[random.Random, int]] = None):
         """
         Initialize ExponentialBackOff object.
 
@@ -247,18 +829,209 @@ class ExponentialBackOff(BackOff):
             jitter (Optional[Tuple[float, float]]): Tuple specifying the range for jitter (random delay on
                 top of the calculated delay), applying after the first round. Defaults to None.
             max (Optional[float]): Maximum delay value. Defaults to None.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw jitter
+                from. Defaults to None, using a generator local to each thread.
         """
-        super().__init__(base_delay=base_delay, jitter=jitter)
-        self._base = base if base is not None else ExponentialBackOff.DEFAULT_BASE
+        super().__init__(base_delay=base_delay, jitter=jitter, rng=rng)
+        self._base = float(base if base is not None else ExponentialBackOff.DEFAULT_BASE)
         self._max = self._validate_max(max)
+        self._cap = self._max if self._max is not None else _SLEEP_MAX
+        self._cap_round = _exponential_cap_round(self._base_delay, self._base, self._cap)
 
-    def _calculate_next_delay(self):
+    def _compute_delay(self, _round: int, previous: float) -> float:
         """
-        Calculate the next round's delay for exponential backoff strategy.
+        Compute a round's delay for exponential backoff strategy.
         """
-        self._delay = self._base_delay * self._base**self._round
-        if self._jitter and self._round > 0:
-            self._delay += random.uniform(self._jitter[0], self._jitter[1])
-        if self._max is not None:
-            self._delay = min(self._delay, self._max)
-        self._round += 1
+        if _round >= self._cap_round:
+            delay = self._cap
+        else:
+            delay = _exponential_delay(self._base_delay, self._base, _round)
+        if self._jitter and _round > 0:
+            delay += self._uniform(self._jitter[0], self._jitter[1])
+        return min(delay, self._cap)
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Check whether the delays of exponential backoff strategy involve no randomness, i.e. it has no jitter.
+        """
+        return self._jitter is None
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for exponential backoff strategy, drawing random delays in bulk.
+        """
+        delays = _exponential_delays(self._base_delay, self._base, self._cap, self._cap_round, n)
+        return self._jittered_schedule(delays, self._cap)
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for exponential backoff strategy in closed form.
+        """
+        if n == 0:
+            return 0.0
+        return self._base_delay + _geometric_total(
+            self._base_delay, self._base, self._jitter_bound(upper), 1, n, self._cap
+        )
+
+
+class FullJitterBackOff(BackOff):
+    """
+    Full jitter backoff strategy.
+
+    Every delay is drawn uniformly between 0 and the exponential backoff delay of its round,
+    from the first round on, which spreads out clients that failed at the same moment. The exponential
+    delays are capped like with `ExponentialBackOff`.
+    """
+    def __init__(self, base_delay: float, base: Optional[float] = None, max: Optional[float] = None,
+                 rng: Optional[Union[random.Random, int]] = None):
+        """
+        Initialize FullJitterBackOff object.
+
+        Args:
+            base_delay (float): Initial delay value, the upper bound of the delay on the first round.
+            base (Optional[float]): Value to use as base for exponentiation. Defaults to 2.
+            max (Optional[float]): Maximum delay value. Defaults to None.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw delays
+                from. Defaults to None, using a generator local to each thread.
+        """
+        super().__init__(base_delay=base_delay, rng=rng)
+        self._base = float(base if base is not None else ExponentialBackOff.DEFAULT_BASE)
+        self._max = self._validate_max(max)
+        self._cap = self._max if self._max is not None else _SLEEP_MAX
+        self._cap_round = _exponential_cap_round(self._base_delay, self._base, self._cap)
+
+    def _ceiling(self, _round: int) -> float:
+        """
+        Compute the exponential backoff delay of a round, bounding the jittered delay.
+        """
+        if _round >= self._cap_round:
+            return self._cap
+        return _exponential_delay(self._base_delay, self._base, _round)
+
+    def _compute_delay(self, _round: int, previous: float) -> float:
+        """
+        Compute a round's delay for full jitter backoff strategy.
+        """
+        return self._uniform(0, self._ceiling(_round))
+
+    def _ceilings(self, n: int) -> array:
+        """
+        Compute the exponential backoff delays of the first `n` rounds, bounding the jittered delays.
+        """
+        return _exponential_delays(self._base_delay, self._base, self._cap, self._cap_round, n)
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for full jitter backoff strategy, drawing random delays in bulk.
+        """
+        return array("d", [ceiling * draw for ceiling, draw in zip(self._ceilings(n), self._draws(n))])
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for full jitter backoff strategy in closed form.
+        """
+        if not upper:
+            return 0.0
+        return _geometric_total(self._base_delay, self._base, 0, 0, n, self._cap)
+
+
+class EqualJitterBackOff(FullJitterBackOff):
+    """
+    Equal jitter backoff strategy.
+
+    Every delay keeps half of the exponential backoff delay of its round and draws the other half
+    uniformly, from the first round on, trading some spread for a guaranteed minimum delay.
+    """
+    def _compute_delay(self, _round: int, previous: float) -> float:
+        """
+        Compute a round's delay for equal jitter backoff strategy.
+        """
+        half = self._ceiling(_round) / 2
+        return half + self._uniform(0, half)
+
+    def _compute_schedule(self, n: int) -> array:
+        """
+        Compute the delays of the first `n` rounds for equal jitter backoff strategy, drawing random delays in bulk.
+        """
+        return array("d", [
+            ceiling / 2 + ceiling / 2 * draw for ceiling, draw in zip(self._ceilings(n), self._draws(n))
+        ])
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for equal jitter backoff strategy in closed form.
+        """
+        total = _geometric_total(self._base_delay, self._base, 0, 0, n, self._cap)
+        return total if upper else total / 2
+
+
+class DecorrelatedJitterBackOff(BackOff):
+    """
+    Decorrelated jitter backoff strategy.
+
+    Every delay is drawn uniformly between the base delay and a multiple of the previous delay,
+    from the first round on, so delays grow on average while each client follows its own sequence.
+    """
+    DEFAULT_MULTIPLIER = 3
+
+    def __init__(self, base_delay: float, max: Optional[float] = None, multiplier: Optional[float] = None,
+                 rng: Optional[Union[random.Random, int]] = None):
+        """
+        Initialize DecorrelatedJitterBackOff object.
+
+        Args:
+            base_delay (float): Initial delay value, the lower bound of every delay. Must be greater than zero.
+            max (Optional[float]): Maximum delay value. Defaults to None.
+            multiplier (Optional[float]): Multiple of the previous delay bounding the next one. Defaults to 3.
+            rng (Optional[Union[random.Random, int]]): Random generator, or seed of a new one, to draw delays
+                from. Defaults to None, using a generator local to each thread.
+
+        Raises:
+            ValueError: If `base_delay` is zero or `multiplier` is less than 1.
+        """
+        super().__init__(base_delay=base_delay, rng=rng)
+        if self._base_delay == 0:
+            raise ValueError("Base delay must be greater than zero for decorrelated jitter.")
+        self._max = self._validate_max(max)
+        self._cap = self._max if self._max is not None else _SLEEP_MAX
+        self._multiplier = self._validate_multiplier(multiplier)
+
+    def _validate_multiplier(self, multiplier: Optional[float]) -> float:
+        """
+        Validate the multiplier of the previous delay.
+
+        Args:
+            multiplier (Optional[float]): Multiple of the previous delay bounding the next one.
+
+        Returns:
+            float: The validated multiplier.
+
+        Raises:
+            TypeError: If `multiplier` is specified and not a number.
+            ValueError: If `multiplier` is less than 1.
+        """
+        if multiplier is None:
+            return float(DecorrelatedJitterBackOff.DEFAULT_MULTIPLIER)
+
+        if not isinstance(multiplier, (int, float)):
+            raise TypeError("Multiplier must be a number.")
+
+        if multiplier < 1:
+            raise ValueError("Multiplier must be a number equal to or greater than 1.")
+
+        return float(multiplier)
+
+    def _compute_delay(self, _round: int, previous: float) -> float:
+        """
+        Compute a round's delay for decorrelated jitter backoff strategy.
+        """
+        return min(self._uniform(self._base_delay, previous * self._multiplier), self._cap)
+
+    def _bound_total(self, n: int, upper: bool) -> float:
+        """
+        Compute a bound of the total delay of the first `n` rounds for decorrelated jitter backoff strategy in closed form.
+        """
+        if not upper:
+            return self._base_delay * n
+        return _geometric_total(self._base_delay * self._multiplier, self._multiplier, 0, 0, n, self._cap)
@@ -0,0 +1,162 @@
+import inspect
+from functools import wraps
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Type
+from ._exceptions import PartialFailureException
+from .retry import retry
+
+
+class _Batch:
+    """
+    Progress of a batch across its attempts, passed to every attempt by `retry_batch`.
+
+    Args:
+        items (Iterable[Any]): The items of the batch.
+    """
+    __slots__ = ("items", "results", "pending", "current")
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = list(items)
+        self.results = [None] * len(self.items)
+        self.pending = range(len(self.items))
+        self.current = self.items
+
+    def record(self, outcomes: Sequence[Any], fname: str, retryable: Callable[[BaseException], bool]) -> None:
+        """
+        Record the outcomes of an attempt on the pending items, keeping the failed ones pending if they are retryable.
+
+        Args:
+            outcomes (Sequence[Any]): The outcome of every pending item, in order, with an exception in place
+                of the result of each failed item.
+            fname (str): Name of the function called with the batch.
+            retryable (Callable[[BaseException], bool]): Predicate on the exception of a failed item, whether it
+                is retried.
+
+        Raises:
+            ValueError: If there is not one outcome per pending item.
+            PartialFailureException: If items failed with retryable exceptions.
+        """
+        outcomes = list(outcomes)
+        if len(outcomes) != len(self.current):
+            raise ValueError(
+                f"Function {fname} returned {len(outcomes)} outcomes for a batch of {len(self.current)} items."
+            )
+
+        pending = []
+        for index, outcome in zip(self.pending, outcomes):
+            self.results[index] = outcome
+            if isinstance(outcome, BaseException) and retryable(outcome):
+                pending.append(index)
+
+        self.pending = pending
+        if pending:
+            self.current = [self.items[index] for index in pending]
+            raise PartialFailureException(fname, list(self.results))
+
+    def finish(self, fname: str) -> List[Any]:
+        """
+        Get the results of the batch once no item is pending.
+
+        Args:
+            fname (str): Name of the function called with the batch.
+
+        Returns:
+            List[Any]: The result of every item, in order.
+
+        Raises:
+            PartialFailureException: If items failed with exceptions that are not retried.
+        """
+        if any(isinstance(result, BaseException) for result in self.results):
+            raise PartialFailureException(fname, self.results)
+        return self.results
+
+
+def retry_batch(
+    exceptions: Tuple[Type[Exception]] = (Exception,),
+    excluded_exceptions: Tuple[Type[Exception]] = (),
+    **retry_kwargs: Any
+) -> Callable:
+    """
+    Decorator that adds retry functionality to a function operating on a batch of items, retrying only
+    the items that failed.
+
+    The decorated function takes the items as its first argument and returns the outcome of every item,
+    in order, with an exception in place of the result of each failed item. The items that failed with
+    an exception from `exceptions`, and not from `excluded_exceptions`, are passed again to the next
+    attempt with the same remaining arguments, after the delay of the backoff strategy, until none is
+    left. Their results are merged in the order of the items. An exception raised by the function
+    itself fails the whole batch and is retried like with `retry`.
+
+    Attempts with failed items raise `PartialFailureException`, which is always retried. It is the last
+    exception of the retry exception raised once retries are exhausted, and the one re-raised with
+    `reraise_exception`, carrying the latest outcome of every item. Coroutine functions are supported
+    natively.
+
+    Parameters:
+        exceptions (Tuple[Type[Exception]], optional): A tuple of exception types that should trigger a retry,
+            of the whole batch or of a failed item. Defaults to (Exception,).
+        excluded_exceptions (Tuple[Type[Exception]], optional): A tuple of exception types that should not trigger
+            a retry. A failed item is then not retried, and `PartialFailureException` is raised once the other
+            items are done. Defaults to an empty tuple.
+        **retry_kwargs: The other arguments of `retry`, e.g. `max_retries` and `backoff`, except for
+            `retry_on_result`, `resume_kwarg` and `resume_token`.
+
+    Returns:
+        Callable: The decorated function, returning the result of every item in order.
+
+    Raises:
+        TypeError: If any argument has an invalid type, or is not supported for batches.
+
+    Example:
+        @retry_batch(exceptions=(ConnectionError,), max_retries=3, backoff=ExponentialBackOff(base_delay=0.1))
+        def write_records(records):
+            # Write the records, returning a result or an exception for each one
+    """
+    unsupported = sorted({"retry_on_result", "resume_kwarg", "resume_token"} & retry_kwargs.keys())
+    if unsupported:
+        raise TypeError(f"{', '.join(unsupported)} not supported by retry_batch")
+
+    if not isinstance(exceptions, tuple):
+        raise TypeError("exceptions must be a tuple")
+
+    decorator = retry(
+        exceptions=exceptions + (PartialFailureException,), excluded_exceptions=excluded_exceptions, **retry_kwargs
+    )
+
+    def retryable(exc: BaseException) -> bool:
+        return isinstance(exc, exceptions) and not isinstance(exc, excluded_exceptions)
+
+    def wrapped_func(f):
+        fname = f.__name__
+
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def async_attempt(batch, args, kwargs):
+                batch.record(await f(batch.current, *args, **kwargs), fname, retryable)
+
+            async_retried = decorator(async_attempt)
+
+            @wraps(f)
+            async def async_wrapper(items, *args, **kwargs):
+                batch = _Batch(items)
+                if batch.items:
+                    await async_retried(batch, args, kwargs)
+                return batch.finish(fname)
+
+            return async_wrapper
+
+        @wraps(f)
+        def attempt(batch, args, kwargs):
+            batch.record(f(batch.current, *args, **kwargs), fname, retryable)
+
+        retried = decorator(attempt)
+
+        @wraps(f)
+        def wrapper(items, *args, **kwargs):
+            batch = _Batch(items)
+            if batch.items:
+                retried(batch, args, kwargs)
+            return batch.finish(fname)
+
+        return wrapper
+
+    return wrapped_func
@@ -0,0 +1,96 @@
+from itertools import count
+from threading import Lock
+from typing import Optional
+
+
+class RetryBudget:
+    """
+    Retry budget shared by decorated functions, limiting retries to a ratio of successful calls.
+
+    The budget is a token bucket: every successful call deposits `ratio` tokens, up to `max_tokens`,
+    and every retry withdraws a whole token. Once the bucket is empty retries are refused until enough
+    calls succeed again, which prevents retry storms from amplifying an outage.
+
+    Deposits happen on every successful call, so they are lock free: they only advance an atomic
+    counter. The lock is taken only when withdrawing, i.e. on the retry path, where the balance is
+    settled from the counter.
+    """
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10, initial_tokens: Optional[float] = None):
+        """
+        Initialize RetryBudget object.
+
+        Args:
+            ratio (float): Tokens deposited per successful call, i.e. the ratio of retries to successful
+                calls that is sustainably allowed. Defaults to 0.1.
+            max_tokens (float): Maximum number of tokens the budget can hold, i.e. the burst of retries
+                allowed after a quiet period. Defaults to 10.
+            initial_tokens (Optional[float]): Tokens available initially. Defaults to `max_tokens`.
+
+        Raises:
+            TypeError: If any of the arguments is not a number.
+            ValueError: If any of the arguments is negative or `initial_tokens` exceeds `max_tokens`.
+        """
+        for name, value in (("Ratio", ratio), ("Max tokens", max_tokens)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"{name} must be a number.")
+            if value < 0:
+                raise ValueError(f"{name} must be a positive number.")
+
+        if initial_tokens is None:
+            initial_tokens = max_tokens
+
+        if not isinstance(initial_tokens, (int, float)):
+            raise TypeError("Initial tokens must be a number.")
+
+        if not 0 <= initial_tokens <= max_tokens:
+            raise ValueError("Initial tokens must be a positive number not greater than max tokens.")
+
+        self._ratio = float(ratio)
+        self._max_tokens = float(max_tokens)
+        self._deposits = count(1)
+        self._deposited = 0
+        self._offset = float(initial_tokens)
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """
+        Record a successful call.
+        """
+        self._deposited = next(self._deposits)
+
+    def _settle(self) -> float:
+        """
+        Compute the current balance, discarding the tokens above the maximum. Must be called with the lock held.
+
+        Returns:
+            float: Number of tokens available.
+        """
+        tokens = self._offset + self._deposited * self._ratio
+        if tokens > self._max_tokens:
+            self._offset -= tokens - self._max_tokens
+            tokens = self._max_tokens
+        return tokens
+
+    def withdraw(self) -> bool:
+        """
+        Try to withdraw a token for a retry.
+
+        Returns:
+            bool: Whether the retry is permitted.
+        """
+        with self._lock:
+            if self._settle() < 1:
+                return False
+            self._offset -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        """
+        Get the number of tokens available.
+
+        Returns:
+            float: Number of tokens available.
+        """
+        with self._lock:
+            return self._settle()
@@ -1,53 +1,120 @@
-from functools import wraps
-from typing import Callable
+from concurrent.futures import Executor, Future
+from functools import partial, update_wrapper, wraps
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import inspect
 
 
+def _bind_arguments(
+    func: Callable, args: Tuple, kwargs: Dict[str, Any]
+) -> Tuple[Tuple, Dict[str, Any], Optional[Tuple[str, ...]]]:
+    """
+    Bind the stored arguments of a callback to its signature once, at creation.
+
+    Positional arguments are turned into keyword arguments, so that they can be overridden by name
+    when calling, unless they are bound to positional-only or variadic positional parameters, in which
+    case all of them stay positional. Callables without an inspectable signature keep their arguments as given.
+
+    Args:
+        func (Callable): The callable function to be wrapped.
+        args (Tuple): Positional arguments to be passed to the function.
+        kwargs (Dict[str, Any]): Keyword arguments to be passed to the function.
+
+    Returns:
+        Tuple[Tuple, Dict[str, Any], Optional[Tuple[str, ...]]]: The positional and keyword arguments to call
+            the function with, and the names of the parameters left free for the positional arguments given
+            when calling, or None if these follow the stored ones as they are.
+
+    Raises:
+        TypeError: If the arguments do not match the signature of the function.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return args, kwargs, None
+
+    bound = signature.bind_partial(*args, **kwargs)
+    kinds = {signature.parameters[name].kind for name in bound.arguments}
+    if kinds & {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.VAR_POSITIONAL}:
+        return bound.args, bound.kwargs, None
+
+    named = {
+        name: value for name, value in bound.arguments.items()
+        if signature.parameters[name].kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+    }
+    free = None
+    if named:
+        free = tuple(
+            name for name, parameter in signature.parameters.items()
+            if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD and name not in named
+        )
+    return (), {**named, **bound.kwargs}, free
+
+
+def _bind_free(free: Tuple[str, ...], args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Tuple, Dict[str, Any]]:
+    """
+    Bind the positional arguments given when calling a callback to the parameters left free by its stored arguments.
+
+    Args:
+        free (Tuple[str, ...]): Names of the parameters left free by the stored arguments.
+        args (Tuple): Positional arguments given when calling, such as the retry state.
+        kwargs (Dict[str, Any]): Keyword arguments given when calling.
+
+    Returns:
+        Tuple[Tuple, Dict[str, Any]]: The positional arguments left over, and the keyword arguments.
+    """
+    names = [name for name in free if name not in kwargs]
+    return args[len(names):], {**dict(zip(names, args)), **kwargs}
+
+
 class CallbackFactory():
     def __init__(self, func: Callable, *args, **kwargs):
         """
         Initialize the CallbackFactory.
 
+        The arguments are bound to the signature of `func` once, so calling the factory costs
+        a single call of a precompiled partial, without merging arguments unless overridden.
+
         Parameters:
             func (Callable): The callable function to be wrapped.
             *args: Positional arguments to be passed to the function.
             **kwargs: Keyword arguments to be passed to the function.
 
         Raises:
-            TypeError: If `func` is not a callable object.
+            TypeError: If `func` is not a callable object, or the arguments do not match its signature.
         """
         if not callable(func):
             raise TypeError("The 'func' argument must be callable")
 
         self.func = func
-        self.kwargs = kwargs
-
-        if len(args) > 0:
-            func_args = inspect.getfullargspec(func).args
-            self.kwargs.update(
-                {
-                    func_args[i]: a
-                    for i, a in enumerate(args)
-                }
-            )
+        self.args, self.kwargs, self._free = _bind_arguments(func, args, kwargs)
+        self._call = partial(func, *self.args, **self.kwargs) if self.args or self.kwargs else func
 
-    def __call__(self, **override_kwargs):
+    def __call__(self, *args, **override_kwargs):
         """
         Call the wrapped function with provided keyword arguments.
         If no arguments are provided during calling,
         then the stored ones (during instance creation) are used.
+        Positional arguments provided during calling, such as the retry state,
+        are passed after the stored positional ones, if any, binding the
+        parameters the stored arguments leave free in order.
 
         Returns:
             The result of calling the wrapped function with provided arguments.
         """
-        runtime_kwargs = {**self.kwargs, **override_kwargs}
-        return self.func(**runtime_kwargs)
+        if args and self._free is not None:
+            args, override_kwargs = _bind_free(self._free, args, override_kwargs)
+        return self._call(*args, **override_kwargs)
 
 
 def callback_factory(func: Callable, *args, **kwargs):
     """
     Create a callback function that wraps the provided callable function.
 
+    The arguments are bound to the signature of `func` once, and the callback is
+    a precompiled partial of it, merging arguments only when they are overridden.
+
     Parameters:
         func (Callable): The callable function to be wrapped.
         *args: Positional arguments to be passed to the function.
@@ -58,22 +125,201 @@ def callback_factory(func: Callable, *args, **kwargs):
         callable function with the specified arguments.
 
     Raises:
-        TypeError: If `func` is not a callable object.
+        TypeError: If `func` is not a callable object, or the arguments do not match its signature.
     """
     if not callable(func):
         raise TypeError("The 'func' argument must be callable")
 
-    if len(args) > 0:
-        func_args = inspect.getfullargspec(func).args
-        kwargs.update(
-            {
-                func_args[i]: a
-                for i, a in enumerate(args)
-            }
-        )
+    args, kwargs, free = _bind_arguments(func, args, kwargs)
+    call = partial(func, *args, **kwargs)
+    if free is None:
+        return update_wrapper(call, func)
 
     @wraps(func)
-    def wrapped_func(**override_kwargs):
-        runtime_kwargs = {**kwargs, **override_kwargs}
-        return func(**runtime_kwargs)
+    def wrapped_func(*call_args, **override_kwargs):
+        if call_args:
+            call_args, override_kwargs = _bind_free(free, call_args, override_kwargs)
+        return call(*call_args, **override_kwargs)
     return wrapped_func
+
+
+def _is_coroutine_callback(callback: Callable) -> bool:
+    """
+    Check whether a callback is a coroutine function, directly or wrapped by `CallbackFactory`.
+
+    Args:
+        callback (Callable): The callback to check.
+
+    Returns:
+        bool: Whether calling the callback returns a coroutine.
+    """
+    if isinstance(callback, CallbackFactory):
+        callback = callback.func
+    return inspect.iscoroutinefunction(inspect.unwrap(callback))
+
+
+class CallbackDispatcher(Executor):
+    """
+    Bounded executor running callbacks on background threads, off the critical path of the decorated functions.
+
+    Callbacks are queued up to `max_queue_size` and run by up to `max_workers` daemon threads, started on
+    the first submission. When the queue is full, `overflow` decides what happens to a new callback:
+    `CallbackDispatcher.DROP` drops it, `CallbackDispatcher.DROP_OLDEST` drops the oldest queued one
+    instead, and `CallbackDispatcher.BLOCK` waits for room in the queue. The future of a dropped
+    callback is cancelled.
+    """
+    DROP = "drop"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+    def __init__(self, max_workers: int = 1, max_queue_size: int = 1000, overflow: str = DROP):
+        """
+        Initialize CallbackDispatcher object.
+
+        Args:
+            max_workers (int): Number of threads running the callbacks. Defaults to 1.
+            max_queue_size (int): Number of callbacks that can wait for a thread. Defaults to 1000.
+            overflow (str): Policy applied to callbacks submitted while the queue is full, one of
+                `CallbackDispatcher.DROP`, `CallbackDispatcher.DROP_OLDEST` or `CallbackDispatcher.BLOCK`.
+                Defaults to `CallbackDispatcher.DROP`.
+
+        Raises:
+            TypeError: If any of the arguments has an invalid type.
+            ValueError: If any of the arguments has an invalid value.
+        """
+        for name, value in (("Max workers", max_workers), ("Max queue size", max_queue_size)):
+            if not isinstance(value, int):
+                raise TypeError(f"{name} must be an integer.")
+            if value < 1:
+                raise ValueError(f"{name} must be a positive integer.")
+
+        if overflow not in (CallbackDispatcher.DROP, CallbackDispatcher.DROP_OLDEST, CallbackDispatcher.BLOCK):
+            raise ValueError("Overflow must be one of 'drop', 'drop_oldest' or 'block'.")
+
+        self._max_workers = max_workers
+        self._overflow = overflow
+        self._queue = Queue(maxsize=max_queue_size)
+        self._threads: List[Thread] = []
+        self._dropped = 0
+        self._shutdown = False
+        self._lock = Lock()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Get the number of callbacks dropped because the queue was full.
+
+        Returns:
+            int: Number of dropped callbacks.
+        """
+        return self._dropped
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Schedule a callback to run on a background thread.
+
+        Args:
+            fn (Callable): The callback.
+            *args: Positional arguments to be passed to the callback.
+            **kwargs: Keyword arguments to be passed to the callback.
+
+        Returns:
+            Future: The future of the callback, cancelled if the callback is dropped.
+
+        Raises:
+            RuntimeError: If the dispatcher has been shut down.
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot schedule new callbacks after shutdown.")
+        if len(self._threads) < self._max_workers:
+            self._start_worker()
+
+        future = Future()
+        item = (future, fn, args, kwargs)
+        if self._overflow == CallbackDispatcher.BLOCK:
+            self._queue.put(item)
+            return future
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return future
+            except Full:
+                if self._overflow == CallbackDispatcher.DROP:
+                    return self._drop(future)
+            try:
+                self._drop(self._queue.get_nowait()[0])
+            except Empty:
+                pass
+
+    def _drop(self, future: Future) -> Future:
+        """
+        Drop a callback, cancelling its future.
+
+        Args:
+            future (Future): The future of the dropped callback.
+
+        Returns:
+            Future: The cancelled future.
+        """
+        with self._lock:
+            self._dropped += 1
+        future.cancel()
+        return future
+
+    def _start_worker(self) -> None:
+        """
+        Start a worker thread, unless enough of them have already been started.
+        """
+        with self._lock:
+            if len(self._threads) >= self._max_workers:
+                return
+            thread = Thread(target=self._work, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        """
+        Run the queued callbacks until a shutdown sentinel is received.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stop accepting callbacks and stop the worker threads once the queued callbacks have run.
+
+        Args:
+            wait (bool): Whether to wait for the queued callbacks to run. Defaults to True.
+            cancel_futures (bool): Whether to cancel the queued callbacks instead of running them.
+                Defaults to False.
+        """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,168 @@
+from collections import deque
+from threading import Lock
+from typing import Optional
+from ._clock import Clock, monotonic_clock
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that short-circuits calls to a failing dependency.
+
+    The breaker starts closed, letting every call through. It opens after `failure_threshold`
+    consecutive failures or, if `failure_rate` is given, once the failure rate over the last `window`
+    calls reaches it. While open, calls are refused. After `recovery_timeout` seconds it turns half-open
+    and lets a single probe call through: a success closes it again, a failure opens it again. A probe
+    that reports no outcome within `recovery_timeout` seconds is replaced by a new one.
+
+    Reading and recording outcomes while closed takes no lock, which is the common case; state
+    transitions happen under a lock.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30,
+                 failure_rate: Optional[float] = None, window: int = 20, clock: Clock = monotonic_clock):
+        """
+        Initialize CircuitBreaker object.
+
+        Args:
+            failure_threshold (int): Number of consecutive failures opening the breaker or, with `failure_rate`,
+                the minimum number of calls in the window before the rate is considered. Defaults to 5.
+            recovery_timeout (float): Time in seconds the breaker stays open before letting a probe call through.
+                Defaults to 30.
+            failure_rate (Optional[float]): Failure rate, between 0 and 1, over the last `window` calls opening
+                the breaker. Defaults to None, opening on consecutive failures instead.
+            window (int): Number of most recent calls the failure rate is computed over. Defaults to 20.
+            clock (Clock): Clock used to measure the recovery timeout. Defaults to a monotonic clock.
+
+        Raises:
+            TypeError: If any of the arguments has an invalid type.
+            ValueError: If any of the arguments has an invalid value.
+        """
+        if not isinstance(failure_threshold, int):
+            raise TypeError("Failure threshold must be an integer.")
+
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be a positive integer.")
+
+        if not isinstance(recovery_timeout, (int, float)):
+            raise TypeError("Recovery timeout must be a number.")
+
+        if recovery_timeout < 0:
+            raise ValueError("Recovery timeout must be a positive number.")
+
+        if failure_rate is not None:
+            if not isinstance(failure_rate, (int, float)):
+                raise TypeError("Failure rate must be a number.")
+            if not 0 < failure_rate <= 1:
+                raise ValueError("Failure rate must be within (0, 1].")
+
+        if not isinstance(window, int):
+            raise TypeError("Window must be an integer.")
+
+        if window < failure_threshold:
+            raise ValueError("Window must be equal to or greater than the failure threshold.")
+
+        if not callable(clock):
+            raise TypeError("Clock must be a callable.")
+
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = float(recovery_timeout)
+        self._failure_rate = failure_rate
+        self._outcomes = deque(maxlen=window)
+        self._clock = clock
+        self._state = CircuitBreaker.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_at = 0.0
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Get the current state of the breaker.
+
+        Returns:
+            str: One of `CircuitBreaker.CLOSED`, `CircuitBreaker.OPEN` or `CircuitBreaker.HALF_OPEN`.
+        """
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Check whether the breaker refuses calls and will keep doing so until its recovery timeout elapses.
+
+        Returns:
+            bool: Whether the breaker is open.
+        """
+        return self._state == CircuitBreaker.OPEN and self._clock() - self._opened_at < self._recovery_timeout
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go through, taking the probe slot if the breaker is half-open.
+
+        Returns:
+            bool: Whether the call is permitted.
+        """
+        if self._state == CircuitBreaker.CLOSED:
+            return True
+
+        with self._lock:
+            now = self._clock()
+            if self._state == CircuitBreaker.CLOSED:
+                return True
+            if self._state == CircuitBreaker.OPEN:
+                if now - self._opened_at < self._recovery_timeout:
+                    return False
+                self._state = CircuitBreaker.HALF_OPEN
+            elif now - self._probe_at < self._recovery_timeout:
+                return False
+            self._probe_at = now
+            return True
+
+    def record_success(self) -> None:
+        """
+        Record a successful call, closing the breaker if it is not closed.
+        """
+        if self._state == CircuitBreaker.CLOSED:
+            self._consecutive_failures = 0
+            if self._failure_rate is not None:
+                self._outcomes.append(False)
+            return
+
+        with self._lock:
+            self._state = CircuitBreaker.CLOSED
+            self._consecutive_failures = 0
+            self._outcomes.clear()
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call, opening the breaker if its failure condition is met.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.OPEN:
+                return
+            if self._state == CircuitBreaker.HALF_OPEN:
+                self._open()
+                return
+
+            self._consecutive_failures += 1
+            if self._failure_rate is None:
+                if self._consecutive_failures >= self._failure_threshold:
+                    self._open()
+                return
+
+            self._outcomes.append(True)
+            calls = len(self._outcomes)
+            if calls >= self._failure_threshold and sum(self._outcomes) / calls >= self._failure_rate:
+                self._open()
+
+    def _open(self) -> None:
+        """
+        Open the breaker. Must be called with the lock held.
+        """
+        self._state = CircuitBreaker.OPEN
+        self._opened_at = self._clock()
+        self._consecutive_failures = 0
+        self._outcomes.clear()
@@ -0,0 +1,223 @@
+import asyncio
+import inspect
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import wraps
+from typing import Callable, Iterator, List, Optional, Tuple, Type, Union
+from ._attempt import _consume_outcome, _submit_daemon
+from ._clock import Clock, monotonic_clock
+from ._exceptions import MaxRetriesException
+from ._logging import _log_failure
+from ._validate import _validate_hedge_args
+from .backoff import BackOff, FixedBackOff
+from .retry import retry_logger
+
+
+class _LatencyTracker:
+    """
+    Running window of the latencies of successful attempts, used to derive hedge delays.
+
+    Recording a latency is an atomic append, while the percentile is cached and recomputed
+    only every `window // 10` new samples, so reading it stays cheap on every call.
+
+    Args:
+        percentile (float): Percentile of the latencies to track, between 0 and 100.
+        window (int): Number of most recent latencies to keep.
+        min_samples (int): Number of latencies required before a percentile is available.
+    """
+
+    def __init__(self, percentile: float, window: int = 100, min_samples: int = 10) -> None:
+        self._percentile = percentile
+        self._latencies = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._refresh_every = max(1, window // 10)
+        self._pending = 0
+        self._value = None
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a successful attempt.
+
+        Args:
+            latency (float): Latency in seconds.
+        """
+        self._latencies.append(latency)
+        self._pending += 1
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        Get the tracked percentile of the recorded latencies.
+
+        Returns:
+            Optional[float]: The percentile in seconds, or None if not enough latencies have been recorded.
+        """
+        if self._pending >= self._refresh_every or (self._value is None and self._pending):
+            latencies = sorted(self._latencies)
+            self._pending = 0
+            if len(latencies) >= self._min_samples:
+                index = min(len(latencies) - 1, int(len(latencies) * self._percentile / 100))
+                self._value = latencies[index]
+        return self._value
+
+
+def hedge(
+    exceptions: Tuple[Type[Exception]] = (Exception,),
+    excluded_exceptions: Tuple[Type[Exception]] = (),
+    max_retries: int = 1,
+    backoff: BackOff = FixedBackOff(base_delay=0.1),
+    percentile: Union[float, None] = None,
+    logger: Union[logging.Logger, None] = retry_logger,
+    reraise_exception: bool = False,
+    clock: Clock = monotonic_clock
+) -> Callable:
+    """
+    Decorator that adds hedging to a function: instead of waiting for an attempt to fail, duplicate
+    attempts are started after a hedge delay and the first one to succeed wins.
+
+    The remaining attempts are cancelled for coroutine functions, and abandoned for functions, whose
+    attempts run in worker threads. Hedging is meant for idempotent calls only.
+
+    Parameters:
+        exceptions (Tuple[Type[Exception]], optional): A tuple of exception types that count as a failed attempt,
+            starting the next hedged attempt right away. Defaults to (Exception,).
+        excluded_exceptions (Tuple[Type[Exception]], optional): A tuple of exception types that are raised
+            immediately, dropping any other attempt in flight. Defaults to an empty tuple.
+        max_retries (int, optional): The maximum number of hedged attempts on top of the first one, which is
+            also the cap of concurrent attempts minus one. Defaults to 1.
+        backoff (BackOff, optional): The backoff strategy spacing out consecutive attempts.
+            Defaults to FixedBackOff(base_delay=0.1) with base_delay referring to seconds.
+        percentile (float, optional): If given, the hedge delay is the running percentile (0 to 100) of the
+            latencies of successful attempts instead, once enough of them have been observed. The backoff
+            strategy applies until then. Defaults to None.
+        logger (logging.Logger, optional): The logger instance to use for logging hedged attempts.
+            Defaults to retry_logger.
+        reraise_exception (bool, optional): Whether to re-raise the last exception caught if all attempts fail.
+            Defaults to False.
+        clock (Callable[[], float], optional): The clock used to measure attempt latencies.
+            Defaults to a monotonic high resolution clock.
+
+    Returns:
+        Callable: The decorated function.
+
+    Raises:
+        TypeError: If any argument has an invalid type.
+        ValueError: If any argument has an invalid value.
+
+    Example:
+        @hedge(max_retries=2, percentile=95)
+        def read_replica():
+            # Function body
+    """
+
+    _validate_hedge_args(
+        exceptions, excluded_exceptions, max_retries, backoff, percentile,
+        logger, reraise_exception, clock
+    )
+
+    target_exceptions = tuple(set(exceptions) - set(excluded_exceptions))
+
+    if not target_exceptions:
+        target_exceptions = (Exception,)
+
+    def wrapped_func(f):
+        fname = f.__name__
+        tracker = _LatencyTracker(percentile) if percentile is not None else None
+
+        def hedge_delays() -> Iterator[float]:
+            for delay in backoff.iter_delays():
+                observed = tracker.value if tracker is not None else None
+                yield observed if observed is not None else delay
+
+        def on_failures(failures: List[BaseException], exhausted: bool, launched: int, start_time: float) -> None:
+            for exc in failures:
+                if not isinstance(exc, target_exceptions) or isinstance(exc, excluded_exceptions):
+                    raise exc
+            if failures and exhausted:
+                if reraise_exception:
+                    raise failures[-1]
+                error = MaxRetriesException(
+                    fname=fname,
+                    max_retries=max_retries,
+                    attempts=launched,
+                    elapsed=clock() - start_time,
+                    last_exception=failures[-1],
+                )
+                _log_failure(logger, error)
+                raise error from failures[-1]
+
+        def log_hedge(delay: float, in_flight: int) -> None:
+            if logger:
+                logger.info(
+                    "Hedging function %s, no attempt completed within %s secs. Attempts in flight: %s.",
+                    fname, delay, in_flight
+                )
+
+        if inspect.iscoroutinefunction(f):
+            async def async_timed_attempt(args, kwargs):
+                started = clock()
+                result = await f(*args, **kwargs)
+                if tracker is not None:
+                    tracker.record(clock() - started)
+                return result
+
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                start_time = clock()
+                delays = hedge_delays()
+                pending = {asyncio.ensure_future(async_timed_attempt(args, kwargs))}
+                launched = 1
+                try:
+                    while True:
+                        delay = next(delays) if launched <= max_retries else None
+                        done, pending = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                        if not done:
+                            log_hedge(delay, len(pending))
+                        failures = []
+                        for task in done:
+                            if task.exception() is None:
+                                return task.result()
+                            failures.append(task.exception())
+                        on_failures(failures, launched > max_retries and not pending, launched, start_time)
+                        if launched <= max_retries:
+                            pending.add(asyncio.ensure_future(async_timed_attempt(args, kwargs)))
+                            launched += 1
+                finally:
+                    for task in pending:
+                        task.cancel()
+                        task.add_done_callback(_consume_outcome)
+
+            return async_wrapper
+
+        def timed_attempt(args, kwargs):
+            started = clock()
+            result = f(*args, **kwargs)
+            if tracker is not None:
+                tracker.record(clock() - started)
+            return result
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            start_time = clock()
+            delays = hedge_delays()
+            pending = {_submit_daemon(timed_attempt, (args, kwargs), {})}
+            launched = 1
+            while True:
+                delay = next(delays) if launched <= max_retries else None
+                done, pending = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+                if not done:
+                    log_hedge(delay, len(pending))
+                failures = []
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    failures.append(future.exception())
+                on_failures(failures, launched > max_retries and not pending, launched, start_time)
+                if launched <= max_retries:
+                    pending.add(_submit_daemon(timed_attempt, (args, kwargs), {}))
+                    launched += 1
+
+        return wrapper
+
+    return wrapped_func
@@ -0,0 +1,401 @@
+import asyncio
+import heapq
+import inspect
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import count
+from time import monotonic, sleep
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from ._retrier import _Retrier, _ResultRetriesExhausted, _make_retrier
+from ._validate import _validate_args
+from .retry import retry
+
+
+class _Item:
+    """
+    Progress of a single item of `retry_map` across its attempts.
+
+    It mirrors the retry wrappers around each attempt, while the coordinator running the attempts
+    decides when they start, so that an item waiting for its backoff delay never takes a worker.
+
+    Args:
+        index (int): Position of the item in the iterable.
+        value (Any): The item, passed to the function.
+    """
+    __slots__ = ("index", "value", "start_time", "state", "delays")
+
+    def __init__(self, index: int, value: Any) -> None:
+        self.index = index
+        self.value = value
+        self.start_time = None
+        self.state = None
+        self.delays = None
+
+    def start(self, retrier: _Retrier) -> None:
+        """
+        Prepare the first attempt.
+
+        Raises:
+            CircuitOpenException: If the circuit breaker refuses the attempt.
+        """
+        if retrier.circuit_breaker is not None:
+            retrier.check_circuit(None)
+        self.start_time = retrier.clock() if retrier.timed else None
+
+    def restart(self, retrier: _Retrier) -> None:
+        """
+        Prepare a retry once its backoff delay has elapsed.
+
+        Raises:
+            RetriesTimeoutException: If the timeout has been exceeded.
+            CircuitOpenException: If the circuit breaker refuses the attempt.
+        """
+        self.state.attempts += 1
+        retrier.check_timeout(self.state)
+        retrier.check_circuit(self.state)
+
+    def settle(self, retrier: _Retrier, result: Any, exc: Optional[Exception]) -> Optional[float]:
+        """
+        Handle the outcome of an attempt.
+
+        Args:
+            retrier (_Retrier): The retrier of the function.
+            result (Any): The result of the attempt, if it did not raise.
+            exc (Optional[Exception]): The exception raised by the attempt if it is retryable, or None.
+
+        Returns:
+            Optional[float]: The delay in seconds before retrying the item, or None if `result` is its result.
+
+        Raises:
+            Exception: The error ending the retries of the item, as raised by `retry`.
+        """
+        if exc is None and (retrier.retry_on_result is None or not retrier.retry_on_result(result)):
+            if retrier.deadline:
+                retrier.check_deadline(self.start_time, self.state)
+            if self.state is not None or retrier.tracked:
+                retrier.on_success(self.state)
+            return None
+
+        if self.state is None:
+            self.state = retrier.new_state(self.start_time, 1)
+            self.start_time = self.state.start_time
+            self.delays = retrier.iter_delays()
+        if exc is None:
+            return retrier.on_result(self.state, result, self.delays)
+        return retrier.on_failure(self.state, exc, self.delays)
+
+
+class _Outcomes:
+    """
+    Outcomes of the items of `retry_map`, released in the order of the items or as they complete.
+
+    Args:
+        ordered (bool): Whether to release the outcomes in the order of the items.
+        return_exceptions (bool): Whether to release the errors of failed items as values instead of raising them.
+    """
+
+    def __init__(self, ordered: bool, return_exceptions: bool) -> None:
+        self._ordered = ordered
+        self._return_exceptions = return_exceptions
+        self._completed: Dict[int, Tuple[bool, Any]] = {}
+        self._next = 0
+        self._ready = deque()
+
+    def add(self, index: int, ok: bool, value: Any) -> None:
+        """
+        Record the outcome of an item.
+
+        Args:
+            index (int): Position of the item in the iterable.
+            ok (bool): Whether the item succeeded.
+            value (Any): The result of the item, or the error ending its retries.
+        """
+        if not self._ordered:
+            self._ready.append((ok, value))
+            return
+
+        self._completed[index] = (ok, value)
+        while self._next in self._completed:
+            self._ready.append(self._completed.pop(self._next))
+            self._next += 1
+
+    def release(self) -> Iterator[Any]:
+        """
+        Release the outcomes that are ready.
+
+        Yields:
+            Any: The result of an item, or its error with `return_exceptions`.
+
+        Raises:
+            Exception: The error of a failed item, without `return_exceptions`.
+        """
+        while self._ready:
+            ok, value = self._ready.popleft()
+            if not ok and not self._return_exceptions:
+                raise value
+            yield value
+
+
+def retry_map(
+    func: Callable,
+    iterable: Iterable[Any],
+    concurrency: int = 4,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+    **retry_kwargs: Any
+) -> Union[Iterator[Any], AsyncIterator[Any]]:
+    """
+    Apply a function to every item of an iterable concurrently, retrying each item like `retry` does.
+
+    Attempts of a function run in a pool of `concurrency` worker threads, while a coordinator keeps the
+    items waiting for their backoff delay in a heap, starting their retries once they are due. A worker
+    is therefore never blocked by a backoff delay and keeps serving the other items. Retries that are
+    due start before new items, which are pulled from the iterable only when a worker is free.
+
+    A coroutine function is supported natively: an async iterator is returned instead, running at most
+    `concurrency` attempts at once under a semaphore, which is released during backoff delays. The
+    iterable may then be an async iterable too.
+
+    Parameters:
+        func (Callable): The function or coroutine function to apply, taking an item as its single argument.
+        iterable (Iterable[Any]): The items.
+        concurrency (int, optional): The maximum number of attempts running at once. Defaults to 4.
+        ordered (bool, optional): Whether to yield the results in the order of the items, rather than as they
+            complete. Defaults to True.
+        return_exceptions (bool, optional): Whether to yield the error ending the retries of a failed item in
+            place of its result. Defaults to False, raising the error and cancelling the remaining items.
+        **retry_kwargs: The arguments of `retry`, e.g. `max_retries` and `backoff`, applying to each item,
+            except for `resume_kwarg` and `resume_token`.
+
+    Returns:
+        Union[Iterator[Any], AsyncIterator[Any]]: The results of the items.
+
+    Raises:
+        TypeError: If any argument has an invalid type, or is not supported for mapping.
+        ValueError: If `concurrency` is not a positive integer.
+
+    Example:
+        for page in retry_map(fetch_page, urls, concurrency=8, max_retries=3, backoff=FullJitterBackOff(0.1)):
+            # Process the pages in order
+    """
+    if not callable(func):
+        raise TypeError("func must be a callable")
+
+    if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+        raise TypeError("Generator functions are not supported by retry_map")
+
+    if not isinstance(concurrency, int):
+        raise TypeError("concurrency must be an integer")
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+
+    if not isinstance(ordered, bool):
+        raise TypeError("ordered must be a boolean")
+
+    if not isinstance(return_exceptions, bool):
+        raise TypeError("return_exceptions must be a boolean")
+
+    unsupported = sorted({"resume_kwarg", "resume_token"} & retry_kwargs.keys())
+    if unsupported:
+        raise TypeError(f"{', '.join(unsupported)} not supported by retry_map")
+
+    # the arguments of retry left out take its defaults
+    try:
+        arguments = inspect.signature(retry).bind(**retry_kwargs)
+    except TypeError as error:
+        raise TypeError(f"Invalid argument of retry_map: {error}") from None
+    arguments.apply_defaults()
+    _validate_args(**arguments.arguments)
+    retrier = _make_retrier(func, **arguments.arguments)
+    outcomes = _Outcomes(ordered, return_exceptions)
+
+    if inspect.iscoroutinefunction(func):
+        return _map_async(retrier, func, iterable, concurrency, outcomes)
+    return _map(retrier, func, iterable, concurrency, outcomes)
+
+
+def _map(retrier: _Retrier, func: Callable, iterable: Iterable[Any], concurrency: int,
+         outcomes: _Outcomes) -> Iterator[Any]:
+    """
+    Coordinate the attempts of a function over the items in a thread pool, see `retry_map`.
+    """
+    target_exceptions = retrier.target_exceptions
+    bounded = retrier.bounded
+    items = enumerate(iterable)
+    exhausted = False
+    running: Dict[Future, _Item] = {}
+    waiting: List[Tuple[float, int, _Item]] = []
+    sequence = count()
+
+    def attempt(item):
+        if bounded:
+            return retrier.call(func, (item.value,), {}, item.start_time, item.state)
+        return func(item.value)
+
+    def submit(item, first):
+        try:
+            if first:
+                item.start(retrier)
+            else:
+                item.restart(retrier)
+        except _ResultRetriesExhausted as exhausted_result:
+            outcomes.add(item.index, True, exhausted_result.result)
+        except Exception as error:
+            outcomes.add(item.index, False, error)
+        else:
+            running[executor.submit(attempt, item)] = item
+
+    def settle(item, future):
+        try:
+            try:
+                result, exc = future.result(), None
+            except target_exceptions as original_exc:
+                result, exc = None, original_exc
+            delay = item.settle(retrier, result, exc)
+        except _ResultRetriesExhausted as exhausted_result:
+            outcomes.add(item.index, True, exhausted_result.result)
+        except Exception as error:
+            outcomes.add(item.index, False, error)
+        else:
+            if delay is None:
+                outcomes.add(item.index, True, result)
+            else:
+                heapq.heappush(waiting, (monotonic() + delay, next(sequence), item))
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        while True:
+            now = monotonic()
+            while waiting and len(running) < concurrency and waiting[0][0] <= now:
+                submit(heapq.heappop(waiting)[2], first=False)
+            while not exhausted and len(running) < concurrency:
+                try:
+                    index, value = next(items)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    submit(_Item(index, value), first=True)
+            yield from outcomes.release()
+
+            if not running and not waiting:
+                if exhausted:
+                    return
+                continue
+
+            if waiting and len(running) < concurrency:
+                timeout = max(waiting[0][0] - monotonic(), 0)
+            else:
+                timeout = None
+            if not running:
+                sleep(timeout)
+                continue
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                settle(running.pop(future), future)
+            yield from outcomes.release()
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _map_async(retrier: _Retrier, func: Callable, iterable: Union[Iterable[Any], AsyncIterator[Any]],
+                     concurrency: int, outcomes: _Outcomes) -> AsyncIterator[Any]:
+    """
+    Coordinate the attempts of a coroutine function over the items under a semaphore, see `retry_map`.
+    """
+    target_exceptions = retrier.target_exceptions
+    bounded = retrier.bounded
+    semaphore = asyncio.Semaphore(concurrency)
+    settled = asyncio.Queue()
+    tasks = set()
+
+    async def attempt(item):
+        if bounded:
+            return await retrier.call_async(func, (item.value,), {}, item.start_time, item.state)
+        return await func(item.value)
+
+    async def run(item):
+        # the semaphore is acquired before every attempt and released during backoff delays
+        try:
+            item.start(retrier)
+        except BaseException:
+            semaphore.release()
+            raise
+        while True:
+            try:
+                result, exc = await attempt(item), None
+            except asyncio.CancelledError:
+                raise
+            except target_exceptions as original_exc:
+                result, exc = None, original_exc
+            finally:
+                semaphore.release()
+
+            delay = item.settle(retrier, result, exc)
+            if delay is None:
+                return result
+            await asyncio.sleep(delay)
+
+            await semaphore.acquire()
+            try:
+                item.restart(retrier)
+            except BaseException:
+                semaphore.release()
+                raise
+
+    async def settle(item):
+        try:
+            outcome = True, await run(item)
+        except asyncio.CancelledError:
+            raise
+        except _ResultRetriesExhausted as exhausted_result:
+            outcome = True, exhausted_result.result
+        except Exception as error:
+            outcome = False, error
+        settled.put_nowait((item.index, *outcome))
+
+    def start(item):
+        task = asyncio.ensure_future(settle(item))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def feed():
+        # new items are started only once an attempt can run, the number of items is put last
+        index = 0
+        try:
+            if hasattr(iterable, "__aiter__"):
+                async for value in iterable:
+                    await semaphore.acquire()
+                    start(_Item(index, value))
+                    index += 1
+            else:
+                for value in iterable:
+                    await semaphore.acquire()
+                    start(_Item(index, value))
+                    index += 1
+        except Exception as error:
+            settled.put_nowait((None, False, error))
+        else:
+            settled.put_nowait((None, True, index))
+
+    feeder = asyncio.ensure_future(feed())
+    total = None
+    received = 0
+    try:
+        while total is None or received < total:
+            index, ok, value = await settled.get()
+            if index is None:
+                if not ok:
+                    raise value
+                total = value
+                continue
+            received += 1
+            outcomes.add(index, ok, value)
+            for result in outcomes.release():
+                yield result
+    finally:
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
@@ -1,17 +1,18 @@
+import asyncio
+import inspect
 import logging
-from copy import deepcopy
 from time import sleep
+from concurrent.futures import Executor
 from functools import wraps
-from typing import Union, Callable, Tuple, Type
-from time import time
+from typing import Any, Union, Callable, Tuple, Type
 from ._validate import _validate_args
-from ._logging import _init_logger, _log_retry
-from ._exceptions import (
-    MaxRetriesException,
-    RetriesTimeoutException,
-    RetriesDeadlineException,
-)
+from ._logging import _init_logger
+from ._clock import Clock, monotonic_clock
+from ._state import RetryState
+from ._retrier import _ResultRetriesExhausted, _make_retrier
 from .backoff import BackOff, FixedBackOff
+from .budget import RetryBudget
+from .circuit import CircuitBreaker
 
 
 retry_logger = _init_logger(__package__)
@@ -29,11 +30,27 @@ def retry(
     failure_callback: Union[Callable, None] = None,
     retry_callback: Union[Callable, None] = None,
     successful_retry_callback: Union[Callable, None] = None,
-    reraise_exception: bool = False
+    reraise_exception: bool = False,
+    clock: Clock = monotonic_clock,
+    interrupt_on_deadline: bool = False,
+    attempt_timeout: Union[float, None] = None,
+    budget: Union[RetryBudget, None] = None,
+    circuit_breaker: Union[CircuitBreaker, None] = None,
+    structured_logging: bool = False,
+    callback_executor: Union[Executor, None] = None,
+    pass_retry_state: bool = False,
+    retry_on_result: Union[Callable[[Any], bool], None] = None,
+    stop: Union[Callable[[RetryState], bool], None] = None,
+    delay_from_exception: Union[Callable[[Exception], Union[float, None]], None] = None,
+    resume_kwarg: Union[str, None] = None,
+    resume_token: Union[Callable[[Any], Any], None] = None
 ) -> Callable:
     """
     Decorator that adds retry functionality to a function.
 
+    Coroutine functions are supported natively: the decorated coroutine function awaits each
+    attempt and waits between retries with `asyncio.sleep`, so backoff never blocks the event loop.
+
     Parameters:
         exceptions (Tuple[Type[Exception]], optional): A tuple of exception types that should trigger a retry.
             Defaults to (Exception,), meaning any exception will trigger a retry.
@@ -43,9 +60,11 @@ def retry(
         backoff (BackOff, optional): The backoff strategy to use between retry attempts.
             Defaults to FixedBackOff(base_delay=0) with base_delay referring to seconds.
         timeout (float, optional): The maximum time (in seconds) to spend on retries. Defaults to None (no timeout).
-            Timeout check happens right before retry execution of the wrapped function.
+            Timeout check happens right before retry execution of the wrapped function, and a retry whose
+            backoff delay would start it after the timeout is not waited for, failing immediately instead.
         deadline (float, optional): The deadline (in seconds) for retries. Defaults to None (no deadline).
-            Deadline check happens right after the retry execution of the wrapped function.
+            Deadline check happens right after the retry execution of the wrapped function, and a retry whose
+            backoff delay would start it after the deadline is not waited for, failing immediately instead.
         logger (logging.Logger, optional): The logger instance to use for logging retry attempts. Defaults to retry_logger.
         log_retry_traceback (bool, optional): Whether to log the traceback of exceptions triggering retries.
             Defaults to False.
@@ -57,12 +76,69 @@ def retry(
             Defaults to None.
         reraise_exception (bool, optional): Whether to re-raise the last exception caught in case of failure after retries.
             Defaults to False.
+        clock (Callable[[], float], optional): The clock used to measure elapsed time for `timeout` and
+            `deadline`, returning fractional seconds. Defaults to a monotonic high resolution clock
+            (`time.perf_counter`), which is unaffected by system clock updates.
+        interrupt_on_deadline (bool, optional): Whether to stop waiting for an attempt that is still running
+            when the deadline is reached, raising `RetriesDeadlineException` right away. Each attempt of a
+            function is then run in a worker thread, while a coroutine function is cancelled. Python threads
+            cannot be interrupted, so an abandoned attempt of a function keeps running in the background
+            and its outcome is discarded. Has no effect without a `deadline`. Defaults to False.
+        attempt_timeout (float, optional): The maximum time (in seconds) a single attempt may run for. An attempt
+            still running after it is abandoned, the same way as with `interrupt_on_deadline`, and counts as a
+            failed attempt raising `AttemptTimeoutException`, which is always retried. Defaults to None
+            (attempts are not bounded).
+        budget (RetryBudget, optional): A retry budget, usually shared by many decorated functions, that every
+            successful call deposits to and every retry withdraws from. A retry refused by an exhausted budget
+            raises `RetryBudgetExhaustedException`. Defaults to None (retries are not budgeted).
+        circuit_breaker (CircuitBreaker, optional): A circuit breaker, usually shared by the functions calling the
+            same dependency, that every attempt goes through. Exceptions that trigger a retry count as failures.
+            While the breaker is open, calls and pending retries are short-circuited with `CircuitOpenException`
+            instead of waiting for their backoff delays. Defaults to None.
+        structured_logging (bool, optional): Whether to attach the retry information to retry log records as the
+            `retry_fname`, `retry_attempt`, `retry_remaining_retries`, `retry_remaining_time` and `retry_delay`
+            attributes, for handlers to consume without parsing the message. The failure log record gets the
+            `retry_fname`, `retry_attempts` and `retry_elapsed` attributes instead. Defaults to False.
+        callback_executor (concurrent.futures.Executor, optional): An executor to submit the callbacks and the
+            failure logging to, so that slow callbacks or handlers never delay the decorated function, e.g. a
+            bounded `CallbackDispatcher`. Defaults to None (they run inline).
+        pass_retry_state (bool, optional): Whether to call the callbacks with the `RetryState` of the invocation
+            as their single positional argument, exposing the number of attempts, the last exception, the next
+            delay, the start time and the remaining time. The state is allocated once per failing invocation
+            and updated in place, so a callback run by a `callback_executor` may observe later attempts.
+            Defaults to False (callbacks are called without arguments).
+        retry_on_result (Callable[[Any], bool], optional): A predicate on the result of an attempt, retrying the
+            attempts whose result it is true for, e.g. a response with a 503 status, with the same backoff,
+            limits and callbacks as attempts raising an exception. Retry exceptions raised after such an
+            attempt have no `last_exception`, and with `reraise_exception` the last result is returned instead.
+            Defaults to None (results are never retried).
+        stop (Callable[[RetryState], bool], optional): A predicate on the `RetryState` after each failed attempt,
+            whether it raised an exception or was retried on its result, giving up with `RetriesStoppedException`
+            when true. The state holds the delay of the retry it would start. Defaults to None.
+        delay_from_exception (Callable[[Exception], Optional[float]], optional): A callable returning the delay
+            (in seconds) requested by the exception of a failed attempt, e.g. from a `Retry-After` header or a
+            gRPC `RetryInfo`, or None to keep the backoff delay. A requested delay overrides the backoff delay
+            of that round, bounded by the `max` of the backoff strategy if any, and is still subject to the
+            `timeout` and `deadline`. Defaults to None.
+        resume_kwarg (str, optional): The keyword argument of a generator function that resumes the stream after the
+            items already yielded, passed on every restart following at least one yielded item. Defaults to None
+            (restarted generators start over).
+        resume_token (Callable[[Any], Any], optional): A callable returning the value of `resume_kwarg` from the last
+            item yielded, e.g. its key or offset. Defaults to None, passing the number of items yielded so far
+            added to the value the generator was called with, its default or 0.
+
+    Callbacks of a coroutine function may be coroutine functions themselves, including when wrapped by
+    `CallbackFactory` or `callback_factory`. They are scheduled as tasks on the running event loop rather
+    than awaited, and their failures are logged.
 
     Returns:
         Callable: The decorated function.
 
     Raises:
-        TypeError: If any argument has an invalid type.
+        TypeError: If any argument has an invalid type, if a coroutine callback is given for a function, if
+            `resume_kwarg` is given for a function that is not a generator function, or if `attempt_timeout`,
+            `interrupt_on_deadline` or `retry_on_result` is given for a generator function.
+        ValueError: If `attempt_timeout` is not positive.
 
     Example:
         @retry(exceptions=(ValueError,), max_retries=3, backoff=ExponentialBackOff(), timeout=10, logger=my_logger)
@@ -73,95 +149,288 @@ def retry(
     _validate_args(
         exceptions, excluded_exceptions, max_retries, backoff,
         timeout, deadline, logger, log_retry_traceback, failure_callback,
-        retry_callback, successful_retry_callback, reraise_exception
+        retry_callback, successful_retry_callback, reraise_exception, clock,
+        interrupt_on_deadline, attempt_timeout, budget, circuit_breaker,
+        structured_logging, callback_executor, pass_retry_state, retry_on_result, stop,
+        delay_from_exception, resume_kwarg, resume_token
     )
 
-    target_exceptions = tuple(set(exceptions) - set(excluded_exceptions))
+    def wrapped_func(f):
+        retrier = _make_retrier(
+            f, exceptions, excluded_exceptions, max_retries, backoff,
+            timeout, deadline, logger, log_retry_traceback, failure_callback,
+            retry_callback, successful_retry_callback, reraise_exception, clock,
+            interrupt_on_deadline, attempt_timeout, budget, circuit_breaker,
+            structured_logging, callback_executor, pass_retry_state, retry_on_result, stop,
+            delay_from_exception, resume_kwarg, resume_token
+        )
+        target_exceptions = retrier.target_exceptions
+        iter_delays = retrier.iter_delays
+        bounded = retrier.bounded
+        timed = retrier.timed
+        tracked = retrier.tracked
 
-    if not target_exceptions:
-        target_exceptions = (Exception,)
+        signature = inspect.signature(f) if resume_kwarg is not None else None
+
+        def resumed_arguments(args, kwargs, yielded, last):
+            # the token replaces the value given for resume_kwarg, positionally or not, while the default
+            # token counts the items yielded on from that value, its default or 0
+            if resume_kwarg is None or not yielded:
+                return args, kwargs
+            if resume_kwarg in signature.parameters:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+            else:
+                bound = None
+                arguments = kwargs
+            if resume_token is not None:
+                token = resume_token(last)
+            else:
+                start = arguments.get(resume_kwarg)
+                token = (start if start is not None else 0) + yielded
+            if bound is None:
+                return args, {**kwargs, resume_kwarg: token}
+            bound.arguments[resume_kwarg] = token
+            return bound.args, bound.kwargs
+
+        if inspect.isasyncgenfunction(f):
+            @wraps(f)
+            async def async_generator_wrapper(*args, **kwargs):
+                if circuit_breaker is not None:
+                    retrier.check_circuit(None)
+                start_time = clock() if timed else None
+                state = None
+                yielded = 0
+                last = None
+                call_args, call_kwargs = args, kwargs
+
+                while True:
+                    # a generator started over yields the items already yielded again, skipped here
+                    skip = yielded if resume_kwarg is None else 0
+                    iterator = f(*call_args, **call_kwargs)
+                    try:
+                        while True:
+                            try:
+                                item = await iterator.__anext__()
+                            except StopAsyncIteration:
+                                exc = None
+                                break
+                            except asyncio.CancelledError:
+                                # a cancellation is an Exception before Python 3.8, it is never retried
+                                raise
+                            except target_exceptions as original_exc:
+                                exc = original_exc
+                                break
+                            if skip:
+                                skip -= 1
+                                continue
+                            yielded += 1
+                            last = item
+                            yield item
+                    finally:
+                        await iterator.aclose()
+
+                    if exc is None:
+                        if deadline:
+                            retrier.check_deadline(start_time, state)
+                        if state is not None or tracked:
+                            retrier.on_success(state)
+                        return
+
+                    if state is None:
+                        state = retrier.new_state(start_time, 1)
+                        start_time = state.start_time
+                        delays = iter_delays()
+                    await asyncio.sleep(retrier.on_failure(state, exc, delays))
+                    state.attempts += 1
+
+                    retrier.check_timeout(state)
+                    retrier.check_circuit(state)
+                    call_args, call_kwargs = resumed_arguments(args, kwargs, yielded, last)
+
+            return async_generator_wrapper
+
+        if inspect.isgeneratorfunction(f):
+            @wraps(f)
+            def generator_wrapper(*args, **kwargs):
+                if circuit_breaker is not None:
+                    retrier.check_circuit(None)
+                start_time = clock() if timed else None
+                state = None
+                yielded = 0
+                last = None
+                call_args, call_kwargs = args, kwargs
+
+                while True:
+                    # a generator started over yields the items already yielded again, skipped here
+                    skip = yielded if resume_kwarg is None else 0
+                    iterator = f(*call_args, **call_kwargs)
+                    try:
+                        while True:
+                            try:
+                                item = next(iterator)
+                            except StopIteration:
+                                exc = None
+                                break
+                            except target_exceptions as original_exc:
+                                exc = original_exc
+                                break
+                            if skip:
+                                skip -= 1
+                                continue
+                            yielded += 1
+                            last = item
+                            yield item
+                    finally:
+                        iterator.close()
+
+                    if exc is None:
+                        if deadline:
+                            retrier.check_deadline(start_time, state)
+                        if state is not None or tracked:
+                            retrier.on_success(state)
+                        return
+
+                    if state is None:
+                        state = retrier.new_state(start_time, 1)
+                        start_time = state.start_time
+                        delays = iter_delays()
+                    sleep(retrier.on_failure(state, exc, delays))
+                    state.attempts += 1
+
+                    retrier.check_timeout(state)
+                    retrier.check_circuit(state)
+                    call_args, call_kwargs = resumed_arguments(args, kwargs, yielded, last)
+
+            return generator_wrapper
+
+        if inspect.iscoroutinefunction(f):
+            async def async_retry_loop(args, kwargs, start_time, exc, result):
+                state = retrier.new_state(start_time, 1)
+                start_time = state.start_time
+                delays = iter_delays()
 
-    def wrapped_func(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            start_time = time()
-            retries = 0
-            _backoff = deepcopy(backoff)
-            _backoff.reset()
-            fname = f.__name__
-            last_exception = None
-
-            while True:
                 try:
-                    if timeout:
-                        elapsed_time_before = time() - start_time
-                        if elapsed_time_before > timeout:
-                            raise RetriesTimeoutException(
-                                logger=logger,
-                                fname=fname,
-                                failure_callback=failure_callback,
-                                elapsed_time=elapsed_time_before,
-                                timeout=timeout,
-                            )
+                    while True:
+                        if exc is None:
+                            delay = retrier.on_result(state, result, delays)
+                        else:
+                            delay = retrier.on_failure(state, exc, delays)
+                        await asyncio.sleep(delay)
+                        state.attempts += 1
 
-                    result = f(*args, **kwargs)
+                        retrier.check_timeout(state)
+                        retrier.check_circuit(state)
+                        try:
+                            if bounded:
+                                result = await retrier.call_async(f, args, kwargs, start_time, state)
+                            else:
+                                result = await f(*args, **kwargs)
+                        except asyncio.CancelledError:
+                            raise
+                        except target_exceptions as original_exc:
+                            exc = original_exc
+                            continue
 
-                    if deadline:
-                        elapsed_time_after = time() - start_time
-                        if elapsed_time_after > deadline:
-                            raise RetriesDeadlineException(
-                                logger=logger,
-                                fname=fname,
-                                failure_callback=failure_callback,
-                                elapsed_time=elapsed_time_after,
-                                deadline=deadline,
-                            )
-
-                    if retries > 0 and successful_retry_callback:
-                        successful_retry_callback()
+                        if retry_on_result is not None and retry_on_result(result):
+                            exc = None
+                            continue
 
-                    return result
+                        retrier.check_deadline(start_time, state)
+                        retrier.on_success(state)
+                        return result
+                except _ResultRetriesExhausted as exhausted:
+                    return exhausted.result
+
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                if circuit_breaker is not None:
+                    retrier.check_circuit(None)
+                start_time = clock() if timed else None
+                try:
+                    if bounded:
+                        result = await retrier.call_async(f, args, kwargs, start_time, None)
+                    else:
+                        result = await f(*args, **kwargs)
+                except asyncio.CancelledError:
+                    raise
                 except target_exceptions as original_exc:
-                    if isinstance(original_exc, (RetriesTimeoutException, RetriesDeadlineException)):
-                        if reraise_exception and last_exception is not None:
-                            raise last_exception
-                        raise original_exc
-
-                    if isinstance(original_exc, excluded_exceptions):
-                        raise original_exc
-
-                    last_exception = original_exc
-
-                    if max_retries is not None:
-                        if retries == max_retries:
-                            if reraise_exception and last_exception is not None:
-                                raise last_exception
-                            raise MaxRetriesException(
-                                logger=logger,
-                                fname=fname,
-                                failure_callback=failure_callback,
-                                max_retries=max_retries,
-                            ) from original_exc
-
-                    delay = _backoff.delay
-                    exc_info = original_exc if log_retry_traceback else None
-                    _log_retry(
-                        logger=logger,
-                        fname=fname,
-                        max_retries=max_retries,
-                        retries=retries,
-                        timeout=timeout,
-                        deadline=deadline,
-                        start_time=start_time,
-                        delay=delay,
-                        exc_info=exc_info,
-                    )
-
-                    if retry_callback:
-                        retry_callback()
+                    exc = original_exc
+                    result = None
+                else:
+                    if retry_on_result is None or not retry_on_result(result):
+                        if deadline:
+                            retrier.check_deadline(start_time, None)
+                        if tracked:
+                            retrier.on_success(None)
+                        return result
+                    exc = None
 
+                return await async_retry_loop(args, kwargs, start_time, exc, result)
+
+            return async_wrapper
+
+        def retry_loop(args, kwargs, start_time, exc, result):
+            state = retrier.new_state(start_time, 1)
+            start_time = state.start_time
+            delays = iter_delays()
+
+            try:
+                while True:
+                    if exc is None:
+                        delay = retrier.on_result(state, result, delays)
+                    else:
+                        delay = retrier.on_failure(state, exc, delays)
                     sleep(delay)
-                    retries += 1
+                    state.attempts += 1
+
+                    retrier.check_timeout(state)
+                    retrier.check_circuit(state)
+                    try:
+                        if bounded:
+                            result = retrier.call(f, args, kwargs, start_time, state)
+                        else:
+                            result = f(*args, **kwargs)
+                    except target_exceptions as original_exc:
+                        exc = original_exc
+                        continue
+
+                    if retry_on_result is not None and retry_on_result(result):
+                        exc = None
+                        continue
+
+                    retrier.check_deadline(start_time, state)
+                    retrier.on_success(state)
+                    return result
+            except _ResultRetriesExhausted as exhausted:
+                return exhausted.result
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            # fast path: a successful first attempt skips the backoff and retry bookkeeping
+            # entirely, reading the clock only when a timeout or deadline has to be enforced
+            if circuit_breaker is not None:
+                retrier.check_circuit(None)
+            start_time = clock() if timed else None
+            try:
+                if bounded:
+                    result = retrier.call(f, args, kwargs, start_time, None)
+                else:
+                    result = f(*args, **kwargs)
+            except target_exceptions as original_exc:
+                exc = original_exc
+                result = None
+            else:
+                if retry_on_result is None or not retry_on_result(result):
+                    if deadline:
+                        retrier.check_deadline(start_time, None)
+                    if tracked:
+                        retrier.on_success(None)
+                    return result
+                exc = None
+
+            return retry_loop(args, kwargs, start_time, exc, result)
 
         return wrapper
 
@@ -1,9 +1,18 @@
 from retry_reloaded.backoff import (
+    BackOff,
     FixedBackOff,
     LinearBackOff,
     RandomUniformBackOff,
     ExponentialBackOff,
+    FullJitterBackOff,
+    EqualJitterBackOff,
+    DecorrelatedJitterBackOff,
+    _SLEEP_MAX,
 )
+import math
+import random
+import threading
+import time
 import pytest
 
 
@@ -199,3 +208,298 @@ def test_backoff_invalid_base_delay():
 
     with pytest.raises(TypeError):
         RandomUniformBackOff(None)
+
+
+def test_iter_delays_is_independent_of_instance_state():
+    backoff = ExponentialBackOff(1.0, max=10.0)
+
+    first = backoff.iter_delays()
+    second = backoff.iter_delays()
+    assert [next(first) for _ in range(3)] == [1.0, 2.0, 4.0]
+    assert next(second) == 1.0
+    assert next(first) == 8.0
+
+    assert backoff.delay == 1.0
+    assert backoff.delay == 2.0
+
+
+@pytest.mark.parametrize("max_delay", [None, 5.0])
+def test_full_jitter_backoff(max_delay):
+    backoff = FullJitterBackOff(1.0, max=max_delay)
+
+    for _round, delay in zip(range(8), backoff.iter_delays()):
+        ceiling = 2.0**_round if max_delay is None else min(2.0**_round, max_delay)
+        assert 0 <= delay <= ceiling
+
+
+@pytest.mark.parametrize("max_delay", [None, 5.0])
+def test_equal_jitter_backoff(max_delay):
+    backoff = EqualJitterBackOff(1.0, base=3, max=max_delay)
+
+    for _round, delay in zip(range(8), backoff.iter_delays()):
+        ceiling = 3.0**_round if max_delay is None else min(3.0**_round, max_delay)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+@pytest.mark.parametrize("max_delay", [None, 5.0])
+def test_decorrelated_jitter_backoff(max_delay):
+    backoff = DecorrelatedJitterBackOff(0.5, max=max_delay)
+
+    previous = 0.5
+    for _, delay in zip(range(8), backoff.iter_delays()):
+        assert 0.5 <= delay <= previous * 3
+        if max_delay is not None:
+            assert delay <= max_delay
+        previous = delay
+
+
+def test_jitter_backoffs_spread_first_round():
+    for backoff in (FullJitterBackOff(1.0), EqualJitterBackOff(1.0), DecorrelatedJitterBackOff(1.0)):
+        first_delays = {next(backoff.iter_delays()) for _ in range(20)}
+        assert len(first_delays) > 1
+
+
+def test_decorrelated_jitter_backoff_invalid_arguments():
+    with pytest.raises(ValueError):
+        DecorrelatedJitterBackOff(0)
+
+    with pytest.raises(ValueError):
+        DecorrelatedJitterBackOff(1.0, multiplier=0.5)
+
+    with pytest.raises(ValueError):
+        DecorrelatedJitterBackOff(1.0, max=0.5)
+
+
+@pytest.mark.parametrize("backoff_factory", [
+    lambda rng: FixedBackOff(1.0, (0.1, 0.5), rng=rng),
+    lambda rng: LinearBackOff(1.0, 1.0, (0.1, 0.5), rng=rng),
+    lambda rng: RandomUniformBackOff(1.0, 0.1, 0.5, rng=rng),
+    lambda rng: ExponentialBackOff(1.0, jitter=(0.1, 0.5), rng=rng),
+    lambda rng: FullJitterBackOff(1.0, rng=rng),
+    lambda rng: EqualJitterBackOff(1.0, rng=rng),
+    lambda rng: DecorrelatedJitterBackOff(1.0, rng=rng),
+])
+def test_seeded_backoff_is_reproducible(backoff_factory):
+    first = backoff_factory(42)
+    second = backoff_factory(random.Random(42))
+    delays = [first.delay for _ in range(5)]
+
+    random.seed(0)
+    assert [second.delay for _ in range(5)] == delays
+
+    first.reset()
+    assert [first.delay for _ in range(5)] == delays
+
+
+def test_unseeded_backoff_uses_thread_local_generator():
+    backoff = FullJitterBackOff(1.0)
+    delays = {}
+
+    def draw(name):
+        delays[name] = [delay for _, delay in zip(range(5), backoff.iter_delays())]
+
+    threads = [threading.Thread(target=draw, args=(name,)) for name in ("first", "second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert delays["first"] != delays["second"]
+
+
+def test_backoff_invalid_rng():
+    with pytest.raises(TypeError):
+        FixedBackOff(1.0, rng="not_a_generator")
+
+    with pytest.raises(TypeError):
+        ExponentialBackOff(1.0, rng=1.5)
+
+
+DETERMINISTIC_BACKOFFS = [
+    FixedBackOff(0.5),
+    LinearBackOff(0.5, 0.25),
+    LinearBackOff(0.5, 0.25, max=2.0),
+    ExponentialBackOff(0.5),
+    ExponentialBackOff(0.5, base=3, max=20.0),
+    ExponentialBackOff(1.0, base=0.5),
+]
+
+
+@pytest.mark.parametrize("backoff", DETERMINISTIC_BACKOFFS)
+def test_schedule_matches_iter_delays(backoff):
+    schedule = backoff.schedule(12)
+    assert schedule.typecode == "d"
+    assert list(schedule) == [delay for _, delay in zip(range(12), backoff.iter_delays())]
+
+
+@pytest.mark.parametrize("backoff_factory", [
+    lambda: FixedBackOff(1.0, (0.1, 0.5), rng=7),
+    lambda: LinearBackOff(1.0, 1.0, (0.1, 0.5), max=4.0, rng=7),
+    lambda: RandomUniformBackOff(1.0, 0.1, 0.5, rng=7),
+    lambda: ExponentialBackOff(1.0, jitter=(0.1, 0.5), max=10.0, rng=7),
+    lambda: FullJitterBackOff(1.0, max=10.0, rng=7),
+    lambda: EqualJitterBackOff(1.0, rng=7),
+    lambda: DecorrelatedJitterBackOff(1.0, rng=7),
+])
+def test_seeded_schedule_matches_iter_delays(backoff_factory):
+    assert list(backoff_factory().schedule(10)) == pytest.approx(
+        [delay for _, delay in zip(range(10), backoff_factory().iter_delays())]
+    )
+
+
+@pytest.mark.parametrize("backoff", DETERMINISTIC_BACKOFFS)
+def test_total_delay_is_exact_for_deterministic_backoff(backoff):
+    for n in (0, 1, 2, 5, 12):
+        assert backoff.total_delay(n) == pytest.approx(math.fsum(backoff.schedule(n)))
+
+
+@pytest.mark.parametrize("backoff", [
+    FixedBackOff(1.0, (0.1, 0.5)),
+    LinearBackOff(1.0, 1.0, (0.1, 0.5), max=4.0),
+    RandomUniformBackOff(1.0, 0.1, 0.5),
+    ExponentialBackOff(1.0, jitter=(0.1, 0.5), max=10.0),
+    FullJitterBackOff(1.0, max=10.0),
+    EqualJitterBackOff(1.0),
+    DecorrelatedJitterBackOff(1.0, max=30.0),
+])
+def test_total_delay_bounds_random_backoff(backoff):
+    for _ in range(20):
+        assert math.fsum(backoff.schedule(10)) <= backoff.total_delay(10)
+
+
+def test_total_delay_of_unbounded_exponential_backoff_is_capped_at_sleep_limit():
+    backoff = ExponentialBackOff(1.0)
+    capped = 5000 - backoff._cap_round
+
+    assert backoff.total_delay(5000) == 2.0**backoff._cap_round - 1 + capped * _SLEEP_MAX
+    assert math.isfinite(backoff.total_delay(5000))
+
+
+def test_sleep_limit_is_sleepable():
+    errors = []
+
+    def sleep_forever():
+        try:
+            time.sleep(_SLEEP_MAX)
+        except Exception as error:
+            errors.append(error)
+
+    sleeper = threading.Thread(target=sleep_forever, daemon=True)
+    sleeper.start()
+    sleeper.join(0.1)
+
+    assert sleeper.is_alive()
+    assert not errors
+
+
+@pytest.mark.parametrize("backoff", [
+    ExponentialBackOff(1.0),
+    ExponentialBackOff(0.1, base=3, jitter=(0.1, 0.5)),
+    ExponentialBackOff(0),
+    ExponentialBackOff(0, jitter=(0.1, 0.5)),
+    ExponentialBackOff(1e-300),
+    ExponentialBackOff(5e-324, jitter=(0.1, 0.5)),
+    FullJitterBackOff(1.0),
+    FullJitterBackOff(0),
+    FullJitterBackOff(1e-300),
+    EqualJitterBackOff(1.0),
+    EqualJitterBackOff(0),
+    EqualJitterBackOff(1e-300),
+    DecorrelatedJitterBackOff(1.0),
+    DecorrelatedJitterBackOff(1e-300),
+])
+def test_unbounded_backoff_does_not_overflow(backoff):
+    delays = backoff.iter_delays()
+    for _ in range(5000):
+        delay = next(delays)
+
+    assert 0 <= delay <= _SLEEP_MAX
+    assert all(0 <= delay <= _SLEEP_MAX for delay in backoff.schedule(5000))
+    assert backoff._compute_delay(10**9, _SLEEP_MAX) <= _SLEEP_MAX
+    assert math.isfinite(backoff.total_delay(5000))
+
+
+@pytest.mark.parametrize("base_delay, base, max", [
+    (1.0, 2, 30.0),
+    (0.1, 2, 6.4),
+    (0.3, 1.5, 100.0),
+    (2.0, 10, 2.0),
+    (1e-9, 2, None),
+])
+def test_exponential_backoff_stops_growing_at_cap(base_delay, base, max):
+    backoff = ExponentialBackOff(base_delay, base=base, max=max)
+    cap = max if max is not None else _SLEEP_MAX
+    expected = [min(base_delay * base**_round, cap) for _round in range(backoff._cap_round + 5)]
+
+    assert list(backoff.schedule(len(expected))) == expected
+    assert [backoff._compute_delay(_round, 0) for _round in range(len(expected))] == expected
+    assert backoff._compute_delay(10**12, 0) == cap
+
+
+def test_max_attempts_within():
+    assert FixedBackOff(1.0).max_attempts_within(3.5) == 4
+    assert LinearBackOff(1.0, 1.0).max_attempts_within(6) == 4
+    assert ExponentialBackOff(1.0, max=4.0).max_attempts_within(15) == 6
+    assert FixedBackOff(0.125).max_attempts_within(2**30) == 2**33 + 1
+    assert RandomUniformBackOff(0.0, 0.5, 1.0).max_attempts_within(2) == 6
+
+
+def test_max_attempts_within_unbounded():
+    assert FixedBackOff(0).max_attempts_within(10) is None
+    assert FullJitterBackOff(1.0).max_attempts_within(10) is None
+    assert FixedBackOff(1.0, (0.0, 0.5)).max_attempts_within(0.5) == 1
+
+
+def test_schedule_invalid_rounds():
+    with pytest.raises(ValueError):
+        FixedBackOff(1.0).schedule(-1)
+
+    with pytest.raises(TypeError):
+        FixedBackOff(1.0).total_delay(1.5)
+
+    with pytest.raises(ValueError):
+        FixedBackOff(1.0).max_attempts_within(-1)
+
+
+class DoublingBackOff(BackOff):
+    # written against the former interface, advancing the cursor of the instance
+    def _calculate_next_delay(self):
+        self._delay = self._base_delay * 2 ** self._round
+        self._round += 1
+
+
+def test_former_interface_backoff():
+    backoff = DoublingBackOff(base_delay=1)
+
+    assert [backoff.delay for _ in range(3)] == [1, 2, 4]
+    delays = backoff.iter_delays()
+    assert [next(delays) for _ in range(4)] == [1, 2, 4, 8]
+    assert list(backoff.schedule(3)) == [1, 2, 4]
+    assert backoff._compute_delay(3, 4) == 8
+    assert backoff.delay == 8
+
+
+def test_former_interface_subclass_of_strategy():
+    class ShrinkingBackOff(FixedBackOff):
+        def _calculate_next_delay(self):
+            self._delay = self._base_delay / (self._round + 1)
+            self._round += 1
+
+    backoff = ShrinkingBackOff(base_delay=1)
+
+    assert list(backoff.schedule(3)) == [1, 0.5, 1 / 3]
+    delays = backoff.iter_delays()
+    assert [next(delays) for _ in range(2)] == [1, 0.5]
+    with pytest.raises(NotImplementedError):
+        backoff.total_delay(3)
+    with pytest.raises(NotImplementedError):
+        backoff.max_attempts_within(10)
+
+
+def test_backoff_without_delay_computation():
+    class IncompleteBackOff(BackOff):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackOff()
+
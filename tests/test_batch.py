@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+from retry_reloaded import retry_batch, PartialFailureException
+from retry_reloaded._exceptions import MaxRetriesException
+from retry_reloaded.backoff import FixedBackOff
+
+
+def test_batch_retries_only_failed_items():
+    batches = []
+    failures = {1: 1, 3: 2}
+
+    @retry_batch(max_retries=3)
+    def write(records):
+        batches.append(list(records))
+        outcomes = []
+        for record in records:
+            if failures.get(record, 0):
+                failures[record] -= 1
+                outcomes.append(ConnectionError(f"Simulating failure of {record}"))
+            else:
+                outcomes.append(record * 10)
+        return outcomes
+
+    assert write(range(5)) == [0, 10, 20, 30, 40]
+    assert batches == [[0, 1, 2, 3, 4], [1, 3], [3]]
+
+
+def test_batch_successful_first_attempt(retry_callback):
+    @retry_batch(max_retries=3, retry_callback=retry_callback)
+    def fetch(keys, prefix):
+        return [prefix + key for key in keys]
+
+    assert fetch(["a", "b"], "key:") == ["key:a", "key:b"]
+    retry_callback.assert_not_called()
+
+
+def test_batch_empty_is_not_called():
+    @retry_batch(max_retries=3)
+    def write(records):
+        raise AssertionError("Should not be called")
+
+    assert write([]) == []
+
+
+def test_batch_whole_failure_retried():
+    attempts = 0
+
+    @retry_batch(max_retries=2)
+    def write(records):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("Simulating failure")
+        return records
+
+    assert write([1, 2]) == [1, 2]
+    assert attempts == 2
+
+
+def test_batch_maximum_retries_reached(failure_callback):
+    @retry_batch(max_retries=2, backoff=FixedBackOff(base_delay=0.01), failure_callback=failure_callback)
+    def write(records):
+        return [ValueError("Simulating failure") if record == 2 else record for record in records]
+
+    with pytest.raises(MaxRetriesException) as exc_info:
+        write([1, 2, 3])
+
+    partial = exc_info.value.last_exception
+    assert isinstance(partial, PartialFailureException)
+    assert partial.results[0] == 1 and partial.results[2] == 3
+    assert list(partial.failures) == [1]
+    failure_callback.assert_called_once()
+
+
+def test_batch_reraise_partial_failure():
+    @retry_batch(max_retries=1, reraise_exception=True)
+    def write(records):
+        return [ValueError("Simulating failure") for _ in records]
+
+    with pytest.raises(PartialFailureException, match="2 of 2 items of function write failed"):
+        write(["a", "b"])
+
+
+def test_batch_excluded_item_failure_not_retried():
+    batches = []
+
+    @retry_batch(excluded_exceptions=(KeyError,), max_retries=3)
+    def fetch(keys):
+        batches.append(list(keys))
+        return [KeyError(key) if key == "missing" else key.upper() for key in keys]
+
+    with pytest.raises(PartialFailureException) as exc_info:
+        fetch(["a", "missing", "b"])
+
+    assert batches == [["a", "missing", "b"]]
+    assert exc_info.value.results[0] == "A" and exc_info.value.results[2] == "B"
+    assert isinstance(exc_info.value.failures[1], KeyError)
+
+
+def test_batch_outcomes_mismatch():
+    @retry_batch(max_retries=1, reraise_exception=True)
+    def write(records):
+        return records[:-1]
+
+    with pytest.raises(ValueError, match="returned 1 outcomes for a batch of 2 items"):
+        write([1, 2])
+
+
+def test_async_batch_retries_only_failed_items():
+    batches = []
+
+    @retry_batch(max_retries=2)
+    async def write(records):
+        batches.append(list(records))
+        await asyncio.sleep(0)
+        return [TimeoutError() if len(batches) == 1 and record % 2 else record for record in records]
+
+    assert asyncio.run(write([1, 2, 3, 4])) == [1, 2, 3, 4]
+    assert batches == [[1, 2, 3, 4], [1, 3]]
+
+
+def test_batch_invalid_arguments():
+    with pytest.raises(TypeError):
+        retry_batch(retry_on_result=lambda result: False)
+
+    with pytest.raises(TypeError):
+        retry_batch(exceptions=[ValueError])
+
+    with pytest.raises(TypeError):
+        retry_batch(max_retries="3")
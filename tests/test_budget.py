@@ -0,0 +1,70 @@
+from threading import Thread
+from retry_reloaded.budget import RetryBudget
+import pytest
+
+
+def test_budget_initial_tokens():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.tokens == 2
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_budget_refills_on_success():
+    budget = RetryBudget(ratio=0.5, max_tokens=2, initial_tokens=0)
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_budget_capped_at_max_tokens():
+    budget = RetryBudget(ratio=1, max_tokens=3, initial_tokens=0)
+    for _ in range(10):
+        budget.deposit()
+
+    assert budget.tokens == 3
+    for _ in range(3):
+        assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert budget.tokens == 1
+
+
+def test_budget_concurrent_withdrawals():
+    budget = RetryBudget(ratio=0, max_tokens=100)
+    permitted = []
+
+    def withdraw_many():
+        permitted.extend(budget.withdraw() for _ in range(50))
+
+    threads = [Thread(target=withdraw_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert permitted.count(True) == 100
+
+
+@pytest.mark.parametrize(
+    "ratio, max_tokens, initial_tokens, error",
+    [
+        ("a", 10, None, TypeError),
+        (0.1, "a", None, TypeError),
+        (0.1, 10, "a", TypeError),
+        (-0.1, 10, None, ValueError),
+        (0.1, -1, None, ValueError),
+        (0.1, 10, 11, ValueError),
+    ],
+)
+def test_budget_invalid_arguments(ratio, max_tokens, initial_tokens, error):
+    with pytest.raises(error):
+        RetryBudget(ratio, max_tokens, initial_tokens)
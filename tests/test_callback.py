@@ -1,4 +1,6 @@
-from retry_reloaded.callback import CallbackFactory, callback_factory
+import sys
+from threading import Event
+from retry_reloaded.callback import CallbackFactory, CallbackDispatcher, callback_factory
 import pytest
 
 
@@ -90,3 +92,144 @@ def test_callback_factory_partial_arguments_override():
 
     _callback = callback_factory(dummy_func, 2, 3, z=4)
     assert _callback(y=5) == 11
+
+
+def test_CallbackFactory_runtime_positional_arguments():
+    def dummy_func(state, y):
+        return state * y
+
+    _callback = CallbackFactory(dummy_func, y=3)
+    assert _callback(2) == 6
+
+
+def test_callback_factory_runtime_positional_arguments():
+    def dummy_func(state, y):
+        return state * y
+
+    _callback = callback_factory(dummy_func, y=3)
+    assert _callback(2) == 6
+
+
+def test_CallbackFactory_stored_positional_and_runtime_positional_arguments():
+    def dummy_func(channel, state, level="info"):
+        return channel, state, level
+
+    _callback = CallbackFactory(dummy_func, "ops")
+    assert _callback("state") == ("ops", "state", "info")
+    assert _callback("state", channel="dev") == ("dev", "state", "info")
+
+
+def test_callback_factory_stored_positional_and_runtime_positional_arguments():
+    def dummy_func(channel, state, level="info"):
+        return channel, state, level
+
+    _callback = callback_factory(dummy_func, "ops", level="warning")
+    assert _callback("state") == ("ops", "state", "warning")
+    assert _callback.__name__ == "dummy_func"
+
+
+def test_CallbackFactory_positional_only_arguments():
+    # divmod has a positional-only signature on every supported Python version
+    _callback = CallbackFactory(divmod, 7, 3)
+    assert _callback() == (2, 1)
+    assert _callback.args == (7, 3)
+
+
+def test_CallbackFactory_variadic_arguments():
+    def dummy_func(*values, **options):
+        return values, options
+
+    _callback = CallbackFactory(dummy_func, 1, 2, key="value")
+    assert _callback(3) == ((1, 2, 3), {"key": "value"})
+
+
+def test_CallbackFactory_arguments_mismatch():
+    def dummy_func(x):
+        return x
+
+    with pytest.raises(TypeError):
+        _ = CallbackFactory(dummy_func, 1, 2)
+
+
+def test_CallbackFactory_stored_arguments_not_mutated_by_override():
+    def dummy_func(x, y):
+        return x * y
+
+    _callback = CallbackFactory(dummy_func, 2, 3)
+    assert _callback(y=5) == 10
+    assert _callback() == 6
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="positional-only parameters require Python 3.8")
+def test_callback_factory_positional_only_and_variadic_arguments():
+    # defined at runtime, as the syntax does not compile on Python 3.7
+    namespace = {}
+    exec("def dummy_func(x, /, *values):\n    return x + sum(values)\n", namespace)
+    dummy_func = namespace["dummy_func"]
+
+    _callback = callback_factory(dummy_func, 1, 2, 3)
+    assert _callback() == 6
+    assert _callback.__name__ == "dummy_func"
+
+
+def _busy_dispatcher(overflow):
+    dispatcher = CallbackDispatcher(max_workers=1, max_queue_size=1, overflow=overflow)
+    release = Event()
+    started = Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    dispatcher.submit(block)
+    started.wait()
+    return dispatcher, release
+
+
+def test_CallbackDispatcher_runs_callbacks():
+    dispatcher = CallbackDispatcher()
+    future = dispatcher.submit(lambda x, y: x * y, 2, y=3)
+    assert future.result(timeout=1) == 6
+    dispatcher.shutdown()
+
+
+def test_CallbackDispatcher_drop_newest_on_overflow():
+    dispatcher, release = _busy_dispatcher(CallbackDispatcher.DROP)
+    queued = dispatcher.submit(lambda: "queued")
+    dropped = dispatcher.submit(lambda: "dropped")
+    release.set()
+
+    assert queued.result(timeout=1) == "queued"
+    assert dropped.cancelled()
+    assert dispatcher.dropped == 1
+    dispatcher.shutdown()
+
+
+def test_CallbackDispatcher_drop_oldest_on_overflow():
+    dispatcher, release = _busy_dispatcher(CallbackDispatcher.DROP_OLDEST)
+    dropped = dispatcher.submit(lambda: "dropped")
+    queued = dispatcher.submit(lambda: "queued")
+    release.set()
+
+    assert queued.result(timeout=1) == "queued"
+    assert dropped.cancelled()
+    assert dispatcher.dropped == 1
+    dispatcher.shutdown()
+
+
+def test_CallbackDispatcher_rejects_after_shutdown():
+    dispatcher = CallbackDispatcher()
+    dispatcher.shutdown()
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(lambda: None)
+
+
+def test_CallbackDispatcher_invalid_arguments():
+    with pytest.raises(ValueError):
+        CallbackDispatcher(max_workers=0)
+
+    with pytest.raises(TypeError):
+        CallbackDispatcher(max_queue_size="not_an_integer")
+
+    with pytest.raises(ValueError):
+        CallbackDispatcher(overflow="not_a_policy")
@@ -0,0 +1,93 @@
+from retry_reloaded.circuit import CircuitBreaker
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=FakeClock())
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_circuit_opens_on_failure_rate():
+    breaker = CircuitBreaker(failure_threshold=4, failure_rate=0.5, window=4, clock=FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_circuit_half_open_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert not breaker.is_open
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_circuit_replaces_stale_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow()
+    clock.now = 15
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"failure_threshold": "a"}, TypeError),
+        ({"failure_threshold": 0}, ValueError),
+        ({"recovery_timeout": "a"}, TypeError),
+        ({"recovery_timeout": -1}, ValueError),
+        ({"failure_rate": "a"}, TypeError),
+        ({"failure_rate": 1.5}, ValueError),
+        ({"failure_threshold": 10, "window": 5}, ValueError),
+        ({"clock": "a"}, TypeError),
+    ],
+)
+def test_circuit_invalid_arguments(kwargs, error):
+    with pytest.raises(error):
+        CircuitBreaker(**kwargs)
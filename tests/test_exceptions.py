@@ -0,0 +1,56 @@
+import pickle
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from retry_reloaded import retry
+from retry_reloaded._exceptions import (
+    BaseRetryException,
+    MaxRetriesException,
+    RetriesTimeoutException,
+    RetriesDeadlineException,
+    AttemptTimeoutException,
+    RetryBudgetExhaustedException,
+    CircuitOpenException,
+    RetriesStoppedException,
+    PartialFailureException,
+)
+
+
+@retry(max_retries=2, logger=None)
+def failure_function():
+    raise ValueError("Simulating failure")
+
+
+@pytest.mark.parametrize("exc", [
+    BaseRetryException("message", fname="func", attempts=1, elapsed=0.5),
+    MaxRetriesException(fname="func", max_retries=2, attempts=3, elapsed=1.5, last_exception=ValueError("failure")),
+    RetriesTimeoutException(fname="func", elapsed=2.5, timeout=2, delay=1, attempts=2),
+    RetriesDeadlineException(fname="func", elapsed=3.5, deadline=3, attempts=2),
+    RetryBudgetExhaustedException(fname="func", attempts=1, elapsed=0.1),
+    CircuitOpenException(fname="func", attempts=0, elapsed=0.0),
+    RetriesStoppedException(fname="func", attempts=2, elapsed=0.2, last_exception=KeyError("key")),
+    AttemptTimeoutException(fname="func", attempt_timeout=0.5),
+    PartialFailureException(fname="func", results=[1, None, "three"]),
+])
+def test_exception_pickle_round_trip(exc):
+    restored = pickle.loads(pickle.dumps(exc))
+
+    assert type(restored) is type(exc)
+    assert str(restored) == str(exc)
+    for name, value in vars(exc).items():
+        if isinstance(value, BaseException):
+            assert type(getattr(restored, name)) is type(value)
+            assert getattr(restored, name).args == value.args
+        else:
+            assert getattr(restored, name) == value
+
+
+def test_exception_raised_in_process_pool_worker():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(failure_function)
+
+        with pytest.raises(MaxRetriesException) as exc_info:
+            future.result()
+
+    assert exc_info.value.fname == "failure_function"
+    assert exc_info.value.attempts == 3
+    assert isinstance(exc_info.value.last_exception, ValueError)
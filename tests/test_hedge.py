@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+from time import perf_counter, sleep
+from retry_reloaded import hedge
+from retry_reloaded._exceptions import MaxRetriesException
+from retry_reloaded.backoff import FixedBackOff
+from retry_reloaded.hedge import _LatencyTracker
+
+
+def test_hedge_fast_attempt_no_hedging():
+    attempts = 0
+
+    @hedge(max_retries=2, backoff=FixedBackOff(base_delay=0.5))
+    def fast_function():
+        nonlocal attempts
+        attempts += 1
+        return "Success"
+
+    assert fast_function() == "Success"
+    assert attempts == 1
+
+
+def test_hedge_slow_attempt_is_hedged():
+    attempts = 0
+
+    @hedge(max_retries=1, backoff=FixedBackOff(base_delay=0.05))
+    def slow_first_attempt():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            sleep(1)
+            return "Slow"
+        return "Fast"
+
+    start = perf_counter()
+    assert slow_first_attempt() == "Fast"
+    assert perf_counter() - start < 1
+    assert attempts == 2
+
+
+def test_hedge_failed_attempt_starts_next_right_away():
+    attempts = 0
+
+    @hedge(max_retries=1, backoff=FixedBackOff(base_delay=5))
+    def fail_first_attempt():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    start = perf_counter()
+    assert fail_first_attempt() == "Success"
+    assert perf_counter() - start < 1
+
+
+def test_hedge_all_attempts_fail():
+    @hedge(max_retries=2, backoff=FixedBackOff(base_delay=0.01))
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        failure_function()
+
+
+def test_hedge_reraise_exception():
+    @hedge(max_retries=1, backoff=FixedBackOff(base_delay=0.01), reraise_exception=True)
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(ValueError, match="Simulating failure"):
+        failure_function()
+
+
+def test_hedge_excluded_exception_raised_immediately():
+    attempts = 0
+
+    @hedge(excluded_exceptions=(ValueError,), max_retries=2)
+    def raise_value_error():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("Simulating ValueError")
+
+    with pytest.raises(ValueError):
+        raise_value_error()
+
+    assert attempts == 1
+
+
+def test_async_hedge_slow_attempt_is_hedged():
+    attempts = 0
+    cancelled = False
+
+    @hedge(max_retries=1, backoff=FixedBackOff(base_delay=0.05))
+    async def slow_first_attempt():
+        nonlocal attempts, cancelled
+        attempts += 1
+        if attempts == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return "Slow"
+        return "Fast"
+
+    async def main():
+        result = await slow_first_attempt()
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == "Fast"
+    assert attempts == 2
+    assert cancelled
+
+
+def test_latency_tracker_percentile():
+    tracker = _LatencyTracker(percentile=90, window=100, min_samples=10)
+    assert tracker.value is None
+
+    for latency in range(1, 101):
+        tracker.record(latency / 100)
+
+    assert tracker.value == 0.91
+
+
+def test_hedge_invalid_arguments():
+    with pytest.raises(ValueError):
+        hedge(max_retries=-1)
+
+    with pytest.raises(ValueError):
+        hedge(percentile=150)
+
+    with pytest.raises(TypeError):
+        hedge(backoff="not_a_backoff_instance")
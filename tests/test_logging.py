@@ -0,0 +1,73 @@
+import logging
+from unittest.mock import Mock
+from retry_reloaded._exceptions import MaxRetriesException
+from retry_reloaded._logging import _log_failure, _log_retry
+
+
+def _log(logger, **kwargs):
+    arguments = dict(
+        logger=logger,
+        fname="func",
+        max_retries=3,
+        retries=1,
+        timeout=10,
+        deadline=None,
+        start_time=0.0,
+        delay=0.5,
+        clock=lambda: 4.0,
+    )
+    arguments.update(kwargs)
+    _log_retry(**arguments)
+
+
+def test_log_retry_message(caplog):
+    logger = logging.getLogger("test_log_retry_message")
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        _log(logger)
+
+    assert caplog.records[0].getMessage() == (
+        "Will retry function func. Remaining retries: 2. Remaining time: 6.0 secs. Next retry in 0.5 secs."
+    )
+
+
+def test_log_retry_message_without_limits(caplog):
+    logger = logging.getLogger("test_log_retry_message_without_limits")
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        _log(logger, max_retries=None, timeout=None)
+
+    assert caplog.records[0].getMessage() == "Will retry function func. Next retry in 0.5 secs."
+
+
+def test_log_retry_skipped_when_warning_disabled():
+    logger = Mock(spec=logging.Logger)
+    logger.isEnabledFor.return_value = False
+    clock = Mock(return_value=4.0)
+
+    _log(logger, clock=clock)
+
+    logger.warning.assert_not_called()
+    clock.assert_not_called()
+
+
+def test_log_retry_structured(caplog):
+    logger = logging.getLogger("test_log_retry_structured")
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        _log(logger, structured=True)
+
+    record = caplog.records[0]
+    assert record.retry_fname == "func"
+    assert record.retry_attempt == 2
+    assert record.retry_remaining_retries == 2
+    assert record.retry_remaining_time == 6.0
+    assert record.retry_delay == 0.5
+
+
+def test_log_failure_structured(caplog):
+    logger = logging.getLogger("test_log_failure_structured")
+    error = MaxRetriesException(fname="func", max_retries=2, attempts=3, elapsed=1.5)
+    with caplog.at_level(logging.ERROR, logger=logger.name):
+        _log_failure(logger, error, structured=True)
+
+    record = caplog.records[0]
+    assert record.getMessage() == str(error)
+    assert (record.retry_fname, record.retry_attempts, record.retry_elapsed) == ("func", 3, 1.5)
@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import pytest
+from time import sleep
+from retry_reloaded import retry_map
+from retry_reloaded._exceptions import MaxRetriesException
+from retry_reloaded.backoff import FixedBackOff
+
+
+def test_map_ordered_results_with_retries():
+    attempts = {}
+    lock = threading.Lock()
+
+    def double(item):
+        with lock:
+            attempts[item] = attempts.get(item, 0) + 1
+            failing = item % 3 == 0 and attempts[item] < 3
+        if failing:
+            raise ConnectionError("Simulating failure")
+        return item * 2
+
+    results = list(retry_map(double, range(10), concurrency=3, max_retries=3, logger=None))
+
+    assert results == [item * 2 for item in range(10)]
+    assert attempts == {item: 3 if item % 3 == 0 else 1 for item in range(10)}
+
+
+def test_map_backoff_does_not_take_worker():
+    failed = False
+
+    def work(item):
+        nonlocal failed
+        if item == 0 and not failed:
+            failed = True
+            raise ConnectionError("Simulating failure")
+        sleep(0.01)
+        return item
+
+    results = list(retry_map(
+        work, range(5), concurrency=1, ordered=False, max_retries=1, backoff=FixedBackOff(base_delay=0.3), logger=None
+    ))
+
+    assert results == [1, 2, 3, 4, 0]
+
+
+def test_map_concurrency_limit():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(item):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        sleep(0.01)
+        with lock:
+            running -= 1
+        return item
+
+    assert list(retry_map(work, range(20), concurrency=4)) == list(range(20))
+    assert peak <= 4
+
+
+def test_map_failed_item_raises():
+    def work(item):
+        if item == 2:
+            raise ValueError("Simulating failure")
+        return item
+
+    with pytest.raises(MaxRetriesException):
+        list(retry_map(work, range(5), max_retries=1, logger=None))
+
+
+def test_map_return_exceptions(failure_callback):
+    def work(item):
+        if item == 2:
+            raise ValueError("Simulating failure")
+        return item
+
+    results = list(retry_map(
+        work, range(4), return_exceptions=True, max_retries=1, failure_callback=failure_callback, logger=None
+    ))
+
+    assert results[:2] == [0, 1] and results[3] == 3
+    assert isinstance(results[2], MaxRetriesException)
+    assert isinstance(results[2].last_exception, ValueError)
+    failure_callback.assert_called_once()
+
+
+def test_map_excluded_exception_not_retried():
+    attempts = 0
+
+    def work(item):
+        nonlocal attempts
+        attempts += 1
+        raise KeyError(item)
+
+    results = list(retry_map(work, ["a"], return_exceptions=True, excluded_exceptions=(KeyError,), max_retries=3))
+
+    assert isinstance(results[0], KeyError)
+    assert attempts == 1
+
+
+def test_map_retry_on_result(retry_callback):
+    responses = {"a": [503, 200], "b": [200]}
+    lock = threading.Lock()
+
+    def fetch(key):
+        with lock:
+            return responses[key].pop(0)
+
+    results = list(retry_map(
+        fetch, ["a", "b"], retry_on_result=lambda status: status == 503, retry_callback=retry_callback, logger=None
+    ))
+
+    assert results == [200, 200]
+    retry_callback.assert_called_once()
+
+
+def test_async_map_ordered_results_with_retries():
+    attempts = {}
+
+    async def double(item):
+        attempts[item] = attempts.get(item, 0) + 1
+        await asyncio.sleep(0)
+        if item % 2 and attempts[item] < 2:
+            raise ConnectionError("Simulating failure")
+        return item * 2
+
+    async def main():
+        return [result async for result in retry_map(double, range(6), concurrency=2, max_retries=2, logger=None)]
+
+    assert asyncio.run(main()) == [item * 2 for item in range(6)]
+    assert attempts == {item: 2 if item % 2 else 1 for item in range(6)}
+
+
+def test_async_map_backoff_releases_semaphore():
+    failed = False
+
+    async def work(item):
+        nonlocal failed
+        if item == 0 and not failed:
+            failed = True
+            raise ConnectionError("Simulating failure")
+        await asyncio.sleep(0.01)
+        return item
+
+    async def items():
+        for item in range(5):
+            yield item
+
+    async def main():
+        return [result async for result in retry_map(
+            work, items(), concurrency=1, ordered=False, max_retries=1, backoff=FixedBackOff(base_delay=0.3),
+            logger=None
+        )]
+
+    assert asyncio.run(main()) == [1, 2, 3, 4, 0]
+
+
+def test_async_map_failed_item_raises():
+    async def work(item):
+        raise ValueError("Simulating failure")
+
+    async def main():
+        return [result async for result in retry_map(work, range(3), max_retries=1, logger=None)]
+
+    with pytest.raises(MaxRetriesException):
+        asyncio.run(main())
+
+
+def test_map_invalid_arguments():
+    with pytest.raises(TypeError):
+        retry_map("not_a_callable", range(3))
+
+    with pytest.raises(TypeError):
+        retry_map(abs, range(3), concurrency="4")
+
+    with pytest.raises(ValueError):
+        retry_map(abs, range(3), concurrency=0)
+
+    with pytest.raises(TypeError):
+        retry_map(abs, range(3), resume_kwarg="offset")
+
+    with pytest.raises(TypeError):
+        retry_map(abs, range(3), max_retries="3")
+
+    with pytest.raises(TypeError):
+        retry_map(abs, range(3), not_an_argument=True)
+
+    with pytest.raises(ValueError):
+        retry_map(abs, range(3), attempt_timeout=0)
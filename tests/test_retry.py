@@ -1,12 +1,21 @@
 import pytest
-from time import sleep
-from retry_reloaded import retry
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from time import perf_counter, sleep
+from threading import current_thread
+from retry_reloaded import retry, CallbackDispatcher, CallbackFactory, RetryState, callback_factory
 from retry_reloaded._exceptions import (
     MaxRetriesException,
     RetriesTimeoutException,
-    RetriesDeadlineException
+    RetriesDeadlineException,
+    AttemptTimeoutException,
+    RetryBudgetExhaustedException,
+    CircuitOpenException,
+    RetriesStoppedException,
 )
-from retry_reloaded.backoff import FixedBackOff
+from retry_reloaded.backoff import BackOff, FixedBackOff, LinearBackOff, ExponentialBackOff
+from retry_reloaded.budget import RetryBudget
+from retry_reloaded.circuit import CircuitBreaker
 
 
 def test_successful_execution():
@@ -86,6 +95,158 @@ def test_failure_callback_called(failure_callback):
     failure_callback.assert_called_once()
 
 
+def test_failure_carries_retry_context():
+    @retry(max_retries=2)
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException) as exc_info:
+        failure_function()
+
+    assert exc_info.value.fname == "failure_function"
+    assert exc_info.value.attempts == 3
+    assert exc_info.value.elapsed >= 0
+    assert isinstance(exc_info.value.last_exception, ValueError)
+    assert exc_info.value.__cause__ is exc_info.value.last_exception
+
+
+def test_retry_exception_construction_has_no_side_effects(failure_callback):
+    exc = MaxRetriesException(fname="func", max_retries=1)
+
+    assert str(exc) == "Have reached max number of retries (1) for function func, aborting."
+    assert exc.attempts is None
+    failure_callback.assert_not_called()
+
+
+def test_failure_callback_dispatched_to_executor(failure_callback):
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    @retry(max_retries=1, failure_callback=failure_callback, callback_executor=executor)
+    def fail_with_executor_callback():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        fail_with_executor_callback()
+
+    executor.shutdown(wait=True)
+    failure_callback.assert_called_once()
+
+
+def test_callbacks_dispatched_off_the_critical_path():
+    dispatcher = CallbackDispatcher(max_workers=1)
+    callback_threads = []
+
+    def retry_callback():
+        sleep(0.2)
+        callback_threads.append(current_thread())
+
+    @retry(max_retries=2, retry_callback=retry_callback, callback_executor=dispatcher)
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    start = perf_counter()
+    with pytest.raises(MaxRetriesException):
+        failure_function()
+    assert perf_counter() - start < 0.2
+
+    dispatcher.shutdown(wait=True)
+    assert len(callback_threads) == 2
+    assert current_thread() not in callback_threads
+
+
+def test_callbacks_receive_retry_state():
+    observed = []
+
+    def retry_callback(state, label):
+        observed.append((label, state.attempts, type(state.last_exception), state.next_delay, state.remaining))
+
+    def failure_callback(state):
+        observed.append(("failure", state.attempts, type(state.last_exception), state.next_delay, state.remaining))
+
+    @retry(
+        max_retries=2,
+        backoff=FixedBackOff(base_delay=0.01),
+        timeout=10,
+        retry_callback=CallbackFactory(retry_callback, label="retry"),
+        failure_callback=failure_callback,
+        pass_retry_state=True
+    )
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        failure_function()
+
+    assert [entry[:4] for entry in observed] == [
+        ("retry", 1, ValueError, 0.01),
+        ("retry", 2, ValueError, 0.01),
+        ("failure", 3, ValueError, 0.01),
+    ]
+    assert all(0 < entry[4] <= 10 for entry in observed)
+
+
+def test_retry_state_passed_after_stored_positional_arguments():
+    notified = []
+
+    def notify(channel, state):
+        notified.append((channel, state.attempts))
+
+    @retry(
+        max_retries=1,
+        retry_callback=CallbackFactory(notify, "ops"),
+        failure_callback=callback_factory(notify, "alerts"),
+        pass_retry_state=True,
+        logger=None
+    )
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        failure_function()
+
+    assert notified == [("ops", 1), ("alerts", 2)]
+
+
+def test_retry_with_former_interface_backoff():
+    delays = []
+
+    class DoublingBackOff(BackOff):
+        def _calculate_next_delay(self):
+            self._delay = self._base_delay * 2 ** self._round
+            self._round += 1
+
+    @retry(
+        max_retries=2,
+        backoff=DoublingBackOff(base_delay=0.01),
+        retry_callback=lambda state: delays.append(state.next_delay),
+        pass_retry_state=True,
+        logger=None
+    )
+    def fail_twice():
+        if len(delays) < 2:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    assert fail_twice() == "Success"
+    assert delays == [0.01, 0.02]
+
+
+def test_retry_state_allocated_once_per_invocation():
+    states = []
+
+    @retry(max_retries=3, retry_callback=states.append, pass_retry_state=True)
+    def fail_twice():
+        if len(states) < 2:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    assert fail_twice() == "Success"
+    assert len(states) == 2
+    assert states[0] is states[1]
+    assert isinstance(states[0], RetryState)
+    assert not hasattr(states[0], "__dict__")
+
+
 def test_successful_retry_callback_called(successful_retry_callback):
     retries = 0
     max_retries = 2
@@ -177,3 +338,421 @@ def test_retry_on_mixed_exclusions():
         raise_mixed_exceptions()
 
     assert retries == 5
+
+
+def test_backoff_shared_across_invocations_is_not_mutated():
+    backoff = LinearBackOff(base_delay=0, step=0.01)
+
+    @retry(max_retries=2, backoff=backoff)
+    def function_that_fails():
+        raise ValueError("Simulating failure")
+
+    for _ in range(2):
+        with pytest.raises(MaxRetriesException):
+            function_that_fails()
+
+    assert backoff.delay == 0
+
+
+def test_timeout_uses_provided_clock():
+    retries = 0
+    readings = count(0.0, 10.0)
+
+    @retry(timeout=50, clock=lambda: next(readings))
+    def timeout_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(RetriesTimeoutException):
+        timeout_function()
+
+    assert retries == 2
+
+
+def test_timeout_fails_fast_instead_of_oversleeping():
+    retries = 0
+
+    @retry(timeout=1, backoff=FixedBackOff(base_delay=5))
+    def timeout_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    start = perf_counter()
+    with pytest.raises(RetriesTimeoutException, match="would exceed timeout"):
+        timeout_function()
+
+    assert perf_counter() - start < 1
+    assert retries == 1
+
+
+def test_deadline_fails_fast_instead_of_oversleeping():
+    retries = 0
+
+    @retry(deadline=1, backoff=FixedBackOff(base_delay=5), reraise_exception=True)
+    def deadline_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    start = perf_counter()
+    with pytest.raises(ValueError):
+        deadline_function()
+
+    assert perf_counter() - start < 1
+    assert retries == 1
+
+
+def test_interrupt_on_deadline():
+    @retry(deadline=0.2, interrupt_on_deadline=True)
+    def hanging_function():
+        sleep(2)
+
+    start = perf_counter()
+    with pytest.raises(RetriesDeadlineException):
+        hanging_function()
+
+    assert perf_counter() - start < 1
+
+
+def test_interrupt_on_deadline_returns_result_in_time():
+    retries = 0
+
+    @retry(deadline=1, interrupt_on_deadline=True)
+    def successful_function():
+        nonlocal retries
+        retries += 1
+        if retries < 2:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    assert successful_function() == "Success"
+    assert retries == 2
+
+
+@pytest.mark.parametrize("reraise_exception", [False, True])
+def test_interrupt_on_deadline_side_effects_independent_of_reraise(reraise_exception):
+    breaker = CircuitBreaker(failure_threshold=5)
+    stopped = []
+    attempts = 0
+
+    def stop(state):
+        stopped.append(state.attempts)
+        return False
+
+    @retry(
+        deadline=0.3,
+        interrupt_on_deadline=True,
+        circuit_breaker=breaker,
+        stop=stop,
+        reraise_exception=reraise_exception,
+        logger=None
+    )
+    def hanging_retry():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("Simulating failure")
+        sleep(2)
+
+    expected = ValueError if reraise_exception else RetriesDeadlineException
+    with pytest.raises(expected):
+        hanging_retry()
+
+    assert attempts == 2
+    assert stopped == [1]
+    assert breaker._consecutive_failures == 1
+
+
+def test_attempt_timeout_retries_slow_attempts():
+    retries = 0
+
+    @retry(attempt_timeout=0.1, max_retries=3)
+    def slow_first_attempt():
+        nonlocal retries
+        retries += 1
+        if retries < 2:
+            sleep(1)
+        return "Success"
+
+    start = perf_counter()
+    assert slow_first_attempt() == "Success"
+    assert perf_counter() - start < 1
+    assert retries == 2
+
+
+def test_attempt_timeout_reraised_after_max_retries():
+    @retry(exceptions=(ValueError,), attempt_timeout=0.05, max_retries=1, reraise_exception=True)
+    def hanging_function():
+        sleep(1)
+
+    with pytest.raises(AttemptTimeoutException):
+        hanging_function()
+
+
+def test_retry_budget_exhausted():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+    retries = 0
+
+    @retry(budget=budget)
+    def failure_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    @retry(budget=budget)
+    def successful_function():
+        return "Success"
+
+    with pytest.raises(RetryBudgetExhaustedException):
+        failure_function()
+    assert retries == 2
+
+    successful_function()
+    successful_function()
+
+    with pytest.raises(RetryBudgetExhaustedException):
+        failure_function()
+    assert retries == 4
+
+
+def test_retry_budget_not_spent_by_retry_failing_fast():
+    budget = RetryBudget(ratio=0, max_tokens=5)
+
+    @retry(budget=budget, timeout=0.5, backoff=FixedBackOff(base_delay=10), logger=None)
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(RetriesTimeoutException):
+        failure_function()
+    assert budget.tokens == 5
+
+
+def test_circuit_breaker_short_circuits_retries():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    retries = 0
+
+    @retry(max_retries=5, backoff=LinearBackOff(base_delay=0.01, step=5), circuit_breaker=breaker)
+    def failure_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    start = perf_counter()
+    with pytest.raises(CircuitOpenException):
+        failure_function()
+    assert perf_counter() - start < 1
+
+    with pytest.raises(CircuitOpenException):
+        failure_function()
+    assert retries == 2
+
+
+def test_circuit_breaker_ignores_excluded_exceptions():
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    @retry(excluded_exceptions=(ValueError,), circuit_breaker=breaker)
+    def raise_value_error():
+        raise ValueError("Simulating ValueError")
+
+    with pytest.raises(ValueError):
+        raise_value_error()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_on_result():
+    attempts = 0
+
+    @retry(max_retries=3, retry_on_result=lambda result: result is None)
+    def poll():
+        nonlocal attempts
+        attempts += 1
+        return "Ready" if attempts == 3 else None
+
+    assert poll() == "Ready"
+    assert attempts == 3
+
+
+def test_retry_on_result_max_retries_reached(retry_callback, failure_callback):
+    @retry(
+        max_retries=2,
+        retry_on_result=lambda status: status == 503,
+        retry_callback=retry_callback,
+        failure_callback=failure_callback
+    )
+    def unavailable():
+        return 503
+
+    with pytest.raises(MaxRetriesException) as exc_info:
+        unavailable()
+
+    assert exc_info.value.attempts == 3
+    assert exc_info.value.last_exception is None
+    assert retry_callback.call_count == 2
+    failure_callback.assert_called_once()
+
+
+def test_retry_on_result_reraise_returns_last_result():
+    attempts = 0
+
+    @retry(max_retries=2, retry_on_result=lambda status: status >= 500, reraise_exception=True)
+    def unavailable():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("Simulating failure")
+        return 500 + attempts
+
+    assert unavailable() == 503
+
+
+def test_retry_on_result_budget_exhausted():
+    budget = RetryBudget(ratio=0.1, max_tokens=1)
+
+    @retry(retry_on_result=lambda status: status == 429, budget=budget)
+    def throttled():
+        return 429
+
+    with pytest.raises(RetryBudgetExhaustedException):
+        throttled()
+
+
+def test_stop_predicate():
+    attempts = 0
+
+    @retry(
+        backoff=LinearBackOff(base_delay=0, step=0.01),
+        stop=lambda state: state.next_delay > 0.02
+    )
+    def failure_function():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(RetriesStoppedException) as exc_info:
+        failure_function()
+
+    assert attempts == 4
+    assert exc_info.value.attempts == 4
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+
+def test_stop_predicate_on_result():
+    @retry(retry_on_result=lambda result: not result, stop=lambda state: state.attempts == 2)
+    def empty():
+        return []
+
+    with pytest.raises(RetriesStoppedException):
+        empty()
+
+
+class RateLimitedError(Exception):
+    def __init__(self, retry_after):
+        super().__init__("Simulating rate limiting")
+        self.retry_after = retry_after
+
+
+def test_delay_from_exception_overrides_backoff():
+    delays = []
+
+    @retry(
+        max_retries=2,
+        backoff=FixedBackOff(base_delay=0.03),
+        delay_from_exception=lambda exc: getattr(exc, "retry_after", None),
+        retry_callback=lambda state: delays.append(state.next_delay),
+        pass_retry_state=True
+    )
+    def rate_limited():
+        if not delays:
+            raise RateLimitedError(retry_after=0.01)
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        rate_limited()
+
+    assert delays == [0.01, 0.03]
+
+
+def test_delay_from_exception_bounded_by_max():
+    delays = []
+
+    @retry(
+        max_retries=1,
+        backoff=ExponentialBackOff(base_delay=0.01, max=0.05),
+        delay_from_exception=lambda exc: exc.retry_after,
+        retry_callback=lambda state: delays.append(state.next_delay),
+        pass_retry_state=True
+    )
+    def rate_limited():
+        raise RateLimitedError(retry_after=60)
+
+    with pytest.raises(MaxRetriesException):
+        rate_limited()
+
+    assert delays == [0.05]
+
+
+def test_delay_from_exception_subject_to_timeout():
+    @retry(timeout=1, delay_from_exception=lambda exc: exc.retry_after)
+    def rate_limited():
+        raise RateLimitedError(retry_after=30)
+
+    start = perf_counter()
+    with pytest.raises(RetriesTimeoutException):
+        rate_limited()
+    assert perf_counter() - start < 1
+
+
+def test_deterministic_backoff_schedule_computed_once(monkeypatch):
+    backoff = LinearBackOff(base_delay=0.01, step=0.01)
+    delays = []
+
+    @retry(
+        max_retries=2,
+        backoff=backoff,
+        retry_callback=lambda state: delays.append(state.next_delay),
+        pass_retry_state=True
+    )
+    def failure_function():
+        raise ValueError("Simulating failure")
+
+    def iter_delays():
+        raise AssertionError("Delays recomputed")
+
+    monkeypatch.setattr(backoff, "iter_delays", iter_delays)
+    for _ in range(2):
+        with pytest.raises(MaxRetriesException):
+            failure_function()
+
+    assert delays == [0.01, 0.02] * 2
+
+
+def test_unbounded_retries_with_zero_exponential_backoff():
+    attempts = 0
+
+    @retry(backoff=ExponentialBackOff(base_delay=0), logger=None)
+    def fail_many_times():
+        nonlocal attempts
+        attempts += 1
+        if attempts <= 1100:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    assert fail_many_times() == "Success"
+    assert attempts == 1101
+
+
+def test_retry_state_elapsed_includes_first_attempt():
+    elapsed = []
+
+    @retry(max_retries=1, pass_retry_state=True, retry_callback=lambda state: elapsed.append(state.elapsed), logger=None)
+    def slow_failure():
+        sleep(0.1)
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException) as exc_info:
+        slow_failure()
+
+    assert elapsed[0] >= 0.1
+    assert exc_info.value.elapsed >= 0.2
@@ -92,3 +92,121 @@ def test_invalid_reraise_exception():
         @retry(reraise_exception="not_a_boolean")
         def invalid_reraise_exception_function():
             pass
+
+
+def test_invalid_clock():
+    with pytest.raises(TypeError):
+        @retry(clock="not_a_callable")
+        def invalid_clock_function():
+            pass
+
+
+def test_invalid_interrupt_on_deadline():
+    with pytest.raises(TypeError):
+        @retry(interrupt_on_deadline="not_a_boolean")
+        def invalid_interrupt_on_deadline_function():
+            pass
+
+
+def test_invalid_attempt_timeout():
+    with pytest.raises(TypeError):
+        @retry(attempt_timeout="not_a_float")
+        def invalid_attempt_timeout_function():
+            pass
+
+    with pytest.raises(ValueError):
+        @retry(attempt_timeout=0)
+        def zero_attempt_timeout_function():
+            pass
+
+    with pytest.raises(ValueError):
+        @retry(attempt_timeout=-1.5)
+        def negative_attempt_timeout_function():
+            pass
+
+
+def test_invalid_budget():
+    with pytest.raises(TypeError):
+        @retry(budget="not_a_budget_instance")
+        def invalid_budget_function():
+            pass
+
+
+def test_invalid_circuit_breaker():
+    with pytest.raises(TypeError):
+        @retry(circuit_breaker="not_a_circuit_breaker_instance")
+        def invalid_circuit_breaker_function():
+            pass
+
+
+def test_invalid_structured_logging():
+    with pytest.raises(TypeError):
+        @retry(structured_logging="not_a_boolean")
+        def invalid_structured_logging_function():
+            pass
+
+
+def test_invalid_callback_executor():
+    with pytest.raises(TypeError):
+        @retry(callback_executor="not_an_executor_instance")
+        def invalid_callback_executor_function():
+            pass
+
+
+def test_invalid_pass_retry_state():
+    with pytest.raises(TypeError):
+        @retry(pass_retry_state="not_a_boolean")
+        def invalid_pass_retry_state_function():
+            pass
+
+
+def test_invalid_retry_on_result():
+    with pytest.raises(TypeError):
+        @retry(retry_on_result="not_a_callable")
+        def invalid_retry_on_result_function():
+            pass
+
+
+def test_invalid_stop():
+    with pytest.raises(TypeError):
+        @retry(stop="not_a_callable")
+        def invalid_stop_function():
+            pass
+
+
+def test_invalid_delay_from_exception():
+    with pytest.raises(TypeError):
+        @retry(delay_from_exception="not_a_callable")
+        def invalid_delay_from_exception_function():
+            pass
+
+
+def test_invalid_resume_kwarg():
+    with pytest.raises(TypeError):
+        @retry(resume_kwarg=1)
+        def invalid_resume_kwarg_function():
+            yield
+
+    with pytest.raises(TypeError):
+        @retry(resume_kwarg="offset")
+        def not_a_generator_function(offset=0):
+            pass
+
+
+def test_invalid_resume_token():
+    with pytest.raises(TypeError):
+        @retry(resume_kwarg="offset", resume_token="not_a_callable")
+        def invalid_resume_token_function(offset=0):
+            yield
+
+    with pytest.raises(TypeError):
+        @retry(resume_token=lambda item: item)
+        def resume_token_without_kwarg_function():
+            yield
+
+
+def test_generator_with_attempt_timeout():
+    with pytest.raises(TypeError):
+        @retry(attempt_timeout=1)
+        def attempt_timeout_generator_function():
+            yield
@@ -0,0 +1,271 @@
+import asyncio
+from time import perf_counter
+import pytest
+from retry_reloaded import retry, callback_factory
+from retry_reloaded._exceptions import (
+    MaxRetriesException,
+    RetriesTimeoutException,
+    RetriesDeadlineException
+)
+from retry_reloaded.backoff import FixedBackOff
+
+
+def test_async_successful_execution():
+    retries = 0
+
+    @retry(max_retries=3)
+    async def successful_function():
+        nonlocal retries
+        retries += 1
+        if retries < 3:
+            raise ValueError("Simulating failure")
+        return "Success"
+
+    result = asyncio.run(successful_function())
+    assert result == "Success"
+    assert retries == 3
+
+
+def test_async_maximum_retries_reached():
+    retries = 0
+
+    @retry(max_retries=2)
+    async def failure_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        asyncio.run(failure_function())
+
+    assert retries == 3
+
+
+def test_async_timeout():
+    retries = 0
+
+    @retry(timeout=0.2, backoff=FixedBackOff(base_delay=0.1))
+    async def timeout_function():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(RetriesTimeoutException):
+        asyncio.run(timeout_function())
+
+    assert retries == 2
+
+
+def test_async_deadline():
+    retries = 0
+
+    @retry(deadline=0.2, backoff=FixedBackOff(base_delay=0.1))
+    async def deadline_function():
+        nonlocal retries
+        retries += 1
+        if retries < 2:
+            raise ValueError("Simulating failure")
+        await asyncio.sleep(0.2)
+
+    with pytest.raises(RetriesDeadlineException):
+        asyncio.run(deadline_function())
+
+    assert retries == 2
+
+
+def test_async_backoff_does_not_block_event_loop():
+    ticks = 0
+
+    @retry(max_retries=1, backoff=FixedBackOff(base_delay=0.2))
+    async def failure_function():
+        raise ValueError("Simulating failure")
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def main():
+        await asyncio.gather(
+            asyncio.ensure_future(ticker()),
+            failure_function(),
+            return_exceptions=True,
+        )
+
+    asyncio.run(main())
+    assert ticks == 5
+
+
+def test_async_callbacks_called(retry_callback, successful_retry_callback):
+    retries = 0
+
+    @retry(
+        max_retries=3,
+        retry_callback=retry_callback,
+        successful_retry_callback=successful_retry_callback
+    )
+    async def successful_retry_with_callback():
+        nonlocal retries
+        retries += 1
+        if retries < 3:
+            raise ValueError("Simulating failure")
+
+    asyncio.run(successful_retry_with_callback())
+
+    assert retry_callback.call_count == 2
+    successful_retry_callback.assert_called_once()
+
+
+def test_async_failure_callback_called(failure_callback):
+    @retry(max_retries=1, failure_callback=failure_callback)
+    async def fail_with_callback():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException):
+        asyncio.run(fail_with_callback())
+
+    failure_callback.assert_called_once()
+
+
+def test_async_no_retry_on_excluded_exception():
+    retries = 0
+
+    @retry(excluded_exceptions=(ValueError,), max_retries=2)
+    async def raise_value_error():
+        nonlocal retries
+        retries += 1
+        raise ValueError("Simulating ValueError")
+
+    with pytest.raises(ValueError):
+        asyncio.run(raise_value_error())
+
+    assert retries == 1
+
+
+def test_async_reraise_exception_true():
+    @retry(max_retries=2, reraise_exception=True)
+    async def function_that_fails():
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(ValueError, match="Simulating failure"):
+        asyncio.run(function_that_fails())
+
+
+def test_async_interrupt_on_deadline():
+    cancelled = False
+
+    @retry(deadline=0.2, interrupt_on_deadline=True)
+    async def hanging_function():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(2)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def main():
+        with pytest.raises(RetriesDeadlineException):
+            await hanging_function()
+        await asyncio.sleep(0)
+
+    start = perf_counter()
+    asyncio.run(main())
+
+    assert perf_counter() - start < 1
+    assert cancelled
+
+
+def test_async_attempt_timeout_retries_slow_attempts():
+    retries = 0
+
+    @retry(attempt_timeout=0.1, max_retries=3)
+    async def slow_first_attempt():
+        nonlocal retries
+        retries += 1
+        if retries < 2:
+            await asyncio.sleep(1)
+        return "Success"
+
+    start = perf_counter()
+    assert asyncio.run(slow_first_attempt()) == "Success"
+    assert perf_counter() - start < 1
+    assert retries == 2
+
+
+def test_async_coroutine_callbacks_scheduled():
+    called = []
+
+    async def retry_callback():
+        called.append("retry")
+
+    async def failure_callback(value):
+        called.append(value)
+
+    @retry(
+        max_retries=1,
+        retry_callback=retry_callback,
+        failure_callback=callback_factory(failure_callback, value="failure")
+    )
+    async def failure_function():
+        raise ValueError("Simulating failure")
+
+    async def main():
+        with pytest.raises(MaxRetriesException):
+            await failure_function()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert called == ["retry", "failure"]
+
+
+def test_coroutine_callback_rejected_for_function():
+    async def retry_callback():
+        pass
+
+    with pytest.raises(TypeError):
+        @retry(retry_callback=retry_callback)
+        def function():
+            pass
+
+
+def test_async_retry_on_result():
+    attempts = 0
+
+    @retry(max_retries=3, retry_on_result=lambda result: result is None)
+    async def poll():
+        nonlocal attempts
+        attempts += 1
+        return "Ready" if attempts == 3 else None
+
+    assert asyncio.run(poll()) == "Ready"
+    assert attempts == 3
+
+
+def test_async_retry_on_result_reraise_returns_last_result():
+    @retry(max_retries=1, retry_on_result=lambda status: status == 503, reraise_exception=True)
+    async def unavailable():
+        return 503
+
+    assert asyncio.run(unavailable()) == 503
+
+
+def test_async_cancellation_not_retried():
+    attempts = 0
+
+    @retry(max_retries=3)
+    async def slow_function():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(10)
+        return "done"
+
+    async def main():
+        task = asyncio.ensure_future(slow_function())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+    assert attempts == 1
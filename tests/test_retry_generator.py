@@ -0,0 +1,203 @@
+import asyncio
+import pytest
+from retry_reloaded import retry
+from retry_reloaded._exceptions import MaxRetriesException
+
+
+def test_generator_restarted_without_duplicates():
+    calls = 0
+
+    @retry(max_retries=2)
+    def export():
+        nonlocal calls
+        calls += 1
+        for row in range(6):
+            if calls == 1 and row == 3:
+                raise ValueError("Simulating failure")
+            yield row
+
+    assert list(export()) == [0, 1, 2, 3, 4, 5]
+    assert calls == 2
+
+
+def test_generator_resumed_from_offset():
+    offsets = []
+
+    @retry(max_retries=3, resume_kwarg="offset")
+    def export(offset=0):
+        offsets.append(offset)
+        for row in range(offset, 8):
+            if len(offsets) < 3 and row == offset + 3:
+                raise ValueError("Simulating failure")
+            yield row
+
+    assert list(export()) == list(range(8))
+    assert offsets == [0, 3, 6]
+
+
+def test_generator_resumed_from_caller_offset():
+    offsets = []
+
+    @retry(max_retries=2, resume_kwarg="offset")
+    def export(offset=0):
+        offsets.append(offset)
+        for row in range(offset, 8):
+            if len(offsets) == 1 and row == offset + 2:
+                raise ValueError("Simulating failure")
+            yield row
+
+    assert list(export(offset=3)) == [3, 4, 5, 6, 7]
+    assert offsets == [3, 5]
+
+    offsets.clear()
+    assert list(export(3)) == [3, 4, 5, 6, 7]
+    assert offsets == [3, 5]
+
+
+def test_generator_resumed_from_token():
+    cursors = []
+
+    @retry(max_retries=2, resume_kwarg="after", resume_token=lambda row: row["id"])
+    def export(after=None):
+        cursors.append(after)
+        start = 0 if after is None else after + 1
+        for row_id in range(start, 5):
+            if len(cursors) == 1 and row_id == 2:
+                raise ValueError("Simulating failure")
+            yield {"id": row_id}
+
+    assert [row["id"] for row in export()] == [0, 1, 2, 3, 4]
+    assert cursors == [None, 1]
+
+
+def test_generator_failing_before_first_item_is_not_resumed():
+    kwargs = []
+
+    @retry(max_retries=2, resume_kwarg="offset")
+    def export(**options):
+        kwargs.append(options)
+        if len(kwargs) == 1:
+            raise ValueError("Simulating failure")
+        yield "row"
+
+    assert list(export()) == ["row"]
+    assert kwargs == [{}, {}]
+
+
+def test_generator_maximum_retries_reached(failure_callback):
+    rows = []
+
+    @retry(max_retries=2, failure_callback=failure_callback)
+    def export():
+        yield "first"
+        raise ValueError("Simulating failure")
+
+    with pytest.raises(MaxRetriesException) as exc_info:
+        for row in export():
+            rows.append(row)
+
+    assert rows == ["first"]
+    assert exc_info.value.attempts == 3
+    failure_callback.assert_called_once()
+
+
+def test_generator_excluded_exception_raised_immediately():
+    calls = 0
+
+    @retry(excluded_exceptions=(KeyError,), max_retries=2)
+    def export():
+        nonlocal calls
+        calls += 1
+        yield "first"
+        raise KeyError("Simulating failure")
+
+    with pytest.raises(KeyError):
+        list(export())
+
+    assert calls == 1
+
+
+def test_generator_callbacks(retry_callback, successful_retry_callback):
+    calls = 0
+
+    @retry(max_retries=2, retry_callback=retry_callback, successful_retry_callback=successful_retry_callback)
+    def export():
+        nonlocal calls
+        calls += 1
+        yield "first"
+        if calls == 1:
+            raise ValueError("Simulating failure")
+        yield "second"
+
+    assert list(export()) == ["first", "second"]
+    retry_callback.assert_called_once()
+    successful_retry_callback.assert_called_once()
+
+
+def test_generator_closed_with_stream():
+    closed = False
+
+    @retry(max_retries=2)
+    def export():
+        nonlocal closed
+        try:
+            yield "first"
+            yield "second"
+        finally:
+            closed = True
+
+    stream = export()
+    assert next(stream) == "first"
+    stream.close()
+    assert closed
+
+
+def test_async_generator_resumed_from_offset():
+    offsets = []
+
+    @retry(max_retries=2, resume_kwarg="offset")
+    async def export(offset=0):
+        offsets.append(offset)
+        for row in range(offset, 6):
+            if len(offsets) == 1 and row == 4:
+                raise ValueError("Simulating failure")
+            await asyncio.sleep(0)
+            yield row
+
+    async def main():
+        return [row async for row in export()]
+
+    assert asyncio.run(main()) == list(range(6))
+    assert offsets == [0, 4]
+
+
+def test_async_generator_restarted_without_duplicates():
+    calls = 0
+
+    @retry(max_retries=2)
+    async def export():
+        nonlocal calls
+        calls += 1
+        for row in range(4):
+            if calls == 1 and row == 2:
+                raise ValueError("Simulating failure")
+            yield row
+
+    async def main():
+        return [row async for row in export()]
+
+    assert asyncio.run(main()) == [0, 1, 2, 3]
+    assert calls == 2
+
+
+def test_async_generator_maximum_retries_reached():
+    @retry(max_retries=1)
+    async def export():
+        yield "first"
+        raise ValueError("Simulating failure")
+
+    async def main():
+        return [row async for row in export()]
+
+    with pytest.raises(MaxRetriesException):
+        asyncio.run(main())